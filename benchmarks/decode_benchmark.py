@@ -0,0 +1,59 @@
+"""Compare /main payload decode paths on Eveus fixture payloads.
+
+Run from the repository root:
+
+    python benchmarks/decode_benchmark.py
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import timeit
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.eveus.utils import (  # noqa: E402
+    ORJSON_DECODER,
+    STDLIB_DECODER,
+)
+
+FIXTURES = ROOT / "tests" / "fixtures"
+ITERATIONS = 20_000
+# Best of several runs, so one noisy run does not skew the ratio
+REPEATS = 5
+
+
+def _bytes_to_json(body: bytes) -> object:
+    """Hand the raw bytes to json.loads, which detects the encoding itself."""
+    return json.loads(body)
+
+
+def main() -> None:
+    """Time every decode path against every /main fixture."""
+    paths = {
+        "stdlib (str first)": STDLIB_DECODER.loads,
+        "bytes -> json": _bytes_to_json,
+    }
+    if ORJSON_DECODER is not None:
+        paths["bytes -> orjson"] = ORJSON_DECODER.loads
+
+    for fixture in sorted(FIXTURES.glob("main_*.json")):
+        body = fixture.read_bytes()
+        print(
+            f"{fixture.name} ({len(body)} bytes, "
+            f"best of {REPEATS} x {ITERATIONS} iterations)"
+        )
+        baseline = None
+        for name, loads in paths.items():
+            seconds = min(
+                timeit.repeat(lambda: loads(body), number=ITERATIONS, repeat=REPEATS)
+            )
+            per_call = seconds / ITERATIONS * 1_000_000
+            baseline = baseline or per_call
+            print(f"  {name:<20} {per_call:8.2f} us/poll  {baseline / per_call:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare per-entity payload conversion with a reading parsed once per poll.
+
+Simulates one poll cycle of a fleet: every payload field an entity reads is
+either converted from the raw dict by each entity (previous path), or read
+from a ChargerReading parsed once per charger.
+
+Run from the repository root:
+
+    python benchmarks/reading_benchmark.py
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import timeit
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.eveus.reading import PAYLOAD_FIELDS, ChargerReading  # noqa: E402
+from custom_components.eveus.sensor_definitions import (  # noqa: E402
+    get_sensor_specifications,
+)
+from custom_components.eveus.utils import get_safe_value  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures"
+FLEET_SIZES = (1, 50, 200)
+ITERATIONS = 200
+# Best of several runs, so one noisy run does not skew the ratio
+REPEATS = 5
+
+# Payload keys read per entity: sensor specs plus the switches and number.
+ENTITY_KEYS = [spec.data_keys for spec in get_sensor_specifications() if spec.data_keys]
+ENTITY_KEYS += [("evseEnabled",), ("oneCharge",), ("IEM1",), ("currentSet",)]
+
+
+def _per_entity_cycle(payloads: list[dict]) -> None:
+    """Previous path: every entity converts its fields from the raw dict."""
+    for data in payloads:
+        for keys in ENTITY_KEYS:
+            for key in keys:
+                if key in data:
+                    converter, precision = PAYLOAD_FIELDS[key]
+                    value = get_safe_value(data, key, converter)
+                    if value is not None and precision is not None:
+                        round(value, precision)
+
+
+def _reading_cycle(payloads: list[dict]) -> None:
+    """New path: parse each payload once, entities read attributes."""
+    for data in payloads:
+        reading = ChargerReading(data)
+        for keys in ENTITY_KEYS:
+            for key in keys:
+                getattr(reading, key)
+
+
+def main() -> None:
+    """Time one poll cycle per fleet size against every /main fixture."""
+    reads = sum(len(keys) for keys in ENTITY_KEYS)
+    print(
+        f"{len(ENTITY_KEYS)} entities, {reads} field reads per charger, "
+        f"best of {REPEATS} x {ITERATIONS} cycles"
+    )
+    for fixture in sorted(FIXTURES.glob("main_*.json")):
+        payload = json.loads(fixture.read_text())
+        print(fixture.name)
+        for size in FLEET_SIZES:
+            payloads = [dict(payload) for _ in range(size)]
+            before = min(
+                timeit.repeat(
+                    lambda: _per_entity_cycle(payloads),
+                    number=ITERATIONS,
+                    repeat=REPEATS,
+                )
+            )
+            after = min(
+                timeit.repeat(
+                    lambda: _reading_cycle(payloads), number=ITERATIONS, repeat=REPEATS
+                )
+            )
+            before_us = before / ITERATIONS * 1_000_000
+            after_us = after / ITERATIONS * 1_000_000
+            print(
+                f"  {size:>4} chargers  per-entity {before_us:9.1f} us/cycle"
+                f"  reading {after_us:9.1f} us/cycle  {before_us / after_us:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
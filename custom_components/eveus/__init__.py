@@ -2,17 +2,39 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_HOST, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, MODEL_MAX_CURRENT, CONF_MODEL
+from .const import (
+    DOMAIN,
+    MODEL_MAX_CURRENT,
+    CONF_MODEL,
+    CONF_FLEET_HUB,
+    CONF_COMMAND_JOURNAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+)
 from .common import EveusUpdater
+from .common_network import async_pop_validated_payload
+from .common_fleet import (
+    StartupAdmission,
+    async_get_fleet_hub,
+    async_get_startup_admission,
+    startup_priority,
+)
+from .journal import CommandJournal, async_remove_journal
+from .polling import AdaptivePollController
+from .storage import async_remove_entry_state
 from .utils import get_next_device_number
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +45,9 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
 ]
 
+# Entry data keys that need a reload when changed; options are applied in place.
+RELOAD_KEYS = (CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_MODEL)
+
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 
 
@@ -33,6 +58,9 @@ class EveusRuntimeData:
     updater: EveusUpdater
     device_number: int
     title: str
+    # Entry data the running updater was built from; changes need a reload.
+    connection: dict[str, Any]
+    leave_fleet_hub: CALLBACK_TYPE | None = None
 
 
 EveusConfigEntry = ConfigEntry[EveusRuntimeData]
@@ -92,18 +120,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: EveusConfigEntry) -> boo
             password=password,
             hass=hass,
             config_entry=entry,
+            interval_controller=AdaptivePollController(),
         )
         entry.runtime_data = EveusRuntimeData(
             updater=updater,
             device_number=device_number,
             title=entry.title,
+            connection=_connection_settings(entry),
         )
 
-        await updater.async_config_entry_first_refresh()
-
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await updater.async_load_state()
+        await _async_apply_options(hass, entry)
+        entry.async_on_unload(partial(_async_leave_fleet_hub, entry))
+        if (seed := async_pop_validated_payload(hass, host)) is not None:
+            fetched_at, payload = seed
+            updater.seed_data(payload, fetched_at)
+
+        # A payload just validated by the config flow replaces the first
+        # refresh. With a saved snapshot, entities start from it right away
+        # and the first poll runs in the background instead of blocking setup.
+        admission = async_get_startup_admission(hass)
+        priority = startup_priority(updater.data)
+        # A snapshot-started entry stays part of the startup burst until its
+        # background first refresh has run.
+        entry.async_on_unload(partial(admission.finish, entry.entry_id))
+        async with admission.slot(
+            entry.entry_id, priority, finished=updater.snapshot_age is None
+        ):
+            if updater.data is None:
+                await updater.async_config_entry_first_refresh()
+            await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         entry.async_on_unload(entry.add_update_listener(update_listener))
 
+        # The fleet hub takes over scheduling only after the first poll, so
+        # its first phase slot is placed relative to that poll.
+        if updater.snapshot_age is not None:
+            entry.async_create_background_task(
+                hass,
+                _async_first_refresh(hass, entry, admission, priority),
+                f"Eveus first refresh {host}",
+            )
+        else:
+            _async_apply_fleet_hub(hass, entry)
+
         return True
 
     except ConfigEntryAuthFailed:
@@ -118,9 +177,75 @@ async def async_setup_entry(hass: HomeAssistant, entry: EveusConfigEntry) -> boo
         raise ConfigEntryNotReady(f"Unexpected error: {ex}")
 
 
+async def _async_first_refresh(
+    hass: HomeAssistant,
+    entry: EveusConfigEntry,
+    admission: StartupAdmission,
+    priority: int,
+) -> None:
+    """Run the first poll of a snapshot-started charger within admission."""
+    async with admission.slot(entry.entry_id, priority):
+        await entry.runtime_data.updater.async_refresh()
+    _async_apply_fleet_hub(hass, entry)
+
+
+def _connection_settings(entry: EveusConfigEntry) -> dict[str, Any]:
+    """Return the entry data that can only be applied by a reload."""
+    return {key: entry.data.get(key) for key in RELOAD_KEYS}
+
+
+async def _async_apply_options(hass: HomeAssistant, entry: EveusConfigEntry) -> None:
+    """Apply the poll bounds and command journal options to the running updater."""
+    updater = entry.runtime_data.updater
+    options = entry.options
+
+    updater.async_set_poll_bounds(
+        options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+        options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+    )
+
+    if options.get(CONF_COMMAND_JOURNAL, False):
+        if updater.command_journal is None:
+            journal = CommandJournal(hass, entry.entry_id)
+            await journal.async_load()
+            updater.command_journal = journal
+    elif updater.command_journal is not None:
+        # Pending entries must not replay if the journal is enabled again
+        await updater.command_journal.async_clear()
+        updater.command_journal = None
+
+
+@callback
+def _async_apply_fleet_hub(hass: HomeAssistant, entry: EveusConfigEntry) -> None:
+    """Join or leave the fleet hub as the entry options ask."""
+    runtime_data = entry.runtime_data
+    if entry.options.get(CONF_FLEET_HUB, False):
+        if runtime_data.leave_fleet_hub is None:
+            runtime_data.leave_fleet_hub = async_get_fleet_hub(hass).async_add(
+                runtime_data.updater
+            )
+    else:
+        _async_leave_fleet_hub(entry)
+
+
+@callback
+def _async_leave_fleet_hub(entry: EveusConfigEntry) -> None:
+    """Hand poll scheduling back to the updater if the hub owns it."""
+    runtime_data = entry.runtime_data
+    if runtime_data.leave_fleet_hub is not None:
+        runtime_data.leave_fleet_hub()
+        runtime_data.leave_fleet_hub = None
+
+
 async def update_listener(hass: HomeAssistant, entry: EveusConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply option changes in place; reload only for connection changes."""
+    if _connection_settings(entry) != entry.runtime_data.connection:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await _async_apply_options(hass, entry)
+    _async_apply_fleet_hub(hass, entry)
+    _LOGGER.debug("Applied new options to %s without reloading", entry.title)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: EveusConfigEntry) -> bool:
@@ -134,3 +259,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: EveusConfigEntry) -> bo
             ex, exc_info=True,
         )
         return False
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored state and command journal of a removed charger."""
+    await async_remove_entry_state(hass, entry.entry_id)
+    await async_remove_journal(hass, entry.entry_id)
@@ -1,7 +1,12 @@
 """Common functionality for Eveus integration."""
 from homeassistant.exceptions import HomeAssistantError
 
-from .common_base import BaseEveusEntity, EveusSensorBase, EveusDiagnosticSensor
+from .common_base import (
+    BaseEveusEntity,
+    EveusSensorBase,
+    EveusDiagnosticSensor,
+    PayloadEntityAdder,
+)
 from .common_network import EveusUpdater
 from .common_command import send_eveus_command, CommandManager
 
@@ -18,6 +23,7 @@ __all__ = [
     "BaseEveusEntity",
     "EveusSensorBase",
     "EveusDiagnosticSensor",
+    "PayloadEntityAdder",
     "EveusUpdater",
     "CommandManager",
     "EveusError",
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import State, callback
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.helpers.entity import Entity, EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,12 +25,14 @@ class BaseEveusEntity(CoordinatorEntity["EveusUpdater"], RestoreEntity):
     """Base implementation for Eveus entities with state persistence."""
 
     ENTITY_NAME: str | None = None
+    # Payload keys the entity renders; None means it updates on every refresh.
+    DATA_KEYS: frozenset[str] | None = None
     _attr_has_entity_name = True
     _attr_should_poll = False
 
     def __init__(self, updater: "EveusUpdater", device_number: int = 1) -> None:
         """Initialize the entity."""
-        super().__init__(updater)
+        super().__init__(updater, self.DATA_KEYS)
         self._updater = updater
         self._device_number = device_number
 
@@ -80,6 +83,13 @@ class BaseEveusEntity(CoordinatorEntity["EveusUpdater"], RestoreEntity):
         self._cached_data_time = 0
         return False
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values shown from the startup snapshot."""
+        if self._updater.snapshot_age is not None:
+            return {"stale": True}
+        return None
+
     def _should_log_availability(self) -> bool:
         """Rate limit availability logging."""
         current_time = time.time()
@@ -187,3 +197,64 @@ class EveusDiagnosticSensor(EveusSensorBase):
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:information"
+
+
+class PayloadEntityAdder:
+    """Add entities only once the charger reports every field they read.
+
+    Candidates are (fields, factory) pairs. Those whose fields are in the
+    current payload are created at once; the rest wait on a keyed updater
+    listener and are created when their fields first appear. Candidates
+    without fields are always created.
+    """
+
+    def __init__(
+        self,
+        updater: "EveusUpdater",
+        async_add_entities: AddEntitiesCallback,
+        candidates: Iterable[tuple[frozenset[str], Callable[[], Entity]]],
+    ) -> None:
+        """Initialize the adder."""
+        self._updater = updater
+        self._async_add_entities = async_add_entities
+        self._pending = list(candidates)
+        self._remove_listener: CALLBACK_TYPE | None = None
+        self.added = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of entities still waiting for their fields."""
+        return len(self._pending)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Add the entities the payload supports and watch for the rest."""
+        self._async_materialize()
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop waiting for missing fields."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+    @callback
+    def _async_materialize(self) -> None:
+        """Create every pending entity whose fields are now reported."""
+        present = (self._updater.data or {}).keys()
+        ready = [factory for fields, factory in self._pending if present >= fields]
+        if ready:
+            self._pending = [
+                (fields, factory) for fields, factory in self._pending
+                if not present >= fields
+            ]
+            self.added += len(ready)
+            self._async_add_entities([factory() for factory in ready])
+
+        self.async_stop()
+        if self._pending:
+            missing = frozenset().union(*(fields for fields, _ in self._pending))
+            self._remove_listener = self._updater.async_add_listener(
+                self._async_materialize, missing - present
+            )
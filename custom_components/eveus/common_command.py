@@ -1,26 +1,88 @@
 """Command handling for Eveus integration."""
 import logging
 import asyncio
+from dataclasses import dataclass
 import time
 from typing import Any
 
 import aiohttp
 
-from .const import COMMAND_TIMEOUT, ERROR_LOG_RATE_LIMIT
+from .const import (
+    COMMAND_TIMEOUT,
+    ERROR_LOG_RATE_LIMIT,
+    IO_PRIORITY_COMMAND,
+    IO_PRIORITY_SAFETY,
+    SAFETY_COMMANDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+COMMAND_CONFIRMED = "confirmed"
+COMMAND_REJECTED = "rejected"
+COMMAND_TIMED_OUT = "timed_out"
+COMMAND_FAILED = "failed"
+COMMAND_JOURNALED = "journaled"
+# Internal: a later write to the same key took over confirmation
+COMMAND_SUPERSEDED = "superseded"
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    """Latest value queued for a command key and the futures its callers await."""
+
+    value: Any
+    future: asyncio.Future
+    confirmation: asyncio.Future | None = None
+
+    @property
+    def unconfirmed(self) -> bool:
+        """Return True until the write has failed or its confirmation ended."""
+        if not self.future.done():
+            return True
+        return bool(self.future.result()) and (
+            self.confirmation is None or not self.confirmation.done()
+        )
+
 
 class CommandManager:
-    """Manage command execution with rate limiting and error handling."""
+    """Manage command execution with rate limiting and error handling.
+
+    Commands wait in a per-charger queue keyed by command name. A write that
+    arrives while an earlier write to the same key is still queued replaces
+    its value, so a burst of slider changes sends only the final one and
+    every caller in the burst receives that request's result.
+    """
 
     def __init__(self, updater) -> None:
         """Initialize command manager."""
         self._updater = updater
         self._lock = asyncio.Lock()
-        self._last_command_time = 0
+        self._pending: dict[str, _QueuedCommand] = {}
+        self._in_flight: dict[str, _QueuedCommand] = {}
+        self._latest: dict[str, _QueuedCommand] = {}
         self._consecutive_failures = 0
         self._last_error_log = 0
+        self._sent_count = 0
+        self._merged_count = 0
+        self._skipped_count = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Commands sent, merged, skipped as already satisfied, and queued."""
+        return {
+            "sent": self._sent_count,
+            "merged": self._merged_count,
+            "skipped": self._skipped_count,
+            "pending": len(self._pending),
+        }
+
+    def latest(self, command: str) -> _QueuedCommand | None:
+        """Return the most recently submitted write for a command key."""
+        return self._latest.get(command)
+
+    def record_skipped(self) -> None:
+        """Count a command that was not sent because nothing would change."""
+        self._skipped_count += 1
 
     def _should_log_error(self) -> bool:
         """Rate limit error logging."""
@@ -31,43 +93,111 @@ class CommandManager:
         return False
 
     async def send_command(self, command: str, value: Any) -> bool:
-        """Send command with rate limiting and error handling."""
+        """Queue a command and return whether the charger accepted it."""
+        queued = await self.submit(command, value)
+        return queued.future.result()
+
+    async def submit(self, command: str, value: Any) -> _QueuedCommand:
+        """Queue a command, merging it with a queued write to the same key.
+
+        Returns once the command has been sent; the entry holds the value that
+        was actually sent, which differs from value if a later write merged.
+        """
+        queued = self._pending.get(command)
+        if queued is None:
+            queued = self._pending[command] = _QueuedCommand(
+                value, asyncio.get_running_loop().create_future()
+            )
+        else:
+            queued.value = value
+            self._merged_count += 1
+        self._latest[command] = queued
+
         async with self._lock:
-            # Rate limit: minimum 1 second between commands
-            time_since_last = time.time() - self._last_command_time
-            if time_since_last < 1:
-                await asyncio.sleep(1 - time_since_last)
+            while not queued.future.done():
+                await self._send_next()
+        return queued
 
+    async def _send_next(self) -> None:
+        """Send the most urgent queued command when the charger is free.
+
+        Safety commands go ahead of other queued commands; spacing between
+        requests is enforced by the charger's I/O scheduler, so later writes
+        keep merging into queued ones while the charger is busy.
+        """
+        urgent = min(self._pending, key=_io_priority)
+        async with self._updater.io_scheduler.slot(_io_priority(urgent)):
+            command = min(self._pending, key=_io_priority)
+            queued = self._in_flight[command] = self._pending.pop(command)
+            result = False
+            try:
+                result = await self._post(command, queued.value)
+            finally:
+                del self._in_flight[command]
+                queued.future.set_result(result)
+
+    async def _post(self, command: str, value: Any) -> bool:
+        """Post one command to the charger.
+
+        A post on a reused socket the charger already closed is retried once
+        on a new connection.
+        """
+        self._sent_count += 1
+        command_timeout = self._updater.command_timeout
+        pool = self._updater.connection_pool
+        start_time = time.monotonic()
+        try:
             try:
-                session = self._updater.get_session()
-                timeout = aiohttp.ClientTimeout(total=COMMAND_TIMEOUT)
-
-                async with session.post(
-                    f"http://{self._updater.host}/pageEvent",
-                    auth=aiohttp.BasicAuth(
-                        self._updater.username,
-                        self._updater.password,
-                    ),
-                    headers={"Content-type": "application/x-www-form-urlencoded"},
-                    data=f"pageevent={command}&{command}={value}",
-                    timeout=timeout,
-                ) as response:
-                    response.raise_for_status()
-                    self._last_command_time = time.time()
-                    self._consecutive_failures = 0
-                    return True
-
-            except (aiohttp.ClientResponseError, aiohttp.ClientConnectorError,
-                    asyncio.TimeoutError) as err:
-                self._consecutive_failures += 1
-                if self._consecutive_failures <= 5 and self._should_log_error():
-                    _LOGGER.debug("Command %s failed: %s", command, err)
-                return False
-            except Exception as err:
-                self._consecutive_failures += 1
-                if self._should_log_error():
-                    _LOGGER.debug("Command %s unexpected error: %s", command, err)
-                return False
+                await self._post_once(command, value, command_timeout.timeout)
+            except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as err:
+                if not pool.retry_on_fresh_connection(err):
+                    raise
+                await self._post_once(command, value, command_timeout.timeout)
+            command_timeout.record_success(time.monotonic() - start_time)
+            self._consecutive_failures = 0
+            pool.record_success()
+            return True
+
+        except (aiohttp.ClientResponseError, aiohttp.ClientConnectorError,
+                aiohttp.ServerDisconnectedError, aiohttp.ClientOSError,
+                asyncio.TimeoutError) as err:
+            self._consecutive_failures += 1
+            if isinstance(err, asyncio.TimeoutError):
+                command_timeout.record_timeout()
+            else:
+                command_timeout.record_failure()
+            pool.record_error(err)
+            if self._consecutive_failures <= 5 and self._should_log_error():
+                _LOGGER.debug("Command %s failed: %s", command, err)
+            return False
+        except Exception as err:
+            self._consecutive_failures += 1
+            command_timeout.record_failure()
+            if self._should_log_error():
+                _LOGGER.debug("Command %s unexpected error: %s", command, err)
+            return False
+
+    async def _post_once(self, command: str, value: Any, timeout: float) -> None:
+        """Send one POST of a command and raise if the charger refuses it."""
+        async with self._updater.get_session().post(
+            f"http://{self._updater.host}/pageEvent",
+            auth=aiohttp.BasicAuth(
+                self._updater.username,
+                self._updater.password,
+            ),
+            headers={
+                "Content-type": "application/x-www-form-urlencoded",
+                **self._updater.connection_pool.headers,
+            },
+            data=f"pageevent={command}&{command}={value}",
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+
+
+def _io_priority(command: str) -> int:
+    """Return the I/O scheduler priority class of a command."""
+    return IO_PRIORITY_SAFETY if command in SAFETY_COMMANDS else IO_PRIORITY_COMMAND
 
 
 async def send_eveus_command(
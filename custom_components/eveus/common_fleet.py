@@ -0,0 +1,324 @@
+"""Fleet hub scheduling for installations with many Eveus chargers."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_POLLS,
+    FLEET_METRICS_WINDOW,
+    FLEET_TICK_INTERVAL,
+    IDLE_UPDATE_INTERVAL,
+    STARTUP_MAX_CONCURRENT,
+    STARTUP_PRIORITY_CHARGING,
+    STARTUP_PRIORITY_DEFAULT,
+)
+from .polling import STATE_CHARGING
+from .utils import get_safe_value
+
+if TYPE_CHECKING:
+    from .common_network import EveusUpdater
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_FLEET_HUB = f"{DOMAIN}_fleet_hub"
+DATA_STARTUP_ADMISSION = f"{DOMAIN}_startup_admission"
+
+
+def phase_offset(host: str, interval: float) -> float:
+    """Return a deterministic poll offset for a host within one interval."""
+    return (zlib.crc32(host.encode()) / 0xFFFFFFFF) * interval
+
+
+@dataclass(slots=True)
+class _FleetMember:
+    """Scheduling state for one hub-managed charger."""
+
+    updater: "EveusUpdater"
+    next_due: float
+    polling: bool = False
+
+
+class EveusFleetHub:
+    """Poll every hub-managed charger from one shared timer."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = FLEET_MAX_CONCURRENT_POLLS,
+    ) -> None:
+        """Initialize the fleet hub."""
+        self.hass = hass
+        self._max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._members: dict["EveusUpdater", _FleetMember] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._in_flight = 0
+        self._poll_starts: deque[float] = deque()
+        self._queue_waits: deque[float] = deque(maxlen=100)
+
+    @property
+    def member_count(self) -> int:
+        """Return the number of chargers managed by the hub."""
+        return len(self._members)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Fleet-level scheduling metrics."""
+        self._prune_poll_window(time.monotonic())
+        waits = self._queue_waits
+        return {
+            "members": len(self._members),
+            "polls_per_second": round(len(self._poll_starts) / FLEET_METRICS_WINDOW, 3),
+            "in_flight": self._in_flight,
+            "max_concurrent": self._max_concurrent,
+            "queue_wait_avg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "queue_wait_max": round(max(waits), 3) if waits else 0.0,
+        }
+
+    @callback
+    def async_add(self, updater: "EveusUpdater") -> CALLBACK_TYPE:
+        """Hand scheduling of an updater to the hub and return a remover."""
+        interval = _interval_seconds(updater)
+        next_due = time.monotonic() + phase_offset(updater.host, interval)
+        # Skip phase slots that would poll again right after the last poll.
+        if updater.last_poll_time is not None:
+            while next_due < updater.last_poll_time + interval:
+                next_due += interval
+        self._members[updater] = _FleetMember(updater=updater, next_due=next_due)
+        updater.attach_fleet_hub(self)
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=FLEET_TICK_INTERVAL),
+                name="Eveus fleet hub",
+            )
+        _LOGGER.debug("Fleet hub now manages %d chargers", len(self._members))
+        return partial(self._async_remove, updater)
+
+    @callback
+    def _async_remove(self, updater: "EveusUpdater") -> None:
+        """Stop scheduling an updater and stop the timer when idle."""
+        if self._members.pop(updater, None) is not None:
+            updater.attach_fleet_hub(None)
+
+        if not self._members and self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        """Start polls for every charger whose slot has come up."""
+        now = time.monotonic()
+        for member in self._members.values():
+            if member.polling or now < member.next_due:
+                continue
+            member.polling = True
+            self.hass.async_create_background_task(
+                self._async_poll(member),
+                name=f"Eveus fleet poll {member.updater.host}",
+            )
+
+    async def _async_poll(self, member: _FleetMember) -> None:
+        """Poll one charger within the concurrency cap."""
+        queued_at = time.monotonic()
+        try:
+            async with self._semaphore:
+                started_at = time.monotonic()
+                self._queue_waits.append(started_at - queued_at)
+                self._poll_starts.append(started_at)
+                self._prune_poll_window(started_at)
+                self._in_flight += 1
+                try:
+                    await member.updater.async_refresh()
+                finally:
+                    self._in_flight -= 1
+        finally:
+            member.polling = False
+            member.next_due = max(
+                member.next_due + _interval_seconds(member.updater),
+                time.monotonic(),
+            )
+
+    def _prune_poll_window(self, now: float) -> None:
+        """Drop poll timestamps that fell out of the metrics window."""
+        cutoff = now - FLEET_METRICS_WINDOW
+        while self._poll_starts and self._poll_starts[0] < cutoff:
+            self._poll_starts.popleft()
+
+
+def _interval_seconds(updater: "EveusUpdater") -> float:
+    """Return the interval an updater currently asks for."""
+    interval = updater.update_interval
+    return interval.total_seconds() if interval else float(IDLE_UPDATE_INTERVAL)
+
+
+@callback
+def async_get_fleet_hub(hass: HomeAssistant) -> EveusFleetHub:
+    """Return the shared fleet hub, creating it on first use."""
+    hub: EveusFleetHub | None = hass.data.get(DATA_FLEET_HUB)
+    if hub is None:
+        hub = hass.data[DATA_FLEET_HUB] = EveusFleetHub(hass)
+    return hub
+
+
+def startup_priority(data: dict[str, Any] | None) -> int:
+    """Return the admission priority for a charger's restored payload."""
+    if data and get_safe_value(data, "state", int) == STATE_CHARGING:
+        return STARTUP_PRIORITY_CHARGING
+    return STARTUP_PRIORITY_DEFAULT
+
+
+class StartupAdmission:
+    """Limit how many chargers do their first refresh and entity setup at once.
+
+    Waiting entries are admitted in priority order (FIFO within a priority),
+    so chargers that were charging at shutdown come up first. A burst starts
+    with the first request while idle and ends once every entry admitted in
+    it has finished starting; its duration is reported as the fleet-ready
+    time. An entry whose first refresh runs after setup keeps its slot's
+    exit from finishing it and is finished by its refresh slot or by
+    ``finish``.
+    """
+
+    def __init__(self, max_concurrent: int = STARTUP_MAX_CONCURRENT) -> None:
+        """Initialize the admission controller."""
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._waits: dict[str, float] = {}
+        self._burst_started: float | None = None
+        self._burst_entries: set[str] = set()
+        # Admitted entries of the current burst that have not finished starting
+        self._starting: set[str] = set()
+        self._fleet_ready_time: float | None = None
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Admission metrics for the last startup burst."""
+        waits = self._waits.values()
+        return {
+            "max_concurrent": self._max_concurrent,
+            "active": self._active,
+            "queued": sum(not future.done() for *_, future in self._waiters),
+            "burst_entries": len(self._burst_entries),
+            "fleet_ready_time": (
+                round(self._fleet_ready_time, 3)
+                if self._fleet_ready_time is not None
+                else None
+            ),
+            "setup_wait_max": round(max(waits), 3) if waits else 0.0,
+        }
+
+    def setup_wait(self, entry_id: str) -> float | None:
+        """Return how long an entry waited for admission in total."""
+        wait = self._waits.get(entry_id)
+        return round(wait, 3) if wait is not None else None
+
+    @asynccontextmanager
+    async def slot(
+        self, entry_id: str, priority: int, *, finished: bool = True
+    ) -> AsyncIterator[None]:
+        """Hold one of the startup slots for an entry.
+
+        With ``finished`` False the entry still counts as starting after the
+        slot is released, so the burst stays open for its later first refresh.
+        """
+        await self._acquire(entry_id, priority)
+        try:
+            yield
+        finally:
+            if finished:
+                self._starting.discard(entry_id)
+            self._release()
+
+    @callback
+    def finish(self, entry_id: str) -> None:
+        """Mark an entry as done starting, e.g. when it unloads early."""
+        if entry_id in self._starting:
+            self._starting.discard(entry_id)
+            self._finish_burst()
+
+    async def _acquire(self, entry_id: str, priority: int) -> None:
+        """Wait until the entry is admitted."""
+        queued_at = time.monotonic()
+        if self._burst_started is None:
+            self._burst_started = queued_at
+            self._burst_entries = set()
+        self._burst_entries.add(entry_id)
+        self._starting.add(entry_id)
+
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                self._starting.discard(entry_id)
+                if future.done() and not future.cancelled():
+                    self._release()
+                else:
+                    self._finish_burst()
+                raise
+
+        self._waits[entry_id] = (
+            self._waits.get(entry_id, 0.0) + time.monotonic() - queued_at
+        )
+
+    def _release(self) -> None:
+        """Free a slot and admit the next waiting entry."""
+        self._active -= 1
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._active += 1
+                future.set_result(None)
+                return
+        self._finish_burst()
+
+    def _finish_burst(self) -> None:
+        """Record the fleet-ready time once every admitted entry has started."""
+        if (
+            self._active
+            or self._starting
+            or any(not future.done() for *_, future in self._waiters)
+        ):
+            return
+        if self._burst_started is None:
+            return
+        self._fleet_ready_time = time.monotonic() - self._burst_started
+        self._burst_started = None
+        _LOGGER.info(
+            "%d Eveus chargers ready in %.1fs",
+            len(self._burst_entries),
+            self._fleet_ready_time,
+        )
+
+
+@callback
+def async_get_startup_admission(hass: HomeAssistant) -> StartupAdmission:
+    """Return the shared startup admission controller, creating it on first use."""
+    admission: StartupAdmission | None = hass.data.get(DATA_STARTUP_ADMISSION)
+    if admission is None:
+        admission = hass.data[DATA_STARTUP_ADMISSION] = StartupAdmission()
+    return admission
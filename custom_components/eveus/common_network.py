@@ -3,31 +3,691 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
 from datetime import timedelta
+from functools import wraps
+import heapq
+import ipaddress
+import itertools
 import json
 import logging
+import random
+import socket
 import time
-from typing import Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    TypeVar,
+)
 
 import aiohttp
+from aiohttp.abc import AbstractResolver
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .common_command import CommandManager
+from .common_command import (
+    COMMAND_CONFIRMED,
+    COMMAND_FAILED,
+    COMMAND_JOURNALED,
+    COMMAND_REJECTED,
+    COMMAND_SUPERSEDED,
+    COMMAND_TIMED_OUT,
+    CommandManager,
+)
 from .const import (
-    CHARGING_UPDATE_INTERVAL,
+    ADDRESS_PIN_TTL,
+    BREAKER_BASE_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_DELAY,
+    BREAKER_PROBE_TIMEOUT,
+    COMMAND_CONFIRM_DELAYS,
+    COMMAND_TIMEOUT,
+    COMMAND_WATCH_PERIOD,
+    DOMAIN,
     ERROR_LOG_RATE_LIMIT,
     IDLE_UPDATE_INTERVAL,
-    RETRY_DELAY,
+    IO_MIN_SPACING,
+    IO_PRIORITY_NAMES,
+    IO_PRIORITY_POLL,
+    IO_PRIORITY_PROBE,
+    POOL_CONNECTIONS_PER_HOST,
+    POOL_IDLE_DROP_THRESHOLD,
+    POOL_KEEPALIVE_TIMEOUT,
+    SEED_MAX_AGE,
+    SNAPSHOT_MAX_AGE,
+    STATEFUL_COMMANDS,
+    TCP_PROBE_INTERVAL,
+    TCP_PROBE_TIMEOUT,
+    TIMEOUT_FLOOR,
+    UNLOAD_CANCEL_TIMEOUT,
     UPDATE_TIMEOUT,
 )
-from .utils import get_safe_value
+from .polling import AdaptivePollController, PollIntervalController
+from .reading import EMPTY_READING, ChargerReading
+from .storage import EntryStateStore
+from .telemetry import ERROR_TIMEOUT, AdaptiveTimeout, ConnectionTelemetry, classify_error
+from .utils import diff_payload_keys, get_payload_decoder
+
+if TYPE_CHECKING:
+    from .common_fleet import EveusFleetHub
+    from .journal import CommandJournal
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_IO_SCHEDULERS = f"{DOMAIN}_io_schedulers"
+DATA_SEED_PAYLOADS = f"{DOMAIN}_seed_payloads"
+
+_T = TypeVar("_T")
+
+# Set inside write confirmation bursts, whose polls must not steer polling.
+_CONFIRMATION_POLL: ContextVar[bool] = ContextVar("eveus_confirmation_poll", default=False)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling unreachable chargers and probe them with backoff.
+
+    Consecutive failures open the breaker. While open, polls are skipped
+    until a jittered, exponentially growing delay has passed; the next poll
+    is then a single short-timeout probe that either closes the breaker or
+    re-opens it with a longer delay.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_delay: float = BREAKER_BASE_DELAY,
+        max_delay: float = BREAKER_MAX_DELAY,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self.state = BREAKER_CLOSED
+        self._failures = 0
+        self._open_streak = 0
+        self._retry_at = 0.0
+        self._transitions = {BREAKER_OPEN: 0, BREAKER_HALF_OPEN: 0, BREAKER_CLOSED: 0}
+
+    @property
+    def probing(self) -> bool:
+        """Return True while the next request is a half-open probe."""
+        return self.state == BREAKER_HALF_OPEN
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Breaker state and transition counts."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "open_streak": self._open_streak,
+            "retry_in": round(self.retry_in(), 1),
+            "transitions": dict(self._transitions),
+        }
+
+    def retry_in(self, now: float | None = None) -> float:
+        """Return seconds until an open breaker allows a probe."""
+        if self.state != BREAKER_OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(self._retry_at - now, 0.0)
+
+    def allow_request(self, now: float | None = None) -> bool:
+        """Return whether a request may go out, moving to half-open when due."""
+        if self.state != BREAKER_OPEN:
+            return True
+        if self.retry_in(now) > 0:
+            return False
+        self._transition(BREAKER_HALF_OPEN)
+        return True
+
+    def half_open(self) -> None:
+        """Allow a probe now, ahead of the backoff delay."""
+        if self.state == BREAKER_OPEN:
+            self._transition(BREAKER_HALF_OPEN)
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self._failures = 0
+        self._open_streak = 0
+        if self.state != BREAKER_CLOSED:
+            self._transition(BREAKER_CLOSED)
+
+    def record_failure(self, now: float | None = None) -> None:
+        """Count a failure and open the breaker when warranted."""
+        self._failures += 1
+        if self.state == BREAKER_HALF_OPEN or (
+            self.state == BREAKER_CLOSED and self._failures >= self._failure_threshold
+        ):
+            self._open(time.monotonic() if now is None else now)
+
+    def _open(self, now: float) -> None:
+        """Open the breaker with equal-jitter exponential backoff."""
+        delay = min(self._base_delay * 2**self._open_streak, self._max_delay)
+        self._open_streak += 1
+        self._retry_at = now + random.uniform(delay / 2, delay)
+        self._transition(BREAKER_OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Move to a new state and count the transition."""
+        self.state = state
+        self._transitions[state] += 1
+
+
+class DeviceIOScheduler:
+    """Serialize every request to one charger by priority with minimum spacing.
+
+    The charger's embedded web server handles one request at a time, so
+    polls, commands and probes take turns. Waiting requests are granted in
+    priority order (FIFO within a class) once the previous request has
+    finished and the minimum idle gap has passed.
+    """
+
+    def __init__(self, host: str, min_spacing: float = IO_MIN_SPACING) -> None:
+        """Initialize the scheduler."""
+        self.host = host
+        self._min_spacing = min_spacing
+        self._busy = False
+        self._last_end = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._grant_timer: asyncio.TimerHandle | None = None
+        self._waits: dict[int, deque[float]] = {
+            priority: deque(maxlen=50) for priority in IO_PRIORITY_NAMES
+        }
+        self._granted = dict.fromkeys(IO_PRIORITY_NAMES, 0)
+        self.users = 0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Queue length and per-class queue-time metrics."""
+        classes: dict[str, Any] = {}
+        for priority, name in IO_PRIORITY_NAMES.items():
+            waits = self._waits[priority]
+            classes[name] = {
+                "requests": self._granted[priority],
+                "queue_wait_avg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "queue_wait_max": round(max(waits), 3) if waits else 0.0,
+            }
+        return {
+            "queued": sum(not future.done() for *_, future in self._waiters),
+            "busy": self._busy,
+            "classes": classes,
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold the charger for one request."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until this request may talk to the charger."""
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        if (
+            not self._busy
+            and not self._waiters
+            and loop.time() >= self._last_end + self._min_spacing
+        ):
+            self._busy = True
+        else:
+            future: asyncio.Future[None] = loop.create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            self._schedule_grant()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release()
+                raise
+
+        self._waits[priority].append(loop.time() - queued_at)
+        self._granted[priority] += 1
+
+    def _release(self) -> None:
+        """Finish a request and hand the charger to the next waiter."""
+        self._busy = False
+        self._last_end = asyncio.get_running_loop().time()
+        self._schedule_grant()
+
+    def _schedule_grant(self) -> None:
+        """Grant the next waiter once the charger is idle for long enough."""
+        if self._busy or self._grant_timer is not None:
+            return
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if not self._waiters:
+            return
+
+        loop = asyncio.get_running_loop()
+        delay = self._last_end + self._min_spacing - loop.time()
+        if delay > 0:
+            self._grant_timer = loop.call_later(delay, self._grant)
+        else:
+            self._grant()
+
+    def _grant(self) -> None:
+        """Wake the highest-priority waiter."""
+        self._grant_timer = None
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._busy = True
+                future.set_result(None)
+                return
+
+
+@callback
+def async_acquire_io_scheduler(hass: HomeAssistant, host: str) -> DeviceIOScheduler:
+    """Return the shared I/O scheduler for a charger host and count the user.
+
+    Every acquire must be paired with async_release_io_scheduler.
+    """
+    schedulers: dict[str, DeviceIOScheduler] = hass.data.setdefault(
+        DATA_IO_SCHEDULERS, {}
+    )
+    scheduler = schedulers.get(host)
+    if scheduler is None:
+        scheduler = schedulers[host] = DeviceIOScheduler(host)
+    scheduler.users += 1
+    return scheduler
+
+
+@callback
+def async_release_io_scheduler(hass: HomeAssistant, host: str) -> None:
+    """Drop one user of a host's I/O scheduler and forget it after the last."""
+    schedulers: dict[str, DeviceIOScheduler] = hass.data.get(DATA_IO_SCHEDULERS, {})
+    scheduler = schedulers.get(host)
+    if scheduler is None:
+        return
+    scheduler.users -= 1
+    if scheduler.users <= 0:
+        del schedulers[host]
+
+
+@callback
+def async_remember_validated_payload(
+    hass: HomeAssistant, host: str, payload: dict[str, Any]
+) -> None:
+    """Keep a payload fetched during setup validation for the first refresh."""
+    hass.data.setdefault(DATA_SEED_PAYLOADS, {})[host] = (time.time(), payload)
+
+
+@callback
+def async_pop_validated_payload(
+    hass: HomeAssistant, host: str
+) -> tuple[float, dict[str, Any]] | None:
+    """Return a recently validated payload and its fetch time, if fresh enough."""
+    seed = hass.data.get(DATA_SEED_PAYLOADS, {}).pop(host, None)
+    if seed is None or time.time() - seed[0] > SEED_MAX_AGE:
+        return None
+    return seed
+
+
+class PinnedResolver(AbstractResolver):
+    """Resolve a charger hostname once and keep using the address.
+
+    Addresses are reused for ADDRESS_PIN_TTL and re-resolved earlier only
+    after a connect failure. If a re-resolution fails, the previous address
+    is served so a DNS or mDNS hiccup does not take the charger offline.
+    """
+
+    def __init__(self, ttl: float = ADDRESS_PIN_TTL) -> None:
+        """Initialize the resolver with nothing pinned."""
+        self._ttl = ttl
+        self._inner: AbstractResolver | None = None
+        self._hostname: str | None = None
+        self._addresses: list[tuple[str, int]] = []
+        self._resolved_at: float | None = None
+        self._resolutions = 0
+        self._re_resolutions = 0
+        self._failures = 0
+        self._resolve_times: deque[float] = deque(maxlen=10)
+
+    @property
+    def pinned_address(self) -> str | None:
+        """Return the first pinned address, if any."""
+        return self._addresses[0][0] if self._addresses else None
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Pinning state and resolution counters."""
+        return {
+            "pinned_address": self.pinned_address,
+            "age": (
+                round(time.time() - self._resolved_at, 1)
+                if self._resolved_at is not None
+                else None
+            ),
+            "resolutions": self._resolutions,
+            "re_resolutions": self._re_resolutions,
+            "failures": self._failures,
+            "resolve_time_avg": (
+                round(sum(self._resolve_times) / len(self._resolve_times), 4)
+                if self._resolve_times
+                else None
+            ),
+        }
+
+    def invalidate(self) -> None:
+        """Re-resolve on the next lookup, keeping the address as a fallback."""
+        self._resolved_at = None
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[dict[str, Any]]:
+        """Return the pinned address, resolving it when missing or expired."""
+        if (
+            host == self._hostname
+            and self._addresses
+            and self._resolved_at is not None
+            and time.time() - self._resolved_at < self._ttl
+        ):
+            return self._results(host, port)
+
+        if self._inner is None:
+            self._inner = aiohttp.ThreadedResolver()
+        start = time.perf_counter()
+        try:
+            results = await self._inner.resolve(host, port, family)
+        except OSError:
+            self._failures += 1
+            if host == self._hostname and self._addresses:
+                return self._results(host, port)
+            raise
+        self._resolve_times.append(time.perf_counter() - start)
+
+        if host == self._hostname and self._addresses:
+            self._re_resolutions += 1
+        self._resolutions += 1
+        self._hostname = host
+        self._addresses = [(result["host"], result["family"]) for result in results]
+        self._resolved_at = time.time()
+        return results
+
+    async def close(self) -> None:
+        """Close the underlying resolver."""
+        if self._inner is not None:
+            await self._inner.close()
+            self._inner = None
+
+    def as_dict(self) -> dict[str, Any] | None:
+        """Return the pinned addresses for persistence."""
+        if not self._addresses or self._resolved_at is None:
+            return None
+        return {
+            "hostname": self._hostname,
+            "addresses": [list(address) for address in self._addresses],
+            "resolved_at": self._resolved_at,
+        }
+
+    def restore(self, state: dict[str, Any] | None, hostname: str) -> None:
+        """Restore pinned addresses saved for the same hostname."""
+        if not state or state.get("hostname") != hostname:
+            return
+        try:
+            addresses = [(str(host), int(family)) for host, family in state["addresses"]]
+            resolved_at = float(state["resolved_at"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self._hostname = hostname
+        self._addresses = addresses
+        self._resolved_at = resolved_at
+
+    def _results(self, host: str, port: int) -> list[dict[str, Any]]:
+        """Build resolver results from the pinned addresses.
+
+        Plain dicts rather than aiohttp's ResolveResult, which aiohttp
+        releases before 3.10 do not provide.
+        """
+        return [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": family,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+            }
+            for address, family in self._addresses
+        ]
+
+
+class EveusConnectionPool:
+    """Per-charger HTTP session that reuses a small set of keep-alive sockets."""
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.host = host
+        self._session: aiohttp.ClientSession | None = None
+        # Replace the session at the next request, when it is idle
+        self._session_retired = False
+        self._unsub_close: CALLBACK_TYPE | None = None
+        self._use_shared_session = False
+        self._force_close = False
+        self._idle_drops = 0
+        self._last_request_reused = False
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._connect_started: float | None = None
+        self._connect_times: deque[float] = deque(maxlen=10)
+        self.resolver = PinnedResolver()
+
+    @property
+    def mode(self) -> str:
+        """Return how requests to this charger are transported."""
+        if self._use_shared_session:
+            return "shared"
+        return "close" if self._force_close else "keep-alive"
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Extra request headers required by the current mode."""
+        return {"Connection": "close"} if self._force_close else {}
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Connection reuse metrics."""
+        total = self._connections_created + self._connections_reused
+        return {
+            "connection_mode": self.mode,
+            "connection_reuse_ratio": (
+                self._connections_reused / total if total else 0.0
+            ),
+            "connect_time_avg": (
+                sum(self._connect_times) / len(self._connect_times)
+                if self._connect_times
+                else 0.0
+            ),
+        }
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, falling back to the shared one.
+
+        Callers hold the charger's I/O scheduler slot, so a retired session
+        has no request in flight and can be closed here safely.
+        """
+        if self._session_retired:
+            self._session_retired = False
+            if self._session is not None and not self._session.closed:
+                self.hass.async_create_background_task(
+                    self._session.close(), name=f"Eveus close session {self.host}"
+                )
+            self._session = None
+
+        if self._use_shared_session:
+            return async_get_clientsession(self.hass)
+
+        if self._session is None or self._session.closed:
+            try:
+                self._session = self._create_session()
+            except Exception as err:
+                _LOGGER.debug(
+                    "Falling back to shared HTTP session for %s: %s", self.host, err
+                )
+                self._use_shared_session = True
+                return async_get_clientsession(self.hass)
+            if self._unsub_close is None:
+                self._unsub_close = self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+                )
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session bounded to a couple of connections to the charger."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+        connector = aiohttp.TCPConnector(
+            limit=POOL_CONNECTIONS_PER_HOST,
+            limit_per_host=POOL_CONNECTIONS_PER_HOST,
+            keepalive_timeout=None if self._force_close else POOL_KEEPALIVE_TIMEOUT,
+            force_close=self._force_close,
+            resolver=self.resolver,
+            use_dns_cache=False,
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_connection_create_start(self, *_args: Any) -> None:
+        """Mark the start of a new TCP connection."""
+        self._connect_started = time.monotonic()
+        self._last_request_reused = False
+
+    async def _on_connection_create_end(self, *_args: Any) -> None:
+        """Record how long a new TCP connection took."""
+        self._connections_created += 1
+        self._last_request_reused = False
+        if self._connect_started is not None:
+            self._connect_times.append(time.monotonic() - self._connect_started)
+            self._connect_started = None
+
+    async def _on_connection_reuseconn(self, *_args: Any) -> None:
+        """Record reuse of a keep-alive connection."""
+        self._connections_reused += 1
+        self._last_request_reused = True
+
+    def record_success(self) -> None:
+        """Reset idle-drop tracking after a request went through."""
+        if self._last_request_reused:
+            self._idle_drops = 0
+
+    async def async_resolve(self) -> str:
+        """Return the address to connect to, using the pinned one if any."""
+        try:
+            ipaddress.ip_address(self.host)
+        except ValueError:
+            results = await self.resolver.resolve(self.host, 80)
+            return results[0]["host"]
+        return self.host
+
+    def record_error(self, error: Exception) -> None:
+        """Re-resolve the charger's address after connect failures."""
+        if isinstance(error, aiohttp.ClientConnectorError):
+            self.resolver.invalidate()
+
+    def retry_on_fresh_connection(self, error: Exception) -> bool:
+        """Return True when a request should be retried on a new connection.
+
+        That is the case when the charger closed a reused keep-alive socket.
+        The session is replaced so the retry cannot pick up another stale
+        socket, and firmware that keeps dropping idle sockets is switched to
+        Connection: close.
+        """
+        if (
+            self._force_close
+            or self._use_shared_session
+            or not self._last_request_reused
+            or isinstance(error, aiohttp.ClientConnectorError)
+            or not isinstance(
+                error, (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError)
+            )
+        ):
+            return False
+
+        self._last_request_reused = False
+        self._session_retired = True
+        self._idle_drops += 1
+        if self._idle_drops >= POOL_IDLE_DROP_THRESHOLD:
+            _LOGGER.debug(
+                "Charger %s drops idle connections, switching to Connection: close",
+                self.host,
+            )
+            self._force_close = True
+        return True
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        """Close the pooled session when Home Assistant shuts down."""
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the pooled session."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_retired = False
+        await self.resolver.close()
+
+
+def _owned_io(
+    unloaded: Callable[[EveusUpdater], _T],
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Run charger I/O in a task the updater owns so unload can cancel it.
+
+    The caller, which may be a Home Assistant service or automation task,
+    only waits for that task and is never cancelled by unload; it gets
+    ``unloaded(updater)`` instead when unload cancels the request.
+    """
+
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @wraps(func)
+        async def wrapper(self: EveusUpdater, *args: Any, **kwargs: Any) -> _T:
+            if asyncio.current_task() in self._io_tasks:
+                return await func(self, *args, **kwargs)
+            task = self._create_io_task(
+                func(self, *args, **kwargs), f"Eveus {func.__name__} {self.host}"
+            )
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+            return unloaded(self)
+
+        return wrapper
+
+    return decorator
+
+
+def _unloaded_poll(updater: EveusUpdater) -> dict[str, Any]:
+    """Fail a poll that unload cancelled."""
+    raise UpdateFailed(f"Device {updater.host} is unloading")
+
 
 class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
     """Data coordinator for an Eveus charger."""
@@ -39,6 +699,7 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         password: str,
         hass: HomeAssistant,
         config_entry: ConfigEntry | None = None,
+        interval_controller: PollIntervalController | None = None,
     ) -> None:
         """Initialize updater."""
         super().__init__(
@@ -52,12 +713,50 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         self.username = username
         self.password = password
         self._command_manager = CommandManager(self)
+        self.interval_controller = interval_controller or AdaptivePollController()
+        self.connection_pool = EveusConnectionPool(hass, host)
+        self.io_scheduler = async_acquire_io_scheduler(hass, host)
+        self._io_scheduler_released = False
+        self.breaker = CircuitBreaker()
+        self.command_journal: CommandJournal | None = None
+        self._replay_task: asyncio.Task | None = None
+        self._io_tasks: set[asyncio.Task] = set()
+        self._last_unload: dict[str, Any] | None = None
+        self._tcp_reachable: bool | None = None
+        self._tcp_probes = 0
+        self._tcp_probe_successes = 0
+        self._data_time: float | None = None
+        self._polled_at: float | None = None
+        self._reading: ChargerReading = EMPTY_READING
+        self._reading_source: dict[str, Any] | None = None
+        self._snapshot_time: float | None = None
+        self._fleet_hub: EveusFleetHub | None = None
+
+        self._key_index: dict[str, set[CALLBACK_TYPE]] = {}
+        self._keyed_callbacks: set[CALLBACK_TYPE] = set()
+        self._changed_keys: frozenset[str] | None = None
+        self._watched_keys: dict[str, float] = {}
+        self._notified_success: bool | None = None
+        self._listeners_notified = 0
+        self._listeners_skipped = 0
+        self._suppressed_writes: dict[str, int] = {}
+        self._deferred_updates: dict[str, int] = {}
 
         self._success_count = 0
         self._total_count = 0
         self._consecutive_failures = 0
         self._last_success_time = time.time()
         self._latency_samples: deque[float] = deque(maxlen=10)
+        self._telemetry = ConnectionTelemetry()
+        self.poll_timeout = AdaptiveTimeout(TIMEOUT_FLOOR, UPDATE_TIMEOUT)
+        self.command_timeout = AdaptiveTimeout(TIMEOUT_FLOOR, COMMAND_TIMEOUT)
+        self._state_store = (
+            EntryStateStore(hass, config_entry.entry_id, self._state_to_save)
+            if config_entry is not None
+            else None
+        )
+        self._decoder = get_payload_decoder()
+        self._decode_samples: deque[float] = deque(maxlen=10)
 
         self._last_availability_log = 0
         self._silent_mode = False
@@ -69,10 +768,26 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         """Return availability status."""
         return self.last_update_success
 
+    @property
+    def reading(self) -> ChargerReading:
+        """Return the current payload parsed into typed fields.
+
+        Parsed once per payload and shared by every entity.
+        """
+        data = self.data
+        if data is not self._reading_source:
+            self._reading = ChargerReading(data) if data else EMPTY_READING
+            self._reading_source = data
+        return self._reading
+
     @property
     def connection_quality(self) -> dict[str, Any]:
         """Connection metrics exposed for diagnostics and sensors."""
-        success_rate = (self._success_count / max(self._total_count, 1)) * 100
+        telemetry = self._telemetry.summary()
+        lifetime_rate = (self._success_count / max(self._total_count, 1)) * 100
+        success_rate = telemetry["success_rate_15m"]
+        if success_rate is None:
+            success_rate = lifetime_rate
         avg_latency = (
             (sum(self._latency_samples) / len(self._latency_samples))
             if self._latency_samples
@@ -80,32 +795,409 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         )
         return {
             "success_rate": success_rate,
+            "success_rate_lifetime": lifetime_rate,
             "latency_avg": avg_latency,
             "consecutive_failures": self._consecutive_failures,
             "is_healthy": success_rate > 80 and time.time() - self._last_success_time < 300,
             "last_success_time": self._last_success_time,
             "last_error": self._last_error,
+            "decoder": self._decoder.name,
+            "decode_time_avg": (
+                sum(self._decode_samples) / len(self._decode_samples)
+                if self._decode_samples
+                else 0.0
+            ),
+            "timeout_poll": round(self.poll_timeout.timeout, 2),
+            "timeout_command": round(self.command_timeout.timeout, 2),
+            "timeout_rate_poll": self.poll_timeout.timeout_rate,
+            "timeout_rate_command": self.command_timeout.timeout_rate,
+            **telemetry,
+            **self.connection_pool.metrics,
         }
 
+    @property
+    def dispatch_stats(self) -> dict[str, Any]:
+        """Listener callbacks run and skipped, and entity work avoided."""
+        return {
+            "notified": self._listeners_notified,
+            "skipped": self._listeners_skipped,
+            "indexed_keys": len(self._key_index),
+            "suppressed_writes": dict(self._suppressed_writes),
+            "deferred_updates": dict(self._deferred_updates),
+        }
+
+    @callback
+    def record_suppressed_write(self, entity_key: str) -> None:
+        """Count a state write an entity skipped as insignificant."""
+        self._suppressed_writes[entity_key] = self._suppressed_writes.get(entity_key, 0) + 1
+
+    @callback
+    def record_deferred_update(self, entity_key: str) -> None:
+        """Count an update a slow refresh tier entity did not process."""
+        self._deferred_updates[entity_key] = self._deferred_updates.get(entity_key, 0) + 1
+
+    @property
+    def probe_stats(self) -> dict[str, Any]:
+        """TCP reachability probe counters."""
+        return {
+            "sent": self._tcp_probes,
+            "reachable": self._tcp_probe_successes,
+            "last_reachable": self._tcp_reachable,
+        }
+
+    @property
+    def command_stats(self) -> dict[str, int]:
+        """Command queue counters."""
+        return self._command_manager.stats
+
+    @property
+    def snapshot_age(self) -> float | None:
+        """Return the age of restored data until the first live poll, else None."""
+        if self._snapshot_time is None:
+            return None
+        return max(time.time() - self._snapshot_time, 0.0)
+
+    @property
+    def lifecycle_stats(self) -> dict[str, Any]:
+        """Tasks doing charger I/O now and the previous unload's cost."""
+        return {"io_tasks": len(self._io_tasks), "last_unload": self._last_unload}
+
     @property
     def is_likely_offline(self) -> bool:
         """Check if the device appears to be powered off."""
-        return self._consecutive_failures > 10 and time.time() - self._last_success_time > 600
+        return self.breaker.state != BREAKER_CLOSED
+
+    @property
+    def last_poll_time(self) -> float | None:
+        """Return the monotonic time of the last poll, seeded or live."""
+        return self._polled_at
+
+    @property
+    def fleet_hub(self) -> EveusFleetHub | None:
+        """Return the fleet hub scheduling this charger, if any."""
+        return self._fleet_hub
+
+    @callback
+    def attach_fleet_hub(self, hub: EveusFleetHub | None) -> None:
+        """Hand poll scheduling to a fleet hub, or take it back."""
+        self._fleet_hub = hub
+        if hub is not None:
+            self._async_unsub_refresh()
+        elif self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_set_poll_bounds(self, floor: float, ceiling: float) -> None:
+        """Apply new poll interval bounds to the running coordinator."""
+        controller = self.interval_controller
+        controller.set_bounds(floor, ceiling)
+        if self.update_interval is None:
+            return
+        current = self.update_interval.total_seconds()
+        interval = min(max(current, controller.floor), controller.ceiling)
+        if interval != current:
+            self.update_interval = timedelta(seconds=interval)
+            if self._listeners:
+                self._schedule_refresh()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll unless a fleet hub owns scheduling."""
+        if self._fleet_hub is not None:
+            return
+        super()._schedule_refresh()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates, indexing listeners by the payload keys they use."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not isinstance(context, frozenset):
+            return remove_listener
+
+        for key in context:
+            self._key_index.setdefault(key, set()).add(update_callback)
+        self._keyed_callbacks.add(update_callback)
+
+        @callback
+        def remove_keyed_listener() -> None:
+            remove_listener()
+            self._keyed_callbacks.discard(update_callback)
+            for key in context:
+                callbacks = self._key_index.get(key)
+                if callbacks is not None:
+                    callbacks.discard(update_callback)
+                    if not callbacks:
+                        del self._key_index[key]
+
+        return remove_keyed_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose payload keys changed."""
+        changed = self._changed_keys
+        self._changed_keys = None
+        availability_changed = self._notified_success is not self.last_update_success
+        self._notified_success = self.last_update_success
+
+        if changed is None or availability_changed:
+            self._listeners_notified += len(self._listeners)
+            super().async_update_listeners()
+            return
+
+        targeted: set[CALLBACK_TYPE] = set()
+        for key in changed | self._active_watched_keys():
+            targeted.update(self._key_index.get(key, ()))
+
+        for update_callback, _ in list(self._listeners.values()):
+            if update_callback in self._keyed_callbacks and update_callback not in targeted:
+                self._listeners_skipped += 1
+                continue
+            self._listeners_notified += 1
+            update_callback()
+
+    def _active_watched_keys(self) -> set[str]:
+        """Return keys of recent commands that still await reconciliation."""
+        now = time.monotonic()
+        for key, expires in list(self._watched_keys.items()):
+            if expires <= now:
+                del self._watched_keys[key]
+        return set(self._watched_keys)
 
     def get_session(self) -> aiohttp.ClientSession:
-        """Get Home Assistant shared HTTP session."""
-        return async_get_clientsession(self.hass)
+        """Get the per-charger pooled HTTP session."""
+        return self.connection_pool.get_session()
 
+    @_owned_io(lambda updater: False)
     async def send_command(self, command: str, value: Any) -> bool:
         """Send command to the device and refresh data on success."""
+        if command in STATEFUL_COMMANDS:
+            return await self.async_write(command, value) == COMMAND_CONFIRMED
+
         success = await self._command_manager.send_command(command, value)
+        self._watched_keys[command] = time.monotonic() + COMMAND_WATCH_PERIOD
         if success:
             await self.async_request_refresh()
         return success
 
+    @_owned_io(lambda updater: COMMAND_FAILED)
+    async def async_write(self, command: str, value: Any) -> str:
+        """Write a setting and confirm it by reading it back from the charger.
+
+        Writes that match the latest unconfirmed write, or the confirmed
+        device value when no write is outstanding, are not sent again. When
+        the command journal is enabled, undeliverable writes are journaled
+        for replay instead of being dropped, and are not attempted while the
+        breaker is open.
+        Returns one of the COMMAND_* results.
+        """
+        journal = self.command_journal
+        if journal is not None:
+            journal.supersede(command, value)
+            if self.breaker.state == BREAKER_OPEN and journal.record(command, value):
+                return COMMAND_JOURNALED
+
+        # A write still queued, in flight or being confirmed decides what the
+        # charger will report, so compare against it before the device state.
+        queued = self._command_manager.latest(command)
+        if queued is not None and not queued.unconfirmed:
+            queued = None
+        if queued is not None and _same_value(queued.value, value):
+            self._command_manager.record_skipped()
+            await asyncio.shield(queued.future)
+        elif (
+            queued is None
+            and self.last_update_success
+            and self._snapshot_time is None
+            and self.data
+            and command in self.data
+            and _same_value(self.data[command], value)
+        ):
+            self._command_manager.record_skipped()
+            if journal is not None:
+                journal.discard(command)
+            return COMMAND_CONFIRMED
+        else:
+            queued = await self._command_manager.submit(command, value)
+            self._watched_keys[command] = time.monotonic() + COMMAND_WATCH_PERIOD
+
+        # Only the latest write to a key is confirmed; callers of writes it
+        # superseded receive its outcome.
+        while True:
+            await asyncio.shield(queued.future)
+            latest = self._command_manager.latest(command)
+            if latest is not None and latest is not queued:
+                queued = latest
+                continue
+            if not queued.future.result():
+                if journal is not None and journal.record(command, queued.value):
+                    return COMMAND_JOURNALED
+                return COMMAND_FAILED
+            if journal is not None:
+                journal.discard(command)
+            if queued.confirmation is None:
+                queued.confirmation = self._create_io_task(
+                    self._async_confirm(command, queued),
+                    f"Eveus confirm {command} {self.host}",
+                )
+            result = await asyncio.shield(queued.confirmation)
+            if result != COMMAND_SUPERSEDED:
+                return result
+
+    async def _async_confirm(self, command: str, queued: Any) -> str:
+        """Poll in a short burst until the charger reports the written value.
+
+        Stops as soon as a later write to the same key supersedes this one.
+        Confirmation polls do not feed the poll interval controller.
+        """
+        _CONFIRMATION_POLL.set(True)
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        reported_other = False
+        for delay in COMMAND_CONFIRM_DELAYS:
+            await asyncio.sleep(max(sent_at + delay - loop.time(), 0))
+            if self._command_manager.latest(command) is not queued:
+                return COMMAND_SUPERSEDED
+            await self.async_refresh()
+            if not self.last_update_success or not self.data or command not in self.data:
+                continue
+            if _same_value(self.data[command], queued.value):
+                return COMMAND_CONFIRMED
+            reported_other = True
+
+        result = COMMAND_REJECTED if reported_other else COMMAND_TIMED_OUT
+        _LOGGER.debug(
+            "Command %s=%s on %s was %s", command, queued.value, self.host, result
+        )
+        return result
+
+    async def _async_replay_journal(self) -> None:
+        """Replay journaled commands now that the charger answers again."""
+        journal = self.command_journal
+        if journal is None:
+            return
+        for entry in journal.due():
+            _LOGGER.info(
+                "Replaying journaled %s=%s to %s", entry.command, entry.value, self.host
+            )
+            result = await self.async_write(entry.command, entry.value)
+            if result in (COMMAND_FAILED, COMMAND_JOURNALED):
+                return
+            journal.record_replayed()
+
+    async def async_load_state(self) -> None:
+        """Restore learned state saved before the last shutdown."""
+        if self._state_store is None:
+            return
+        state = await self._state_store.async_load()
+        timeouts = state.get("timeouts") or {}
+        self.poll_timeout.restore(timeouts.get("poll"))
+        self.command_timeout.restore(timeouts.get("command"))
+        self.connection_pool.resolver.restore(state.get("address"), self.host)
+        self._last_unload = state.get("unload")
+        self._restore_snapshot(state.get("snapshot"))
+
+    def seed_data(self, data: dict[str, Any], fetched_at: float) -> None:
+        """Use a fresh payload fetched elsewhere in place of the first refresh.
+
+        The next poll is scheduled one interval after the fetch time.
+        """
+        self.data = data
+        self.last_update_success = True
+        self._last_success_time = self._data_time = fetched_at
+        self._polled_at = time.monotonic() - max(time.time() - fetched_at, 0.0)
+        self._snapshot_time = None
+        interval = self.interval_controller.next_interval(data)
+        self.update_interval = timedelta(
+            seconds=max(interval - (time.time() - fetched_at), 1)
+        )
+        if self._state_store is not None:
+            self._state_store.async_schedule_save()
+
+    def _restore_snapshot(self, snapshot: dict[str, Any] | None) -> None:
+        """Start from the last good payload, marked stale until a live poll."""
+        if not snapshot or not isinstance(snapshot.get("data"), dict):
+            return
+        try:
+            saved_at = float(snapshot["time"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if time.time() - saved_at > SNAPSHOT_MAX_AGE:
+            return
+        self.data = snapshot["data"]
+        self._data_time = self._snapshot_time = saved_at
+
+    def _state_to_save(self) -> dict[str, Any]:
+        """Return learned state to persist."""
+        return {
+            "timeouts": {
+                "poll": self.poll_timeout.as_dict(),
+                "command": self.command_timeout.as_dict(),
+            },
+            "address": self.connection_pool.resolver.as_dict(),
+            "unload": self._last_unload,
+            "snapshot": (
+                {
+                    "time": self._data_time,
+                    "data": {
+                        key: value
+                        for key, value in self.data.items()
+                        if isinstance(value, (str, int, float))
+                    },
+                }
+                if self.data and self._data_time is not None
+                else None
+            ),
+        }
+
+    def _create_io_task(
+        self, coro: Coroutine[Any, Any, _T], name: str
+    ) -> asyncio.Task[_T]:
+        """Start charger I/O in a task that unload cancels."""
+        if self.config_entry is not None:
+            task = self.config_entry.async_create_background_task(
+                self.hass, coro, name, eager_start=False
+            )
+        else:
+            task = self.hass.async_create_background_task(coro, name, eager_start=False)
+        self._io_tasks.add(task)
+        task.add_done_callback(self._io_tasks.discard)
+        return task
+
     async def async_shutdown(self) -> None:
-        """Compatibility hook for older unload code paths."""
-        return None
+        """Stop polling, cancel charger I/O, close the pool and save state.
+
+        Polls, commands, confirmation bursts and journal replays in progress
+        are cancelled rather than left to run into their timeouts.
+        """
+        started = time.perf_counter()
+        await super().async_shutdown()
+
+        tasks = {task for task in self._io_tasks if task is not asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=UNLOAD_CANCEL_TIMEOUT)
+        await self.connection_pool.async_close()
+        if not self._io_scheduler_released:
+            self._io_scheduler_released = True
+            async_release_io_scheduler(self.hass, self.host)
+
+        self._last_unload = {
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "cancelled": len(tasks),
+        }
+        _LOGGER.debug(
+            "Shut down %s in %.1f ms, cancelled %d requests",
+            self.host,
+            self._last_unload["duration_ms"],
+            len(tasks),
+        )
+        if self.command_journal is not None:
+            await self.command_journal.async_flush()
+        if self._state_store is not None:
+            await self._state_store.async_flush()
 
     def _should_log(self) -> bool:
         """Rate-limit availability logging."""
@@ -120,30 +1212,62 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         self._success_count += 1
         self._total_count += 1
         self._consecutive_failures = 0
-        self._last_success_time = time.time()
+        self._last_success_time = self._data_time = time.time()
+        if self._snapshot_time is not None:
+            # Every entity rendered the snapshot, so all of them refresh.
+            self._snapshot_time = None
+            self._changed_keys = None
         self._latency_samples.append(response_time)
+        self._telemetry.record_success(response_time)
+        self.poll_timeout.record_success(response_time)
+        if self._state_store is not None:
+            self._state_store.async_schedule_save()
         self._silent_mode = False
         self._offline_announced = False
         self._last_error = None
+        self.connection_pool.record_success()
+        if self.breaker.state != BREAKER_CLOSED:
+            _LOGGER.info("Device %s is reachable again", self.host)
+        self.breaker.record_success()
+        self._tcp_reachable = None
+
+        if (
+            self.command_journal is not None
+            and self.command_journal.pending
+            and (self._replay_task is None or self._replay_task.done())
+        ):
+            self._replay_task = self._create_io_task(
+                self._async_replay_journal(), f"Eveus journal replay {self.host}"
+            )
 
-        is_charging = get_safe_value(new_data, "state", int) == 4
-        is_active = get_safe_value(new_data, "powerMeas", float, 0) > 100
-        interval = CHARGING_UPDATE_INTERVAL if is_charging or is_active else IDLE_UPDATE_INTERVAL
-        self.update_interval = timedelta(seconds=interval)
+        if not _CONFIRMATION_POLL.get():
+            self.update_interval = timedelta(
+                seconds=self.interval_controller.next_interval(new_data)
+            )
 
     def _record_failure(self, error: Exception) -> None:
         """Record a failed poll and tune retry cadence."""
         self._total_count += 1
         self._consecutive_failures += 1
         self._last_error = type(error).__name__
+        error_class = classify_error(error)
+        self._telemetry.record_failure(error_class)
+        if error_class == ERROR_TIMEOUT:
+            self.poll_timeout.record_timeout()
+        else:
+            self.poll_timeout.record_failure()
+        self.connection_pool.record_error(error)
+        self.breaker.record_failure()
 
         if self._consecutive_failures > 20:
             self._silent_mode = True
 
-        if self.is_likely_offline:
-            self.update_interval = timedelta(seconds=min(RETRY_DELAY * 4, 300))
+        if self.breaker.state == BREAKER_OPEN:
+            self.update_interval = timedelta(
+                seconds=max(min(self.breaker.retry_in(), TCP_PROBE_INTERVAL), 1)
+            )
             if not self._offline_announced:
-                _LOGGER.info("Device %s appears offline, reducing poll frequency", self.host)
+                _LOGGER.info("Device %s appears offline, backing off polls", self.host)
                 self._offline_announced = True
         else:
             self.update_interval = timedelta(seconds=IDLE_UPDATE_INTERVAL)
@@ -151,27 +1275,87 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         if not self._silent_mode and self._should_log():
             _LOGGER.debug("Connection issue with %s: %s", self.host, type(error).__name__)
 
+    @_owned_io(_unloaded_poll)
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch current device data."""
+        self._polled_at = time.monotonic()
+        if self.breaker.state != BREAKER_CLOSED:
+            was_reachable = self._tcp_reachable
+            if not await self._async_tcp_probe():
+                if self.breaker.allow_request():
+                    self.breaker.record_failure()
+                raise self._offline_failure()
+            if was_reachable is False:
+                _LOGGER.debug("Device %s accepts connections again, polling now", self.host)
+                self.breaker.half_open()
+            elif not self.breaker.allow_request():
+                raise self._offline_failure()
+
+        timeout = self.poll_timeout.timeout
+        if self.breaker.probing:
+            timeout = min(timeout, BREAKER_PROBE_TIMEOUT)
+        async with self.io_scheduler.slot(IO_PRIORITY_POLL):
+            return await self._async_fetch_main(timeout)
+
+    def _offline_failure(self) -> UpdateFailed:
+        """Schedule the next probe and return the error for a skipped poll."""
+        self.update_interval = timedelta(
+            seconds=max(min(self.breaker.retry_in(), TCP_PROBE_INTERVAL), 1)
+        )
+        return UpdateFailed(f"Device {self.host} is offline, waiting to retry")
+
+    async def _async_tcp_probe(self) -> bool:
+        """Check whether the charger's web server accepts TCP connections.
+
+        Only a successful probe after failed ones lets the breaker skip its
+        backoff; a charger that accepts sockets but fails HTTP keeps backing
+        off normally.
+        """
+        self._tcp_probes += 1
+        try:
+            async with self.io_scheduler.slot(IO_PRIORITY_PROBE):
+                async with asyncio.timeout(TCP_PROBE_TIMEOUT):
+                    address = await self.connection_pool.async_resolve()
+                    _, writer = await asyncio.open_connection(address, 80)
+                    writer.close()
+                    with suppress(OSError):
+                        await writer.wait_closed()
+        except (OSError, asyncio.TimeoutError):
+            self.connection_pool.resolver.invalidate()
+            self._tcp_reachable = False
+            return False
+
+        self._tcp_probe_successes += 1
+        self._tcp_reachable = True
+        return True
+
+    async def _async_fetch_main(self, timeout: float) -> dict[str, Any]:
+        """POST /main and decode the payload.
+
+        A request on a reused socket the charger already closed is retried
+        once on a new connection and is not counted as a failure.
+        """
         start_time = time.time()
 
         try:
-            async with self.get_session().post(
-                f"http://{self.host}/main",
-                auth=aiohttp.BasicAuth(self.username, self.password),
-                timeout=aiohttp.ClientTimeout(total=UPDATE_TIMEOUT),
-            ) as response:
-                if response.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid authentication")
-                response.raise_for_status()
-
-                text = await response.text()
-                new_data = json.loads(text)
-                if not isinstance(new_data, dict):
-                    raise ValueError(f"Expected dict, got {type(new_data).__name__}")
-
-                self._record_success(time.time() - start_time, new_data)
-                return new_data
+            try:
+                body = await self._async_read_main(timeout)
+            except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as err:
+                if not self.connection_pool.retry_on_fresh_connection(err):
+                    raise
+                body = await self._async_read_main(timeout)
+
+            decode_start = time.perf_counter()
+            try:
+                new_data = self._decoder.loads(body)
+            finally:
+                self._decode_samples.append(time.perf_counter() - decode_start)
+            if not isinstance(new_data, dict):
+                raise ValueError(f"Expected dict, got {type(new_data).__name__}")
+
+            self._changed_keys = diff_payload_keys(self.data, new_data)
+            self._record_success(time.time() - start_time, new_data)
+            return new_data
 
         except ConfigEntryAuthFailed:
             raise
@@ -186,3 +1370,24 @@ class EveusUpdater(DataUpdateCoordinator[dict[str, Any]]):
         ) as err:
             self._record_failure(err)
             raise UpdateFailed(f"Connection error with {self.host}: {err}") from err
+
+    async def _async_read_main(self, timeout: float) -> bytes:
+        """POST /main and return the raw response body."""
+        async with self.get_session().post(
+            f"http://{self.host}/main",
+            auth=aiohttp.BasicAuth(self.username, self.password),
+            headers=self.connection_pool.headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 401:
+                raise ConfigEntryAuthFailed("Invalid authentication")
+            response.raise_for_status()
+            return await response.read()
+
+
+def _same_value(current: Any, requested: Any) -> bool:
+    """Compare a device value with a command value, numerically when possible."""
+    try:
+        return float(current) == float(requested)
+    except (TypeError, ValueError):
+        return current == requested
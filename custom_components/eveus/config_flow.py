@@ -22,9 +22,21 @@ from .const import (
     DOMAIN,
     MODEL_16A,
     CONF_MODEL,
+    CONF_FLEET_HUB,
+    CONF_COMMAND_JOURNAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
     MODELS,
     MIN_CURRENT,
     MODEL_MAX_CURRENT,
+    IO_PRIORITY_POLL,
+)
+from .common_network import (
+    async_acquire_io_scheduler,
+    async_release_io_scheduler,
+    async_remember_validated_payload,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -152,11 +164,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     except vol.Invalid as err:
         raise InvalidInput(str(err))
 
+    # Held only for this request; a flow that never creates an entry must
+    # not leave a scheduler behind for its host.
+    scheduler = async_acquire_io_scheduler(hass, normalized_data[CONF_HOST])
     try:
         session = aiohttp_client.async_get_clientsession(hass)
         timeout = aiohttp.ClientTimeout(total=10)
 
-        async with session.post(
+        async with scheduler.slot(IO_PRIORITY_POLL), session.post(
             f"http://{normalized_data[CONF_HOST]}/main",
             auth=aiohttp.BasicAuth(
                 normalized_data[CONF_USERNAME],
@@ -174,6 +189,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
                 raise CannotConnect("Invalid response format")
 
             device_info = validate_device_response(result, normalized_data[CONF_MODEL])
+            async_remember_validated_payload(hass, normalized_data[CONF_HOST], result)
 
             return {
                 "title": f"Eveus Charger ({normalized_data[CONF_HOST]})",
@@ -192,6 +208,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     except Exception as err:
         _LOGGER.exception("Unexpected error: %s", str(err))
         raise CannotConnect(f"Unexpected error: {err}") from err
+    finally:
+        async_release_io_scheduler(hass, normalized_data[CONF_HOST])
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -309,10 +327,43 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage basic options."""
+        errors = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_MIN_POLL_INTERVAL] > user_input[CONF_MAX_POLL_INTERVAL]:
+                errors["base"] = "invalid_poll_range"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
-        return self.async_show_form(step_id="init", data_schema=vol.Schema({}))
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_FLEET_HUB,
+                        default=options.get(CONF_FLEET_HUB, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_COMMAND_JOURNAL,
+                        default=options.get(CONF_COMMAND_JOURNAL, False),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
 
 
 class CannotConnect(HomeAssistantError):
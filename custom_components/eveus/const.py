@@ -14,12 +14,100 @@ UPDATE_TIMEOUT: Final[int] = 20
 COMMAND_TIMEOUT: Final[int] = 25
 ERROR_COOLDOWN: Final[int] = 300
 
+# Device I/O scheduling: lower priority values are served first
+IO_PRIORITY_SAFETY: Final[int] = 0
+IO_PRIORITY_COMMAND: Final[int] = 1
+IO_PRIORITY_POLL: Final[int] = 2
+IO_PRIORITY_PROBE: Final[int] = 3
+IO_PRIORITY_NAMES: Final = {
+    IO_PRIORITY_SAFETY: "safety",
+    IO_PRIORITY_COMMAND: "command",
+    IO_PRIORITY_POLL: "poll",
+    IO_PRIORITY_PROBE: "probe",
+}
+# Minimum idle gap the charger's web server needs between two requests
+IO_MIN_SPACING: Final[float] = 0.5
+# Commands that stop or start charging and jump ahead of other traffic
+SAFETY_COMMANDS: Final = frozenset({"evseEnabled"})
+
+# Adaptive request timeouts (seconds); ceilings are UPDATE_TIMEOUT / COMMAND_TIMEOUT
+TIMEOUT_FLOOR: Final[float] = 3.0
+
+# Circuit breaker
+BREAKER_FAILURE_THRESHOLD: Final[int] = 3
+BREAKER_BASE_DELAY: Final[int] = 30
+BREAKER_MAX_DELAY: Final[int] = 600
+BREAKER_PROBE_TIMEOUT: Final[int] = 5
+# TCP reachability probes while the breaker is open
+TCP_PROBE_INTERVAL: Final[int] = 10
+TCP_PROBE_TIMEOUT: Final[float] = 2.0
+
+# Adaptive polling
+DEFAULT_MIN_POLL_INTERVAL: Final[int] = 10
+DEFAULT_MAX_POLL_INTERVAL: Final[int] = 300
+POLL_FAST_POLLS_AFTER_TRANSITION: Final[int] = 3
+POLL_BACKOFF_FACTOR: Final[float] = 1.5
+POLL_ACTIVE_CAP: Final[int] = 90
+POLL_IDLE_CAP: Final[int] = 180
+POLL_POWER_EWMA_ALPHA: Final[float] = 0.3
+POLL_POWER_STABLE_DELTA: Final[float] = 50.0
+POLL_NIGHT_START_HOUR: Final[int] = 23
+POLL_NIGHT_END_HOUR: Final[int] = 6
+
+# Per-charger connection pool
+POOL_CONNECTIONS_PER_HOST: Final[int] = 2
+# Idle sockets are closed after this long, well below the idle timeout of
+# the charger's web server, so a reused socket is rarely one it already
+# dropped. Polls are further apart; reuse mainly serves command and
+# confirmation bursts. Firmware that still drops them is switched to
+# Connection: close.
+POOL_KEEPALIVE_TIMEOUT: Final[int] = 10
+POOL_IDLE_DROP_THRESHOLD: Final[int] = 2
+# Resolved addresses of chargers configured by hostname are reused this long
+ADDRESS_PIN_TTL: Final[int] = 86400
+
+# Fleet hub scheduling
+FLEET_TICK_INTERVAL: Final[int] = 1
+FLEET_MAX_CONCURRENT_POLLS: Final[int] = 8
+FLEET_METRICS_WINDOW: Final[int] = 60
+
+# Startup admission: chargers doing their first refresh and entity setup at once
+STARTUP_MAX_CONCURRENT: Final[int] = 4
+STARTUP_PRIORITY_CHARGING: Final[int] = 0
+STARTUP_PRIORITY_DEFAULT: Final[int] = 1
+
 # Availability and resilience - optimized for WiFi connections
 AVAILABILITY_GRACE_PERIOD: Final[int] = 60
 CONTROL_GRACE_PERIOD: Final[int] = 30
 ERROR_LOG_RATE_LIMIT: Final[int] = 300
 STATE_CACHE_TTL: Final[int] = 60
 CONTROL_CACHE_TTL: Final[int] = 0
+# Longest a deadband-filtered sensor may go without a state write
+DEADBAND_MAX_SILENCE: Final[int] = 300
+# Minimum time between refreshes of periodic-tier sensors
+REFRESH_PERIODIC_INTERVAL: Final[int] = 300
+# Keys written by a command are dispatched on every refresh for this long
+COMMAND_WATCH_PERIOD: Final[int] = 10
+# Follow-up polls after a write, in seconds after the command was accepted
+COMMAND_CONFIRM_DELAYS: Final = (0.5, 1.5, 4.0)
+# Journaled commands: (priority, time to live in seconds); lower priority replays first
+JOURNAL_COMMANDS: Final = {
+    "evseEnabled": (0, 3600),
+    "oneCharge": (1, 1800),
+    "currentSet": (1, 1800),
+}
+JOURNAL_SAVE_DELAY: Final[int] = 1
+STORAGE_VERSION: Final[int] = 1
+# Learned per-charger state is written at most once per this many seconds
+STATE_SAVE_DELAY: Final[int] = 300
+# Saved payloads older than this are not used to start entities
+SNAPSHOT_MAX_AGE: Final[int] = 7 * 86400
+# A payload validated by the config flow seeds the first refresh this long
+SEED_MAX_AGE: Final[int] = 30
+# How long unload waits for cancelled charger requests to finish
+UNLOAD_CANCEL_TIMEOUT: Final[float] = 1.0
+# Commands that set a value reported back under the same key in /main
+STATEFUL_COMMANDS: Final = frozenset({"evseEnabled", "oneCharge", "currentSet"})
 
 # Current limits
 MIN_CURRENT: Final[int] = 7
@@ -36,6 +124,10 @@ MODEL_MAX_CURRENT: Final[Dict[str, int]] = {
 
 # Configuration
 CONF_MODEL: Final[str] = "model"
+CONF_FLEET_HUB: Final[str] = "fleet_hub"
+CONF_MIN_POLL_INTERVAL: Final[str] = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL: Final[str] = "max_poll_interval"
+CONF_COMMAND_JOURNAL: Final[str] = "command_journal"
 
 # Rate States
 RATE_STATES: Final[Dict[int, str]] = {
@@ -6,6 +6,7 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 
 from . import EveusConfigEntry
+from .common_fleet import DATA_STARTUP_ADMISSION
 
 TO_REDACT = {"password", "username"}
 
@@ -26,6 +27,7 @@ async def async_get_config_entry_diagnostics(
     runtime_data = entry.runtime_data
     updater = runtime_data.updater
     data = updater.data or {}
+    admission = hass.data.get(DATA_STARTUP_ADMISSION)
 
     return {
         "entry": {
@@ -42,7 +44,27 @@ async def async_get_config_entry_diagnostics(
             ),
             "connection_quality": updater.connection_quality,
             "is_likely_offline": updater.is_likely_offline,
+            "snapshot_age": updater.snapshot_age,
+            "dispatch": updater.dispatch_stats,
+            "polling": updater.interval_controller.state,
+            "breaker": updater.breaker.diagnostics,
+            "probe": updater.probe_stats,
+            "address": updater.connection_pool.resolver.metrics,
+            "commands": updater.command_stats,
+            "io": updater.io_scheduler.metrics,
+            "lifecycle": updater.lifecycle_stats,
         },
+        "fleet": updater.fleet_hub.metrics if updater.fleet_hub is not None else None,
+        "startup": (
+            {**admission.metrics, "setup_wait": admission.setup_wait(entry.entry_id)}
+            if admission is not None
+            else None
+        ),
+        "journal": (
+            updater.command_journal.diagnostics
+            if updater.command_journal is not None
+            else None
+        ),
         "device": {
             "firmware": data.get("verFWMain"),
             "wifi_firmware": data.get("verFWWifi"),
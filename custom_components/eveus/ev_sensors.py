@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Optional, Dict, Set, List
+from typing import Any, Callable, Optional, Dict, Set, List
 from functools import lru_cache
 from dataclasses import dataclass
 
@@ -12,12 +12,12 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import UnitOfEnergy
-from homeassistant.core import HomeAssistant, callback, Event
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback, Event
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.entity import EntityCategory
 
 from .common import EveusSensorBase
-from .utils import get_safe_value, calculate_remaining_time
+from .utils import calculate_remaining_time
 from .const import STATE_CACHE_TTL
 
 _LOGGER = logging.getLogger(__name__)
@@ -162,6 +162,42 @@ class CachedSOCCalculator:
 _soc_calculator = CachedSOCCalculator()
 
 
+def helpers_exist(hass: HomeAssistant) -> bool:
+    """Return True when every input_number helper has a state."""
+    return all(hass.states.get(entity_id) is not None for entity_id in _ALL_INPUTS)
+
+
+@callback
+def async_call_when_helpers_exist(
+    hass: HomeAssistant, action: Callable[[], Any]
+) -> CALLBACK_TYPE:
+    """Run action once every helper exists; return a callback that cancels it."""
+    remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_cancel() -> None:
+        nonlocal remove_listener
+        if remove_listener is not None:
+            remove_listener()
+            remove_listener = None
+
+    @callback
+    def _async_on_helper_change(event: Event) -> None:
+        if remove_listener is None or not helpers_exist(hass):
+            return
+        _async_cancel()
+        _soc_calculator.invalidate_cache()
+        action()
+
+    if helpers_exist(hass):
+        action()
+    else:
+        remove_listener = async_track_state_change_event(
+            hass, _ALL_INPUTS, _async_on_helper_change
+        )
+    return _async_cancel
+
+
 # =============================================================================
 # Common base for EV helper-dependent sensors
 # =============================================================================
@@ -170,6 +206,7 @@ class BaseEVHelperSensor(EveusSensorBase):
     """Base class for sensors that depend on input_number helpers."""
 
     _tracked_inputs: List[str] = []
+    DATA_KEYS = frozenset({"IEM1"})
 
     def __init__(self, updater, device_number: int = 1) -> None:
         """Initialize EV helper sensor."""
@@ -216,7 +253,7 @@ class BaseEVHelperSensor(EveusSensorBase):
     def _get_energy_charged(self) -> float:
         """Get energy charged from updater data with fallback."""
         return (
-            get_safe_value(self._updater.data, "IEM1", float, default=0)
+            self._updater.reading.IEM1
             or self.get_cached_data_value("IEM1", 0)
         )
 
@@ -276,6 +313,7 @@ class TimeToTargetSocSensor(BaseEVHelperSensor):
     _attr_icon = "mdi:timer"
 
     _tracked_inputs = [_INPUT_TARGET_SOC, _INPUT_BATTERY_CAPACITY, _INPUT_SOC_CORRECTION]
+    DATA_KEYS = frozenset({"IEM1", "powerMeas"})
 
     def __init__(self, updater, device_number: int = 1) -> None:
         """Initialize with default cached value."""
@@ -289,7 +327,7 @@ class TimeToTargetSocSensor(BaseEVHelperSensor):
 
         try:
             power_meas = (
-                get_safe_value(self._updater.data, "powerMeas", float, default=0)
+                self._updater.reading.powerMeas
                 or self.get_cached_data_value("powerMeas", 0)
             )
             energy_charged = self._get_energy_charged()
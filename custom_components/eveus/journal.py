@@ -0,0 +1,173 @@
+"""Persistent journal of commands that could not reach an Eveus charger."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import logging
+import time
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    JOURNAL_COMMANDS,
+    JOURNAL_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _journal_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding one charger's command journal."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.command_journal")
+
+
+async def async_remove_journal(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the journal of a removed charger, pending commands included."""
+    await _journal_store(hass, entry_id).async_remove()
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """A command waiting to be replayed."""
+
+    command: str
+    value: Any
+    priority: int
+    created: float
+    expires: float
+
+
+class CommandJournal:
+    """Keep the latest undelivered value of journaled commands across restarts.
+
+    Only commands listed in JOURNAL_COMMANDS are journaled. Each command key
+    holds at most one entry, so a newer value replaces an older one and the
+    journal never holds more entries than there are journaled commands.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the journal."""
+        self._store = _journal_store(hass, entry_id)
+        self._entries: dict[str, JournalEntry] = {}
+        self._replayed = 0
+        self._expired = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of commands waiting for replay."""
+        return len(self._entries)
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Journal state for diagnostics.
+
+        Expired entries are left out but not pruned, so reading diagnostics
+        never changes or saves the journal.
+        """
+        now = time.time()
+        entries = self._ordered(
+            entry for entry in self._entries.values() if entry.expires > now
+        )
+        return {
+            "pending": len(entries),
+            "oldest_age": (
+                round(now - min(entry.created for entry in entries), 1)
+                if entries
+                else None
+            ),
+            "replayed": self._replayed,
+            "expired": self._expired,
+            "commands": [
+                {
+                    "command": entry.command,
+                    "priority": entry.priority,
+                    "age": round(now - entry.created, 1),
+                }
+                for entry in entries
+            ],
+        }
+
+    async def async_load(self) -> None:
+        """Load journaled commands saved before the last shutdown."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for raw in stored.get("commands", []):
+            try:
+                entry = JournalEntry(**raw)
+            except TypeError:
+                _LOGGER.debug("Dropping malformed journal entry %s", raw)
+                continue
+            self._entries[entry.command] = entry
+        self._prune(time.time())
+
+    async def async_flush(self) -> None:
+        """Write pending changes to storage immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_clear(self) -> None:
+        """Drop every journaled command, in memory and in storage."""
+        self._entries.clear()
+        await self._store.async_remove()
+
+    def record(self, command: str, value: Any) -> bool:
+        """Journal a command that could not be delivered."""
+        policy = JOURNAL_COMMANDS.get(command)
+        if policy is None:
+            return False
+
+        existing = self._entries.get(command)
+        if existing is not None and existing.value == value:
+            return True
+
+        priority, ttl = policy
+        now = time.time()
+        self._entries[command] = JournalEntry(command, value, priority, now, now + ttl)
+        self._prune(now)
+        self._schedule_save()
+        return True
+
+    def discard(self, command: str) -> None:
+        """Forget a command once delivered or superseded."""
+        if self._entries.pop(command, None) is not None:
+            self._schedule_save()
+
+    def supersede(self, command: str, value: Any) -> None:
+        """Forget a journaled command that a newer write replaces."""
+        entry = self._entries.get(command)
+        if entry is not None and entry.value != value:
+            self.discard(command)
+
+    def record_replayed(self) -> None:
+        """Count a journaled command delivered on reconnect."""
+        self._replayed += 1
+
+    def due(self, now: float | None = None) -> list[JournalEntry]:
+        """Return unexpired entries in replay order."""
+        if self._prune(time.time() if now is None else now):
+            self._schedule_save()
+        return self._ordered(self._entries.values())
+
+    @staticmethod
+    def _ordered(entries: Iterable[JournalEntry]) -> list[JournalEntry]:
+        """Sort entries by priority, then age."""
+        return sorted(entries, key=lambda entry: (entry.priority, entry.created))
+
+    def _prune(self, now: float) -> bool:
+        """Drop expired entries."""
+        expired = [key for key, entry in self._entries.items() if entry.expires <= now]
+        for key in expired:
+            del self._entries[key]
+        self._expired += len(expired)
+        return bool(expired)
+
+    def _schedule_save(self) -> None:
+        """Persist the journal shortly, batching bursts of changes."""
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the journal in storage format."""
+        return {"commands": [asdict(entry) for entry in self._entries.values()]}
@@ -1,9 +1,9 @@
-"""Support for Eveus number entities with optimistic UI and safety."""
+"""Support for Eveus number entities with confirmed writes and safety."""
 from __future__ import annotations
 
 import logging
-import asyncio
 import time
+from functools import partial
 from typing import Optional
 
 from homeassistant.components.number import (
@@ -26,14 +26,11 @@ from .const import (
     CONF_MODEL,
     CONTROL_GRACE_PERIOD,
 )
-from .common import BaseEveusEntity
-from .utils import get_safe_value
+from .common import BaseEveusEntity, PayloadEntityAdder
+from .common_command import COMMAND_CONFIRMED
 
 _LOGGER = logging.getLogger(__name__)
 
-# How long to trust user's command before requiring device confirmation
-OPTIMISTIC_VALUE_TTL = 120
-
 CHARGING_CURRENT_DESCRIPTION = NumberEntityDescription(
     key="charging_current",
     name="Charging Current",
@@ -64,8 +61,6 @@ class EveusNumberEntity(BaseEveusEntity, NumberEntity):
         super().__init__(updater, device_number)
 
         self._pending_value: Optional[float] = None
-        self._optimistic_value: Optional[float] = None
-        self._optimistic_value_time: float = 0
         self._last_device_value: Optional[float] = None
         self._last_command_time = 0
         self._last_successful_read = 0
@@ -89,7 +84,6 @@ class EveusNumberEntity(BaseEveusEntity, NumberEntity):
                     self.unique_id, unavailable_duration,
                 )
             self._last_known_available = False
-            self._optimistic_value = None
             return False
 
         if self._unavailable_since is not None:
@@ -110,43 +104,31 @@ class EveusCurrentNumber(EveusNumberEntity):
 
     ENTITY_NAME = "Charging Current"
     _command = "currentSet"
+    DATA_KEYS = frozenset({_command})
 
     def __init__(self, updater, model: str, device_number: int = 1) -> None:
         """Initialize the current control."""
         super().__init__(updater, CHARGING_CURRENT_DESCRIPTION, device_number)
         self._model = model
-        self._command_lock = asyncio.Lock()
+        self._write_sequence = 0
 
         self._attr_native_min_value = float(MIN_CURRENT)
         self._attr_native_max_value = float(MODEL_MAX_CURRENT[model])
 
     @property
     def native_value(self) -> float | None:
-        """Return current value with optimistic UI."""
+        """Return the pending value during a write, otherwise the device value."""
         current_time = time.time()
 
         if self._pending_value is not None:
             return self._pending_value
 
-        if self._optimistic_value is not None:
-            if current_time - self._optimistic_value_time < OPTIMISTIC_VALUE_TTL:
-                return self._optimistic_value
-            self._optimistic_value = None
-
-        if self._updater.available and self._updater.data:
-            if self._command in self._updater.data:
-                device_value = get_safe_value(self._updater.data, self._command, float)
-                if device_value is not None:
-                    new_device_value = float(device_value)
-                    self._last_device_value = new_device_value
-                    self._last_successful_read = current_time
-
-                    if (
-                        self._optimistic_value is not None
-                        and abs(self._optimistic_value - new_device_value) > 0.5
-                    ):
-                        self._optimistic_value = None
-                    return new_device_value
+        if self._updater.available:
+            device_value = getattr(self._updater.reading, self._command)
+            if device_value is not None:
+                self._last_device_value = device_value
+                self._last_successful_read = current_time
+                return device_value
 
         if self._last_device_value is not None:
             if current_time - self._last_successful_read < CONTROL_GRACE_PERIOD:
@@ -155,32 +137,38 @@ class EveusCurrentNumber(EveusNumberEntity):
         return None
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set new current value with optimistic UI."""
-        async with self._command_lock:
-            try:
-                clamped_value = max(
-                    self._attr_native_min_value,
-                    min(self._attr_native_max_value, value),
-                )
-                int_value = int(clamped_value)
-
-                self._pending_value = float(int_value)
-                self.async_write_ha_state()
+        """Set new current value, showing it as pending until confirmed.
+
+        Calls are not serialized here: each goes straight to the command
+        queue, where a burst of slider changes merges into the latest value.
+        """
+        clamped_value = max(
+            self._attr_native_min_value,
+            min(self._attr_native_max_value, value),
+        )
+        int_value = int(clamped_value)
+
+        self._pending_value = float(int_value)
+        self._write_sequence += 1
+        write_sequence = self._write_sequence
+        self.async_write_ha_state()
 
-                success = await self._updater.send_command(self._command, int_value)
+        try:
+            result = await self._updater.async_write(self._command, int_value)
 
-                if success:
-                    self._optimistic_value = float(int_value)
-                    self._optimistic_value_time = time.time()
-                else:
-                    _LOGGER.warning("Failed to set %s to %dA", self.name, int_value)
+            if result != COMMAND_CONFIRMED:
+                _LOGGER.warning(
+                    "Failed to set %s to %dA (%s)", self.name, int_value, result
+                )
 
-            except Exception as err:
-                _LOGGER.error("Failed to set current value: %s", err)
-            finally:
+        except Exception as err:
+            _LOGGER.error("Failed to set current value: %s", err)
+        finally:
+            # A later call owns the pending value until it finishes
+            if write_sequence == self._write_sequence:
                 self._pending_value = None
-                self._last_command_time = time.time()
-                self.async_write_ha_state()
+            self._last_command_time = time.time()
+            self.async_write_ha_state()
 
     async def _async_restore_state(self, state: State) -> None:
         """Restore previous display value only — no commands sent on startup."""
@@ -197,19 +185,11 @@ class EveusCurrentNumber(EveusNumberEntity):
         """Handle updated data — reconcile with device value."""
         current_time = time.time()
 
-        if self._updater.available and self._updater.data:
-            if self._command in self._updater.data:
-                device_value = get_safe_value(self._updater.data, self._command, float)
-                if device_value is not None:
-                    new_device_value = float(device_value)
-                    self._last_device_value = new_device_value
-                    self._last_successful_read = current_time
-
-                    if self._optimistic_value is not None:
-                        if abs(self._optimistic_value - new_device_value) < 0.5:
-                            self._optimistic_value = None
-                        elif current_time - self._optimistic_value_time > 10:
-                            self._optimistic_value = None
+        if self._updater.available:
+            device_value = getattr(self._updater.reading, self._command)
+            if device_value is not None:
+                self._last_device_value = device_value
+                self._last_successful_read = current_time
 
         self.async_write_ha_state()
 
@@ -229,8 +209,14 @@ async def async_setup_entry(
         _LOGGER.error("No model specified in config")
         return
 
-    entities = [
-        EveusCurrentNumber(updater, model, device_number),
-    ]
-
-    async_add_entities(entities)
+    adder = PayloadEntityAdder(
+        updater,
+        async_add_entities,
+        [
+            (
+                EveusCurrentNumber.DATA_KEYS,
+                partial(EveusCurrentNumber, updater, model, device_number),
+            ),
+        ],
+    )
+    entry.async_on_unload(adder.async_start())
@@ -0,0 +1,126 @@
+"""Poll interval controllers for Eveus chargers."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CHARGING_UPDATE_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    IDLE_UPDATE_INTERVAL,
+    POLL_ACTIVE_CAP,
+    POLL_BACKOFF_FACTOR,
+    POLL_FAST_POLLS_AFTER_TRANSITION,
+    POLL_IDLE_CAP,
+    POLL_NIGHT_END_HOUR,
+    POLL_NIGHT_START_HOUR,
+    POLL_POWER_EWMA_ALPHA,
+    POLL_POWER_STABLE_DELTA,
+)
+from .utils import get_safe_value
+
+STATE_STANDBY = 2
+STATE_CHARGING = 4
+
+
+class PollIntervalController(ABC):
+    """Decide how long to wait before the next poll of a charger."""
+
+    def __init__(
+        self,
+        floor: float = DEFAULT_MIN_POLL_INTERVAL,
+        ceiling: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the controller with interval bounds."""
+        self.set_bounds(floor, ceiling)
+
+    def set_bounds(self, floor: float, ceiling: float) -> None:
+        """Change the interval bounds."""
+        self.floor = float(floor)
+        self.ceiling = float(max(floor, ceiling))
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Controller state for diagnostics."""
+        return {"floor": self.floor, "ceiling": self.ceiling}
+
+    @abstractmethod
+    def next_interval(self, data: dict[str, Any], now: datetime | None = None) -> float:
+        """Return the next poll interval in seconds for a fresh payload."""
+
+    def _clamp(self, interval: float) -> float:
+        """Keep an interval within the configured bounds."""
+        return max(self.floor, min(self.ceiling, interval))
+
+
+class AdaptivePollController(PollIntervalController):
+    """Poll fast around state changes and back off while power is stable."""
+
+    def __init__(
+        self,
+        floor: float = DEFAULT_MIN_POLL_INTERVAL,
+        ceiling: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the adaptive controller."""
+        super().__init__(floor, ceiling)
+        self._interval = float(IDLE_UPDATE_INTERVAL)
+        self._last_state: int | None = None
+        self._last_power: float | None = None
+        self._power_ewma: float | None = None
+        self._fast_polls_left = 0
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Controller state for diagnostics."""
+        return {
+            **super().state,
+            "interval": self._interval,
+            "power_delta_ewma": self._power_ewma,
+            "fast_polls_left": self._fast_polls_left,
+        }
+
+    def next_interval(self, data: dict[str, Any], now: datetime | None = None) -> float:
+        """Return the next poll interval in seconds for a fresh payload."""
+        state = get_safe_value(data, "state", int)
+        power = get_safe_value(data, "powerMeas", float, 0)
+
+        if self._last_state is not None and state != self._last_state:
+            self._fast_polls_left = POLL_FAST_POLLS_AFTER_TRANSITION
+        if self._last_power is not None:
+            delta = abs(power - self._last_power)
+            self._power_ewma = (
+                delta
+                if self._power_ewma is None
+                else POLL_POWER_EWMA_ALPHA * delta
+                + (1 - POLL_POWER_EWMA_ALPHA) * self._power_ewma
+            )
+        self._last_state = state
+        self._last_power = power
+
+        stable = self._power_ewma is not None and self._power_ewma < POLL_POWER_STABLE_DELTA
+        active = state == STATE_CHARGING or power > 100
+
+        if self._fast_polls_left:
+            self._fast_polls_left -= 1
+            interval = self.floor
+        elif state == STATE_STANDBY and stable and _is_night(now or dt_util.now()):
+            interval = self.ceiling
+        else:
+            base = CHARGING_UPDATE_INTERVAL if active else IDLE_UPDATE_INTERVAL
+            if stable:
+                cap = POLL_ACTIVE_CAP if active else POLL_IDLE_CAP
+                interval = min(max(self._interval, base) * POLL_BACKOFF_FACTOR, cap)
+            else:
+                interval = base
+
+        self._interval = self._clamp(interval)
+        return self._interval
+
+
+def _is_night(now: datetime) -> bool:
+    """Return True during the overnight standby window."""
+    return now.hour >= POLL_NIGHT_START_HOUR or now.hour < POLL_NIGHT_END_HOUR
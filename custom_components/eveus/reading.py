@@ -0,0 +1,71 @@
+"""Typed view of an Eveus /main payload, parsed once per poll."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+# Payload key -> (converter, decimal places to round to, or None to keep).
+# Covers every key that sensor specs and controls read; keys are valid
+# identifiers, so they double as slot names.
+PAYLOAD_FIELDS: dict[str, tuple[Callable[[Any], Any], int | None]] = {
+    # Measurements
+    "voltMeas1": (float, 0),
+    "curMeas1": (float, 1),
+    "powerMeas": (float, 1),
+    "currentSet": (float, 0),
+    # Energy and money counters
+    "sessionEnergy": (float, 2),
+    "totalEnergy": (float, 2),
+    "IEM1": (float, 2),
+    "IEM2": (float, 2),
+    "IEM1_money": (float, 2),
+    "IEM2_money": (float, 2),
+    # Rates, in hundredths of the currency unit
+    "tarif": (float, None),
+    "tarifAValue": (float, None),
+    "tarifBValue": (float, None),
+    "activeTarif": (int, None),
+    "tarifAEnable": (int, None),
+    "tarifBEnable": (int, None),
+    # Diagnostics
+    "temperature1": (float, 0),
+    "temperature2": (float, 0),
+    "vBat": (float, 2),
+    "state": (int, None),
+    "subState": (int, None),
+    "ground": (int, None),
+    "sessionTime": (int, None),
+    "systemTime": (int, None),
+    # Controls
+    "evseEnabled": (int, None),
+    "oneCharge": (int, None),
+}
+
+_FIELD_TABLE = tuple(
+    (key, converter, precision) for key, (converter, precision) in PAYLOAD_FIELDS.items()
+)
+_EMPTY_VALUES = (None, "unknown", "unavailable", "")
+
+
+class ChargerReading:
+    """Converted and rounded payload fields; missing or invalid fields are None."""
+
+    __slots__ = tuple(PAYLOAD_FIELDS)
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Parse a /main payload."""
+        get = (data or {}).get
+        for key, converter, precision in _FIELD_TABLE:
+            value = get(key)
+            if value in _EMPTY_VALUES:
+                value = None
+            else:
+                try:
+                    value = converter(value)
+                    if precision is not None:
+                        value = round(value, precision)
+                except (TypeError, ValueError):
+                    value = None
+            setattr(self, key, value)
+
+
+EMPTY_READING = ChargerReading()
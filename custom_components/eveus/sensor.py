@@ -2,22 +2,27 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from functools import partial
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import EveusConfigEntry
-from .sensor_definitions import get_sensor_specifications
+from .common import PayloadEntityAdder
+from .sensor_definitions import SENSOR_REGISTRY
 from .ev_sensors import (
     EVSocKwhSensor,
     EVSocPercentSensor,
     TimeToTargetSocSensor,
     InputEntitiesStatusSensor,
+    async_call_when_helpers_exist,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+EV_HELPER_SENSORS = (EVSocKwhSensor, EVSocPercentSensor, TimeToTargetSocSensor)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: EveusConfigEntry,
@@ -29,35 +34,43 @@ async def async_setup_entry(
         updater = runtime_data.updater
         device_number = runtime_data.device_number
 
-        # Create all sensors efficiently using factory pattern
-        sensors = []
-        
-        # Create standard sensors from specifications
-        sensor_specs = get_sensor_specifications()
-        standard_sensors = [spec.create_sensor(updater, device_number) for spec in sensor_specs]
-        sensors.extend(standard_sensors)
-        
-        # Create EV-specific optimized sensors
-        ev_sensors = [
-            EVSocKwhSensor(updater, device_number),
-            EVSocPercentSensor(updater, device_number),
-            TimeToTargetSocSensor(updater, device_number),
-            InputEntitiesStatusSensor(updater, device_number),
-        ]
-        sensors.extend(ev_sensors)
-        
-        # Add all sensors at once for efficiency
-        async_add_entities(sensors, update_before_add=False)
-        
+        # Spec sensors appear once the charger reports the fields they read
+        standard = PayloadEntityAdder(
+            updater, async_add_entities, SENSOR_REGISTRY.candidates(updater, device_number)
+        )
+        entry.async_on_unload(standard.async_start())
+        for field, keys in SENSOR_REGISTRY.unreported(updater.data or {}).items():
+            _LOGGER.debug(
+                "%s does not report %s yet; waiting sensors: %s",
+                entry.title,
+                field,
+                ", ".join(keys),
+            )
+
+        async_add_entities([InputEntitiesStatusSensor(updater, device_number)])
+
+        # SOC sensors additionally need the input_number helpers
+        ev_helpers = PayloadEntityAdder(
+            updater,
+            async_add_entities,
+            [
+                (sensor_class.DATA_KEYS, partial(sensor_class, updater, device_number))
+                for sensor_class in EV_HELPER_SENSORS
+            ],
+        )
+        entry.async_on_unload(ev_helpers.async_stop)
+        entry.async_on_unload(
+            async_call_when_helpers_exist(hass, ev_helpers.async_start)
+        )
+
         _LOGGER.info(
-            "Successfully created %d sensors (%d standard, %d EV-specific) for %s (device %d)",
-            len(sensors),
-            len(standard_sensors),
-            len(ev_sensors),
+            "Created %d sensors for %s (device %d); %d wait for payload fields or helpers",
+            standard.added + ev_helpers.added + 1,
             entry.title,
-            device_number
+            device_number,
+            standard.pending + ev_helpers.pending,
         )
-        
+
     except Exception as err:
         _LOGGER.error("Error setting up sensors for %s: %s", entry.title, err, exc_info=True)
         raise
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+from operator import attrgetter
 import time
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from enum import Enum
@@ -13,7 +16,7 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.const import (
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
@@ -22,6 +25,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
 from .common import EveusSensorBase
 from .const import (
@@ -29,9 +33,11 @@ from .const import (
     get_error_state,
     get_normal_substate,
     RATE_STATES,
+    DEADBAND_MAX_SILENCE,
+    REFRESH_PERIODIC_INTERVAL,
     ERROR_LOG_RATE_LIMIT,
 )
-from .utils import get_safe_value, is_dst, format_duration
+from .utils import is_dst, format_duration
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +64,37 @@ class SensorType(Enum):
     STATE = "state"
 
 
+class RefreshTier(Enum):
+    """How often a sensor processes coordinator updates."""
+    # Every update
+    REALTIME = "realtime"
+    # At most once per REFRESH_PERIODIC_INTERVAL; later changes are deferred
+    PERIODIC = "periodic"
+
+
+@dataclass(frozen=True)
+class Deadband:
+    """Smallest change worth a state write, and the longest silence allowed.
+
+    A change is significant when it reaches `absolute` or `relative` times
+    the last written value, whichever is larger. Changes to or from None or
+    zero are always significant.
+    """
+    absolute: float = 0.0
+    relative: float = 0.0
+    max_silence: float = DEADBAND_MAX_SILENCE
+
+    def is_significant(self, written: Any, value: Any) -> bool:
+        """Return True when value differs enough from the last written value."""
+        if written is None or value is None or (written == 0) != (value == 0):
+            return written != value
+        try:
+            delta = abs(value - written)
+        except TypeError:
+            return written != value
+        return delta > 0 and delta >= max(self.absolute, abs(written) * self.relative)
+
+
 @dataclass(frozen=True)
 class SensorSpec:
     """Immutable sensor specification for efficient sensor creation."""
@@ -72,25 +109,20 @@ class SensorSpec:
     precision: Optional[int] = None
     category: Optional[EntityCategory] = None
     attributes_fn: Optional[Callable] = None
-
-    def create_sensor(self, updater, device_number: int = 1) -> "OptimizedEveusSensor":
-        """Create sensor instance from specification."""
-        return OptimizedEveusSensor(updater, self, device_number)
+    data_keys: tuple[str, ...] = ()
+    deadband: Optional[Deadband] = None
+    refresh: RefreshTier = RefreshTier.REALTIME
 
 
 class OptimizedEveusSensor(EveusSensorBase):
-    """High-performance templated sensor."""
+    """High-performance templated sensor driven by a SENSOR_REGISTRY spec."""
 
     def __init__(self, updater, spec: SensorSpec, device_number: int = 1):
         """Initialize sensor from spec."""
         self.ENTITY_NAME = spec.name
-        super().__init__(updater, device_number)
-
-        self._spec = spec
-        self._cached_value = None
-        self._cache_timestamp = 0
-        self._cache_ttl = 30
-
+        # Shared per-spec field set, so keyed dispatch indexes one object
+        # per spec rather than one per charger
+        self.DATA_KEYS = SENSOR_REGISTRY.fields(spec.key) or None
         if spec.icon:
             self._attr_icon = spec.icon
         if spec.device_class:
@@ -103,6 +135,21 @@ class OptimizedEveusSensor(EveusSensorBase):
             self._attr_suggested_display_precision = spec.precision
         if spec.category:
             self._attr_entity_category = spec.category
+        super().__init__(updater, device_number)
+
+        self._spec = spec
+        self._cached_value = None
+        self._cache_timestamp = 0
+        self._cache_ttl = 30
+        # (available, stale, value) of the last write the deadband allowed
+        self._written: tuple[bool, bool, Any] | None = None
+        self._written_at = 0.0
+        self._silence_write: CALLBACK_TYPE | None = None
+        self.suppressed_writes = 0
+        # (available, stale) at the last refresh of a periodic sensor
+        self._refresh_inputs: tuple[bool, bool] | None = None
+        self._refreshed_at = 0.0
+        self._deferred_refresh: CALLBACK_TYPE | None = None
 
     def _get_sensor_value(self) -> Any:
         """Return cached or computed sensor value."""
@@ -134,10 +181,112 @@ class OptimizedEveusSensor(EveusSensorBase):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Clear derived cache when fresh coordinator data arrives."""
+        """Refresh per the spec's tier and write unless the change is insignificant."""
+        if self._spec.refresh is not RefreshTier.REALTIME and not self._refresh_due():
+            self._updater.record_deferred_update(self._spec.key)
+            return
+        self._cache_timestamp = 0
+        if self._spec.deadband is not None and self._within_deadband():
+            self.suppressed_writes += 1
+            self._updater.record_suppressed_write(self._spec.key)
+            if self._silence_write is None and self.hass is not None:
+                remaining = self._spec.deadband.max_silence - (
+                    time.monotonic() - self._written_at
+                )
+                self._silence_write = async_call_later(
+                    self.hass, max(remaining, 0), self._async_silence_elapsed
+                )
+            return
+        self._cancel_silence_write()
+        self.async_write_ha_state()
+
+    def _deadband_state(self) -> tuple[bool, bool, Any]:
+        """Return (available, stale, value) as the deadband compares them."""
+        available = self.available
+        stale = self._updater.snapshot_age is not None
+        return available, stale, self.native_value if available else None
+
+    def _within_deadband(self) -> bool:
+        """Return True when the new value is too close to the last written one.
+
+        Availability and stale-snapshot changes always write, as does the
+        first update after the deadband's maximum silence.
+        """
+        state = self._deadband_state()
+        now = time.monotonic()
+
+        written = self._written
+        if (
+            written is not None
+            and written[:2] == state[:2]
+            and now - self._written_at < self._spec.deadband.max_silence
+            and not self._spec.deadband.is_significant(written[2], state[2])
+        ):
+            return True
+
+        self._written = state
+        self._written_at = now
+        return False
+
+    @callback
+    def _async_silence_elapsed(self, _now: Any) -> None:
+        """Write a suppressed value once the deadband's maximum silence ends.
+
+        Entities are only notified when their own fields change, so a value
+        that settles inside the deadband would otherwise never be written.
+        """
+        self._silence_write = None
         self._cache_timestamp = 0
+        self._written = self._deadband_state()
+        self._written_at = time.monotonic()
         self.async_write_ha_state()
 
+    def _cancel_silence_write(self) -> None:
+        """Cancel a scheduled deadband silence write."""
+        if self._silence_write is not None:
+            self._silence_write()
+            self._silence_write = None
+
+    def _refresh_due(self) -> bool:
+        """Return True when a periodic sensor should process this update.
+
+        An update skipped inside the interval schedules one refresh for the
+        end of it, so the last change is never lost. Availability and
+        stale-snapshot changes are processed at once.
+        """
+        inputs = (self.available, self._updater.snapshot_age is not None)
+        now = time.monotonic()
+        remaining = REFRESH_PERIODIC_INTERVAL - (now - self._refreshed_at)
+        if inputs == self._refresh_inputs and remaining > 0:
+            if self._deferred_refresh is None and self.hass is not None:
+                self._deferred_refresh = async_call_later(
+                    self.hass, remaining, self._async_deferred_refresh
+                )
+            return False
+
+        self._cancel_deferred_refresh()
+        self._refresh_inputs = inputs
+        self._refreshed_at = now
+        return True
+
+    @callback
+    def _async_deferred_refresh(self, _now: Any) -> None:
+        """Process the update a periodic sensor deferred."""
+        self._deferred_refresh = None
+        self._handle_coordinator_update()
+
+    def _cancel_deferred_refresh(self) -> None:
+        """Cancel a scheduled periodic refresh."""
+        if self._deferred_refresh is not None:
+            self._deferred_refresh()
+            self._deferred_refresh = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel scheduled periodic refreshes and silence writes."""
+        await super().async_will_remove_from_hass()
+        self._cancel_deferred_refresh()
+        self._cancel_silence_write()
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return attributes."""
@@ -145,24 +294,25 @@ class OptimizedEveusSensor(EveusSensorBase):
             try:
                 if not self._updater.available:
                     return {}
-                return self._spec.attributes_fn(self._updater, self.hass)
+                return {
+                    **self._spec.attributes_fn(self._updater, self.hass),
+                    **(super().extra_state_attributes or {}),
+                }
             except Exception as err:
                 if _should_log_error(f"attributes_{self._spec.key}"):
                     _LOGGER.debug("Error getting attributes for %s: %s", self.name, err)
-        return {}
+        return super().extra_state_attributes or {}
 
 
 # =============================================================================
 # Value helper
 # =============================================================================
 
-def _get_data_value(updater, key: str, converter=float, default=None):
-    """Get value from updater data. Returns None when offline."""
-    if not updater.available or not updater.data:
+def _get_data_value(updater, key: str):
+    """Get a parsed payload field. Returns None when offline."""
+    if not updater.available:
         return None
-    if key in updater.data:
-        return get_safe_value(updater.data, key, converter, default)
-    return default
+    return getattr(updater.reading, key)
 
 
 # =============================================================================
@@ -170,43 +320,54 @@ def _get_data_value(updater, key: str, converter=float, default=None):
 # =============================================================================
 
 def _make_value_getter(key: str, precision: int = 0, transform: Callable = None):
-    """Factory for simple data getter functions."""
-    def getter(updater, hass):
+    """Factory for simple data getter functions.
+
+    Fields are already converted and rounded in the reading, so only
+    transformed values are rounded here.
+    """
+    if transform is None:
+        field = attrgetter(key)
+
+        def getter(updater, hass):
+            if not updater.available:
+                return None
+            return field(updater.reading)
+        return getter
+
+    def transformed_getter(updater, hass):
         value = _get_data_value(updater, key)
         if value is None:
             return None
-        if transform:
-            value = transform(value)
-        return round(value, precision)
-    return getter
+        return round(transform(value), precision)
+    return transformed_getter
 
 
 # Measurement getters
-get_voltage = _make_value_getter("voltMeas1", precision=0)
-get_current = _make_value_getter("curMeas1", precision=1)
-get_power = _make_value_getter("powerMeas", precision=1)
-get_current_set = _make_value_getter("currentSet", precision=0)
+get_voltage = _make_value_getter("voltMeas1")
+get_current = _make_value_getter("curMeas1")
+get_power = _make_value_getter("powerMeas")
+get_current_set = _make_value_getter("currentSet")
 
 # Energy getters
-get_session_energy = _make_value_getter("sessionEnergy", precision=2)
-get_total_energy = _make_value_getter("totalEnergy", precision=2)
-get_counter_a_energy = _make_value_getter("IEM1", precision=2)
-get_counter_b_energy = _make_value_getter("IEM2", precision=2)
+get_session_energy = _make_value_getter("sessionEnergy")
+get_total_energy = _make_value_getter("totalEnergy")
+get_counter_a_energy = _make_value_getter("IEM1")
+get_counter_b_energy = _make_value_getter("IEM2")
 
 # Cost getters (divide by 100)
 _div100 = lambda v: v / 100
-get_counter_a_cost = _make_value_getter("IEM1_money", precision=2)
-get_counter_b_cost = _make_value_getter("IEM2_money", precision=2)
+get_counter_a_cost = _make_value_getter("IEM1_money")
+get_counter_b_cost = _make_value_getter("IEM2_money")
 get_primary_rate_cost = _make_value_getter("tarif", precision=2, transform=_div100)
 get_rate2_cost = _make_value_getter("tarifAValue", precision=2, transform=_div100)
 get_rate3_cost = _make_value_getter("tarifBValue", precision=2, transform=_div100)
 
 # Temperature getters
-get_box_temperature = _make_value_getter("temperature1", precision=0)
-get_plug_temperature = _make_value_getter("temperature2", precision=0)
+get_box_temperature = _make_value_getter("temperature1")
+get_plug_temperature = _make_value_getter("temperature2")
 
 # Other diagnostic getters
-get_battery_voltage = _make_value_getter("vBat", precision=2)
+get_battery_voltage = _make_value_getter("vBat")
 
 
 # =============================================================================
@@ -215,14 +376,14 @@ get_battery_voltage = _make_value_getter("vBat", precision=2)
 
 def get_charger_state(updater, hass) -> Optional[str]:
     """Get charger state."""
-    state_value = _get_data_value(updater, "state", int)
+    state_value = _get_data_value(updater, "state")
     return get_charging_state(state_value) if state_value is not None else None
 
 
 def get_charger_substate(updater, hass) -> Optional[str]:
     """Get charger substate."""
-    state = _get_data_value(updater, "state", int)
-    substate = _get_data_value(updater, "subState", int)
+    state = _get_data_value(updater, "state")
+    substate = _get_data_value(updater, "subState")
     if None in (state, substate):
         return None
     if state == 7:
@@ -232,7 +393,7 @@ def get_charger_substate(updater, hass) -> Optional[str]:
 
 def get_ground_status(updater, hass) -> Optional[str]:
     """Get ground status."""
-    value = _get_data_value(updater, "ground", int)
+    value = _get_data_value(updater, "ground")
     if value == 1:
         return "Connected"
     if value == 0:
@@ -242,7 +403,7 @@ def get_ground_status(updater, hass) -> Optional[str]:
 
 def get_session_time(updater, hass) -> Optional[str]:
     """Get formatted session time."""
-    seconds = _get_data_value(updater, "sessionTime", int)
+    seconds = _get_data_value(updater, "sessionTime")
     return format_duration(seconds) if seconds is not None else None
 
 
@@ -250,14 +411,14 @@ def get_session_time_attrs(updater, hass) -> dict:
     """Get session time attributes."""
     if not updater.available:
         return {}
-    seconds = _get_data_value(updater, "sessionTime", int)
+    seconds = _get_data_value(updater, "sessionTime")
     return {"duration_seconds": seconds} if seconds is not None else {}
 
 
 def get_system_time(updater, hass) -> Optional[str]:
     """Get system time with timezone correction."""
     try:
-        timestamp = _get_data_value(updater, "systemTime", int)
+        timestamp = _get_data_value(updater, "systemTime")
         if timestamp is None:
             return None
 
@@ -283,7 +444,7 @@ def get_system_time(updater, hass) -> Optional[str]:
 
 def get_active_rate_cost(updater, hass) -> Optional[float]:
     """Get active rate cost."""
-    active_rate = _get_data_value(updater, "activeTarif", int)
+    active_rate = _get_data_value(updater, "activeTarif")
     if active_rate is None:
         return None
     rate_keys = {0: "tarif", 1: "tarifAValue", 2: "tarifBValue"}
@@ -298,14 +459,14 @@ def get_active_rate_attrs(updater, hass) -> dict:
     """Get active rate attributes."""
     if not updater.available:
         return {}
-    active_rate = _get_data_value(updater, "activeTarif", int)
+    active_rate = _get_data_value(updater, "activeTarif")
     return {"rate_name": RATE_STATES.get(active_rate, "Unknown")} if active_rate is not None else {}
 
 
 def _make_rate_status_getter(rate_key: str):
     """Factory for rate status sensors."""
     def getter(updater, hass) -> Optional[str]:
-        enabled = _get_data_value(updater, rate_key, int)
+        enabled = _get_data_value(updater, rate_key)
         if enabled == 1:
             return "Enabled"
         if enabled == 0:
@@ -334,7 +495,7 @@ def get_connection_attrs(updater, hass) -> dict:
             return {}
         metrics = updater.connection_quality
         success_rate = metrics.get("success_rate", 100)
-        return {
+        attrs = {
             "connection_quality": f"{round(success_rate)}%",
             "latency_avg": f"{max(0, metrics.get('latency_avg', 0)):.2f}s",
             "status": (
@@ -344,6 +505,17 @@ def get_connection_attrs(updater, hass) -> dict:
                 "Poor" if success_rate > 30 else "Critical"
             ),
         }
+        for quantile in ("p50", "p95", "p99"):
+            latency = metrics.get(f"latency_{quantile}")
+            if latency is not None:
+                attrs[f"latency_{quantile}"] = f"{latency:.2f}s"
+        for window in ("1m", "15m", "24h"):
+            rate = metrics.get(f"success_rate_{window}")
+            if rate is not None:
+                attrs[f"success_rate_{window}"] = f"{round(rate)}%"
+        if "errors_15m" in metrics:
+            attrs["errors_15m"] = metrics["errors_15m"]
+        return attrs
     except Exception:
         return {"status": "Error"}
 
@@ -357,9 +529,9 @@ def create_sensor_specifications() -> List[SensorSpec]:
 
     # Measurement sensors
     measurements = [
-        ("Voltage", get_voltage, "mdi:flash", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, 0, None),
-        ("Current", get_current, "mdi:current-ac", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, 1, None),
-        ("Power", get_power, "mdi:flash", SensorDeviceClass.POWER, UnitOfPower.WATT, 1, None),
+        ("Voltage", get_voltage, "mdi:flash", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, 0, None, "voltMeas1"),
+        ("Current", get_current, "mdi:current-ac", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE, 1, None, "curMeas1"),
+        ("Power", get_power, "mdi:flash", SensorDeviceClass.POWER, UnitOfPower.WATT, 1, None, "powerMeas"),
         (
             "Current Set",
             get_current_set,
@@ -368,9 +540,17 @@ def create_sensor_specifications() -> List[SensorSpec]:
             UnitOfElectricCurrent.AMPERE,
             0,
             EntityCategory.DIAGNOSTIC,
+            "currentSet",
         ),
     ]
 
+    # Poll-to-poll jitter below these is not written; Current Set is a setpoint
+    measurement_deadbands = {
+        "Voltage": Deadband(absolute=2),
+        "Current": Deadband(absolute=0.2, relative=0.02),
+        "Power": Deadband(absolute=20, relative=0.02),
+    }
+
     measurement_specs = [
         SensorSpec(
             key=name.lower().replace(" ", "_"),
@@ -383,16 +563,18 @@ def create_sensor_specifications() -> List[SensorSpec]:
             unit=unit,
             precision=precision,
             category=category,
+            data_keys=(data_key,),
+            deadband=measurement_deadbands.get(name),
         )
-        for name, fn, icon, device_class, unit, precision, category in measurements
+        for name, fn, icon, device_class, unit, precision, category, data_key in measurements
     ]
 
     # Energy sensors
     energy_sensors = [
-        ("Session Energy", get_session_energy, "mdi:transmission-tower-export", SensorStateClass.TOTAL),
-        ("Total Energy", get_total_energy, "mdi:transmission-tower", SensorStateClass.TOTAL_INCREASING),
-        ("Counter A Energy", get_counter_a_energy, "mdi:counter", SensorStateClass.TOTAL_INCREASING),
-        ("Counter B Energy", get_counter_b_energy, "mdi:counter", SensorStateClass.TOTAL_INCREASING),
+        ("Session Energy", get_session_energy, "mdi:transmission-tower-export", SensorStateClass.TOTAL, "sessionEnergy"),
+        ("Total Energy", get_total_energy, "mdi:transmission-tower", SensorStateClass.TOTAL_INCREASING, "totalEnergy"),
+        ("Counter A Energy", get_counter_a_energy, "mdi:counter", SensorStateClass.TOTAL_INCREASING, "IEM1"),
+        ("Counter B Energy", get_counter_b_energy, "mdi:counter", SensorStateClass.TOTAL_INCREASING, "IEM2"),
     ]
 
     energy_specs = [
@@ -406,8 +588,9 @@ def create_sensor_specifications() -> List[SensorSpec]:
             state_class=state_class,
             unit=UnitOfEnergy.KILO_WATT_HOUR,
             precision=2,
+            data_keys=(data_key,),
         )
-        for name, fn, icon, state_class in energy_sensors
+        for name, fn, icon, state_class, data_key in energy_sensors
     ]
 
     # Diagnostic sensors
@@ -415,22 +598,23 @@ def create_sensor_specifications() -> List[SensorSpec]:
         SensorSpec(
             key="state", name="State", value_fn=get_charger_state,
             sensor_type=SensorType.DIAGNOSTIC, icon="mdi:state-machine",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("state",),
         ),
         SensorSpec(
             key="substate", name="Substate", value_fn=get_charger_substate,
             sensor_type=SensorType.DIAGNOSTIC, icon="mdi:information-variant",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("state", "subState"),
         ),
         SensorSpec(
             key="ground", name="Ground", value_fn=get_ground_status,
             sensor_type=SensorType.DIAGNOSTIC, icon="mdi:electric-switch",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("ground",),
+            refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="system_time", name="System Time", value_fn=get_system_time,
             sensor_type=SensorType.DIAGNOSTIC, icon="mdi:clock-outline",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("systemTime",),
         ),
         SensorSpec(
             key="box_temperature", name="Box Temperature", value_fn=get_box_temperature,
@@ -438,7 +622,8 @@ def create_sensor_specifications() -> List[SensorSpec]:
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             unit=UnitOfTemperature.CELSIUS, precision=0,
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("temperature1",),
+            deadband=Deadband(absolute=2),
         ),
         SensorSpec(
             key="plug_temperature", name="Plug Temperature", value_fn=get_plug_temperature,
@@ -446,7 +631,8 @@ def create_sensor_specifications() -> List[SensorSpec]:
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             unit=UnitOfTemperature.CELSIUS, precision=0,
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("temperature2",),
+            deadband=Deadband(absolute=2),
         ),
         SensorSpec(
             key="battery_voltage", name="Battery Voltage", value_fn=get_battery_voltage,
@@ -454,7 +640,9 @@ def create_sensor_specifications() -> List[SensorSpec]:
             device_class=SensorDeviceClass.VOLTAGE,
             state_class=SensorStateClass.MEASUREMENT,
             unit=UnitOfElectricPotential.VOLT, precision=2,
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("vBat",),
+            deadband=Deadband(absolute=0.05),
+            refresh=RefreshTier.PERIODIC,
         ),
     ]
 
@@ -463,50 +651,58 @@ def create_sensor_specifications() -> List[SensorSpec]:
         SensorSpec(
             key="session_time", name="Session Time", value_fn=get_session_time,
             sensor_type=SensorType.STATE, icon="mdi:timer",
-            attributes_fn=get_session_time_attrs,
+            attributes_fn=get_session_time_attrs, data_keys=("sessionTime",),
         ),
         SensorSpec(
             key="counter_a_cost", name="Counter A Cost", value_fn=get_counter_a_cost,
             sensor_type=SensorType.ENERGY, icon="mdi:currency-uah",
             state_class=SensorStateClass.TOTAL_INCREASING, unit="₴", precision=2,
+            data_keys=("IEM1_money",),
         ),
         SensorSpec(
             key="counter_b_cost", name="Counter B Cost", value_fn=get_counter_b_cost,
             sensor_type=SensorType.ENERGY, icon="mdi:currency-uah",
             state_class=SensorStateClass.TOTAL_INCREASING, unit="₴", precision=2,
+            data_keys=("IEM2_money",),
         ),
         SensorSpec(
             key="primary_rate_cost", name="Primary Rate Cost", value_fn=get_primary_rate_cost,
             sensor_type=SensorType.STATE, icon="mdi:currency-uah",
             state_class=SensorStateClass.MEASUREMENT, unit="₴/kWh", precision=2,
+            data_keys=("tarif",), refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="active_rate_cost", name="Active Rate Cost", value_fn=get_active_rate_cost,
             sensor_type=SensorType.STATE, icon="mdi:currency-uah",
             state_class=SensorStateClass.MEASUREMENT, unit="₴/kWh", precision=2,
             attributes_fn=get_active_rate_attrs,
+            data_keys=("activeTarif", "tarif", "tarifAValue", "tarifBValue"),
         ),
         SensorSpec(
             key="rate_2_cost", name="Rate 2 Cost", value_fn=get_rate2_cost,
             sensor_type=SensorType.STATE, icon="mdi:currency-uah",
             state_class=SensorStateClass.MEASUREMENT, unit="₴/kWh", precision=2,
+            data_keys=("tarifAValue",), refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="rate_3_cost", name="Rate 3 Cost", value_fn=get_rate3_cost,
             sensor_type=SensorType.STATE, icon="mdi:currency-uah",
             state_class=SensorStateClass.MEASUREMENT, unit="₴/kWh", precision=2,
+            data_keys=("tarifBValue",), refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="rate_2_status", name="Rate 2 Status",
             value_fn=_make_rate_status_getter("tarifAEnable"),
             sensor_type=SensorType.STATE, icon="mdi:clock-check",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("tarifAEnable",),
+            refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="rate_3_status", name="Rate 3 Status",
             value_fn=_make_rate_status_getter("tarifBEnable"),
             sensor_type=SensorType.STATE, icon="mdi:clock-check",
-            category=EntityCategory.DIAGNOSTIC,
+            category=EntityCategory.DIAGNOSTIC, data_keys=("tarifBEnable",),
+            refresh=RefreshTier.PERIODIC,
         ),
         SensorSpec(
             key="connection_quality", name="Connection Quality",
@@ -520,6 +716,60 @@ def create_sensor_specifications() -> List[SensorSpec]:
     return measurement_specs + energy_specs + diagnostic_specs + special_specs
 
 
+class SensorRegistry:
+    """Immutable catalog of sensor specs, indexed by key and payload field.
+
+    Built once at import and shared by every config entry.
+    """
+
+    __slots__ = ("_specs", "_fields", "_by_field")
+
+    def __init__(self, specs: Iterable[SensorSpec]) -> None:
+        """Index the specs, keeping them in entity creation order."""
+        self._specs: tuple[SensorSpec, ...] = tuple(specs)
+        self._fields = MappingProxyType(
+            {spec.key: frozenset(spec.data_keys) for spec in self._specs}
+        )
+        by_field: Dict[str, List[str]] = {}
+        for spec in self._specs:
+            for field in spec.data_keys:
+                by_field.setdefault(field, []).append(spec.key)
+        self._by_field = MappingProxyType(
+            {field: tuple(keys) for field, keys in by_field.items()}
+        )
+
+    @property
+    def specs(self) -> tuple[SensorSpec, ...]:
+        """Return the specs in entity creation order."""
+        return self._specs
+
+    def fields(self, key: str) -> frozenset[str]:
+        """Return the payload fields the spec with the given key reads."""
+        return self._fields[key]
+
+    def unreported(self, payload: Iterable[str]) -> Dict[str, tuple[str, ...]]:
+        """Map each field missing from a payload to the spec keys reading it."""
+        present = set(payload)
+        return {
+            field: keys for field, keys in self._by_field.items() if field not in present
+        }
+
+    def candidates(
+        self, updater, device_number: int = 1
+    ) -> List[tuple[frozenset[str], Callable[[], OptimizedEveusSensor]]]:
+        """Return (payload fields, entity factory) pairs for a charger."""
+        return [
+            (
+                self._fields[spec.key],
+                partial(OptimizedEveusSensor, updater, spec, device_number),
+            )
+            for spec in self._specs
+        ]
+
+
+SENSOR_REGISTRY = SensorRegistry(create_sensor_specifications())
+
+
 def get_sensor_specifications() -> List[SensorSpec]:
     """Get all sensor specifications."""
-    return create_sensor_specifications()
+    return list(SENSOR_REGISTRY.specs)
@@ -0,0 +1,59 @@
+"""Persisted per-charger runtime state for Eveus."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STATE_SAVE_DELAY, STORAGE_VERSION
+
+
+def _state_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding one charger's runtime state."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.state")
+
+
+async def async_remove_entry_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the saved runtime state of a removed charger."""
+    await _state_store(hass, entry_id).async_remove()
+
+
+class EntryStateStore:
+    """Save learned runtime state of one charger across restarts.
+
+    Saves are batched: after the first change, at most one write happens
+    per STATE_SAVE_DELAY, however often state changes in between.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        data_func: Callable[[], dict[str, Any]],
+    ) -> None:
+        """Initialize the store."""
+        self._store = _state_store(hass, entry_id)
+        self._data_func = data_func
+        self._save_pending = False
+
+    async def async_load(self) -> dict[str, Any]:
+        """Return the saved state, or an empty mapping."""
+        stored = await self._store.async_load()
+        return stored if isinstance(stored, dict) else {}
+
+    def async_schedule_save(self) -> None:
+        """Save state soon unless a save is already scheduled."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STATE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save state immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Collect the current state at write time."""
+        self._save_pending = False
+        return self._data_func()
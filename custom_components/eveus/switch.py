@@ -1,9 +1,10 @@
-"""Support for Eveus switches with optimistic UI and safety."""
+"""Support for Eveus switches with confirmed writes and safety."""
 from __future__ import annotations
 
 import logging
 import asyncio
 import time
+from functools import partial
 from typing import Any, Optional
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -13,14 +14,11 @@ from homeassistant.helpers.entity import EntityCategory
 
 from . import EveusConfigEntry
 from .const import CONTROL_GRACE_PERIOD
-from .common import BaseEveusEntity
-from .utils import get_safe_value
+from .common import BaseEveusEntity, PayloadEntityAdder
+from .common_command import COMMAND_CONFIRMED
 
 _LOGGER = logging.getLogger(__name__)
 
-# How long to trust user's command before requiring device confirmation
-OPTIMISTIC_STATE_TTL = 120
-
 
 class EveusSwitchEntityDescription(SwitchEntityDescription, frozen_or_thawed=True):
     """Description for Eveus switch entities."""
@@ -29,55 +27,24 @@ class EveusSwitchEntityDescription(SwitchEntityDescription, frozen_or_thawed=Tru
     state_key: str
 
 
-SWITCH_DESCRIPTIONS: tuple[EveusSwitchEntityDescription, ...] = (
-    EveusSwitchEntityDescription(
-        key="stop_charging",
-        name="Stop Charging",
-        icon="mdi:ev-station",
-        entity_category=EntityCategory.CONFIG,
-        command="evseEnabled",
-        state_key="evseEnabled",
-    ),
-    EveusSwitchEntityDescription(
-        key="one_charge",
-        name="One Charge",
-        icon="mdi:lightning-bolt",
-        entity_category=EntityCategory.CONFIG,
-        command="oneCharge",
-        state_key="oneCharge",
-    ),
-    EveusSwitchEntityDescription(
-        key="reset_counter_a",
-        name="Reset Counter A",
-        icon="mdi:refresh-circle",
-        entity_category=EntityCategory.CONFIG,
-        command="rstEM1",
-        state_key="IEM1",
-    ),
-)
-
-
 class BaseSwitchEntity(BaseEveusEntity, SwitchEntity):
     """Base switch entity with responsive UI and safety."""
 
-    def __init__(
-        self,
-        updater,
-        entity_description: EveusSwitchEntityDescription,
-        device_number: int = 1,
-    ) -> None:
+    DESCRIPTION: EveusSwitchEntityDescription
+
+    def __init__(self, updater, device_number: int = 1) -> None:
         """Initialize the switch."""
+        entity_description = self.DESCRIPTION
         self.entity_description = entity_description
         self.ENTITY_NAME = entity_description.name
+        self.DATA_KEYS = frozenset({entity_description.state_key})
         super().__init__(updater, device_number)
-        self._command_lock = asyncio.Lock()
+        self._write_sequence = 0
         self._command = entity_description.command
         self._state_key = entity_description.state_key
 
         # State management for responsive UI
         self._pending_command: Optional[bool] = None
-        self._optimistic_state: Optional[bool] = None
-        self._optimistic_state_time: float = 0
         self._last_device_state: Optional[bool] = None
         self._last_command_time = 0
         self._last_successful_read = 0
@@ -101,7 +68,6 @@ class BaseSwitchEntity(BaseEveusEntity, SwitchEntity):
                     self.unique_id, unavailable_duration,
                 )
             self._last_known_available = False
-            self._optimistic_state = None
             return False
 
         if self._unavailable_since is not None:
@@ -113,26 +79,18 @@ class BaseSwitchEntity(BaseEveusEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
-        """Return switch state with optimistic UI."""
+        """Return the pending state during a write, otherwise the device state."""
         current_time = time.time()
 
         if self._pending_command is not None:
             return self._pending_command
 
-        if self._optimistic_state is not None:
-            if current_time - self._optimistic_state_time < OPTIMISTIC_STATE_TTL:
-                return self._optimistic_state
-            self._optimistic_state = None
-
-        if self._updater.available and self._updater.data:
-            if self._state_key in self._updater.data:
-                device_value = get_safe_value(self._updater.data, self._state_key, int, 0)
+        if self._updater.available:
+            device_value = getattr(self._updater.reading, self._state_key)
+            if device_value is not None:
                 new_device_state = bool(device_value)
                 self._last_device_state = new_device_state
                 self._last_successful_read = current_time
-
-                if self._optimistic_state is not None and self._optimistic_state != new_device_state:
-                    self._optimistic_state = None
                 return new_device_state
 
         if self._last_device_state is not None:
@@ -142,28 +100,32 @@ class BaseSwitchEntity(BaseEveusEntity, SwitchEntity):
         return False
 
     async def _async_send_command(self, command_value: int) -> bool:
-        """Send command with optimistic state."""
-        async with self._command_lock:
-            self._pending_command = bool(command_value)
-            self.async_write_ha_state()
+        """Send command and show it as pending until the device confirms it.
+
+        Calls go straight to the command queue, which merges writes to the
+        same key; the latest requested state stays pending until its call
+        finishes.
+        """
+        self._pending_command = bool(command_value)
+        self._write_sequence += 1
+        write_sequence = self._write_sequence
+        self.async_write_ha_state()
 
-            try:
-                success = await self._updater.send_command(self._command, command_value)
+        try:
+            result = await self._updater.async_write(self._command, command_value)
 
-                if success:
-                    self._optimistic_state = bool(command_value)
-                    self._optimistic_state_time = time.time()
-                else:
-                    _LOGGER.warning(
-                        "Failed to set %s to %s",
-                        self.name, "on" if command_value else "off",
-                    )
-                return success
+            if result != COMMAND_CONFIRMED:
+                _LOGGER.warning(
+                    "Failed to set %s to %s (%s)",
+                    self.name, "on" if command_value else "off", result,
+                )
+            return result == COMMAND_CONFIRMED
 
-            finally:
+        finally:
+            if write_sequence == self._write_sequence:
                 self._pending_command = None
-                self._last_command_time = time.time()
-                self.async_write_ha_state()
+            self._last_command_time = time.time()
+            self.async_write_ha_state()
 
     async def _async_restore_state(self, state: State) -> None:
         """Restore previous display state only — no commands sent on startup."""
@@ -175,28 +137,27 @@ class BaseSwitchEntity(BaseEveusEntity, SwitchEntity):
         """Handle updated data — reconcile with device state."""
         current_time = time.time()
 
-        if self._updater.available and self._updater.data:
-            if self._state_key in self._updater.data:
-                device_value = get_safe_value(self._updater.data, self._state_key, int, 0)
+        if self._updater.available:
+            device_value = getattr(self._updater.reading, self._state_key)
+            if device_value is not None:
                 new_device_state = bool(device_value)
                 self._last_device_state = new_device_state
                 self._last_successful_read = current_time
 
-                if self._optimistic_state is not None:
-                    if self._optimistic_state == new_device_state:
-                        self._optimistic_state = None
-                    elif current_time - self._optimistic_state_time > 10:
-                        self._optimistic_state = None
-
         self.async_write_ha_state()
 
 
 class EveusStopChargingSwitch(BaseSwitchEntity):
     """Representation of Eveus charging control switch."""
 
-    def __init__(self, updater, device_number: int = 1) -> None:
-        """Initialize the switch."""
-        super().__init__(updater, SWITCH_DESCRIPTIONS[0], device_number)
+    DESCRIPTION = EveusSwitchEntityDescription(
+        key="stop_charging",
+        name="Stop Charging",
+        icon="mdi:ev-station",
+        entity_category=EntityCategory.CONFIG,
+        command="evseEnabled",
+        state_key="evseEnabled",
+    )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the device stop-charging option."""
@@ -210,9 +171,14 @@ class EveusStopChargingSwitch(BaseSwitchEntity):
 class EveusOneChargeSwitch(BaseSwitchEntity):
     """Representation of Eveus one charge switch."""
 
-    def __init__(self, updater, device_number: int = 1) -> None:
-        """Initialize the switch."""
-        super().__init__(updater, SWITCH_DESCRIPTIONS[1], device_number)
+    DESCRIPTION = EveusSwitchEntityDescription(
+        key="one_charge",
+        name="One Charge",
+        icon="mdi:lightning-bolt",
+        entity_category=EntityCategory.CONFIG,
+        command="oneCharge",
+        state_key="oneCharge",
+    )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable one charge mode."""
@@ -226,9 +192,18 @@ class EveusOneChargeSwitch(BaseSwitchEntity):
 class EveusResetCounterASwitch(BaseSwitchEntity):
     """Representation of Eveus reset counter A switch."""
 
+    DESCRIPTION = EveusSwitchEntityDescription(
+        key="reset_counter_a",
+        name="Reset Counter A",
+        icon="mdi:refresh-circle",
+        entity_category=EntityCategory.CONFIG,
+        command="rstEM1",
+        state_key="IEM1",
+    )
+
     def __init__(self, updater, device_number: int = 1) -> None:
         """Initialize with special reset behavior."""
-        super().__init__(updater, SWITCH_DESCRIPTIONS[2], device_number)
+        super().__init__(updater, device_number)
         self._safe_mode = True
         self._last_reset_time = 0
 
@@ -247,12 +222,10 @@ class EveusResetCounterASwitch(BaseSwitchEntity):
         """Return True if counter has a value."""
         if self._safe_mode:
             return False
-        if not self._updater.available or not self._updater.data:
+        if not self._updater.available:
             return False
-        if self._state_key in self._updater.data:
-            value = get_safe_value(self._updater.data, self._state_key, float, 0)
-            return value > 0
-        return False
+        value = getattr(self._updater.reading, self._state_key)
+        return value is not None and value > 0
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """No action — switch represents counter status."""
@@ -287,10 +260,22 @@ async def async_setup_entry(
     updater = runtime_data.updater
     device_number = runtime_data.device_number
 
-    switches = [
-        EveusStopChargingSwitch(updater, device_number),
-        EveusOneChargeSwitch(updater, device_number),
-        EveusResetCounterASwitch(updater, device_number),
-    ]
+    switch_classes = (
+        EveusStopChargingSwitch,
+        EveusOneChargeSwitch,
+        EveusResetCounterASwitch,
+    )
 
-    async_add_entities(switches)
+    # Each switch is added once the charger reports the field it reflects.
+    adder = PayloadEntityAdder(
+        updater,
+        async_add_entities,
+        [
+            (
+                frozenset({switch_class.DESCRIPTION.state_key}),
+                partial(switch_class, updater, device_number),
+            )
+            for switch_class in switch_classes
+        ],
+    )
+    entry.async_on_unload(adder.async_start())
@@ -0,0 +1,259 @@
+"""Constant-memory connection telemetry for Eveus chargers."""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+from typing import Any
+
+import aiohttp
+
+ERROR_TIMEOUT = "timeout"
+ERROR_CONNECT = "connect"
+ERROR_HTTP_5XX = "http_5xx"
+ERROR_DECODE = "decode"
+ERROR_OTHER = "other"
+ERROR_CLASSES = (ERROR_TIMEOUT, ERROR_CONNECT, ERROR_HTTP_5XX, ERROR_DECODE, ERROR_OTHER)
+
+_SUCCESS = "success"
+
+
+def classify_error(error: BaseException) -> str:
+    """Map a poll or command exception to an error class."""
+    cause = error.__cause__ or error
+    if isinstance(cause, (asyncio.TimeoutError, TimeoutError)):
+        return ERROR_TIMEOUT
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return ERROR_HTTP_5XX if (cause.status or 0) >= 500 else ERROR_OTHER
+    if isinstance(cause, (aiohttp.ClientConnectionError, OSError)):
+        return ERROR_CONNECT
+    if isinstance(cause, (json.JSONDecodeError, ValueError)):
+        return ERROR_DECODE
+    return ERROR_OTHER
+
+
+class LatencySketch:
+    """Log-bucketed latency histogram with bounded memory and decay.
+
+    Buckets grow by 8% so every quantile is within ~4% of the true value.
+    Counts are halved once they reach the decay limit, which keeps recent
+    samples dominant without storing them.
+    """
+
+    _MIN_SECONDS = 0.001
+    _MAX_SECONDS = 120.0
+    _GAMMA = 1.08
+    _LOG_GAMMA = math.log(_GAMMA)
+    _BUCKETS = math.ceil(math.log(_MAX_SECONDS / _MIN_SECONDS) / _LOG_GAMMA) + 1
+    _DECAY_AT = 2048
+
+    def __init__(self) -> None:
+        """Initialize an empty sketch."""
+        self._counts = [0.0] * self._BUCKETS
+        self._total = 0.0
+
+    @property
+    def count(self) -> float:
+        """Return the (decayed) number of samples."""
+        return self._total
+
+    def add(self, seconds: float) -> None:
+        """Add one latency sample."""
+        if seconds <= self._MIN_SECONDS:
+            index = 0
+        else:
+            index = min(
+                int(math.log(seconds / self._MIN_SECONDS) / self._LOG_GAMMA) + 1,
+                self._BUCKETS - 1,
+            )
+        self._counts[index] += 1
+        self._total += 1
+
+        if self._total >= self._DECAY_AT:
+            self._counts = [count / 2 for count in self._counts]
+            self._total /= 2
+
+    def quantile(self, q: float) -> float | None:
+        """Return the estimated latency at quantile q, or None when empty."""
+        if not self._total:
+            return None
+
+        rank = q * self._total
+        cumulative = 0.0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                if index == 0:
+                    return self._MIN_SECONDS
+                return self._MIN_SECONDS * self._GAMMA ** (index - 0.5)
+        return self._MAX_SECONDS
+
+
+class RollingCounter:
+    """Outcome counts over a sliding window of fixed time buckets."""
+
+    def __init__(self, bucket_seconds: float, bucket_count: int) -> None:
+        """Initialize the window."""
+        self._bucket_seconds = bucket_seconds
+        self._bucket_count = bucket_count
+        self._buckets: list[dict[str, int]] = [{} for _ in range(bucket_count)]
+        self._epochs = [-1] * bucket_count
+
+    def add(self, outcome: str, now: float) -> None:
+        """Count one outcome at time now."""
+        epoch = int(now // self._bucket_seconds)
+        slot = epoch % self._bucket_count
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._buckets[slot] = {}
+        bucket = self._buckets[slot]
+        bucket[outcome] = bucket.get(outcome, 0) + 1
+
+    def totals(self, now: float) -> dict[str, int]:
+        """Return outcome counts still inside the window."""
+        oldest = int(now // self._bucket_seconds) - self._bucket_count + 1
+        totals: dict[str, int] = {}
+        for epoch, bucket in zip(self._epochs, self._buckets):
+            if epoch < oldest:
+                continue
+            for outcome, count in bucket.items():
+                totals[outcome] = totals.get(outcome, 0) + count
+        return totals
+
+
+class AdaptiveTimeout:
+    """Request timeout derived from smoothed latency, like a TCP RTO.
+
+    Uses the RFC 6298 estimator: timeout = SRTT + 4 * RTTVAR, clamped to
+    [floor, ceiling]. Each timeout doubles the value until the next success,
+    so a slow spell backs off instead of timing out repeatedly.
+    """
+
+    _ALPHA = 1 / 8
+    _BETA = 1 / 4
+    _K = 4
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize with no samples; the ceiling is used until the first."""
+        self._floor = floor
+        self._ceiling = ceiling
+        self._srtt: float | None = None
+        self._rttvar = 0.0
+        self._backoff = 1
+        self._requests = 0
+        self._timeouts = 0
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout for the next request in seconds."""
+        if self._srtt is None:
+            return self._ceiling
+        rto = (self._srtt + self._K * self._rttvar) * self._backoff
+        return max(self._floor, min(self._ceiling, rto))
+
+    @property
+    def timeout_rate(self) -> float:
+        """Return the percentage of requests that hit the timeout."""
+        return self._timeouts / self._requests * 100 if self._requests else 0.0
+
+    def record_success(self, latency: float) -> None:
+        """Update the estimate with a completed request."""
+        self._requests += 1
+        self._backoff = 1
+        if self._srtt is None:
+            self._srtt = latency
+            self._rttvar = latency / 2
+            return
+        self._rttvar = (1 - self._BETA) * self._rttvar + self._BETA * abs(
+            self._srtt - latency
+        )
+        self._srtt = (1 - self._ALPHA) * self._srtt + self._ALPHA * latency
+
+    def record_timeout(self) -> None:
+        """Back off after a request timed out."""
+        self._requests += 1
+        self._timeouts += 1
+        if self._srtt is not None:
+            self._backoff = min(self._backoff * 2, 64)
+
+    def record_failure(self) -> None:
+        """Count a request that failed for another reason."""
+        self._requests += 1
+
+    def as_dict(self) -> dict[str, float] | None:
+        """Return the estimator state for persistence."""
+        if self._srtt is None:
+            return None
+        return {"srtt": self._srtt, "rttvar": self._rttvar}
+
+    def restore(self, state: dict[str, Any] | None) -> None:
+        """Restore estimator state saved by as_dict."""
+        if not state:
+            return
+        try:
+            self._srtt = float(state["srtt"])
+            self._rttvar = float(state["rttvar"])
+        except (KeyError, TypeError, ValueError):
+            self._srtt = None
+            self._rttvar = 0.0
+
+
+class ConnectionTelemetry:
+    """Latency quantiles, windowed success rates and error-class counters."""
+
+    WINDOWS = {
+        "1m": (10, 6),
+        "15m": (60, 15),
+        "24h": (3600, 24),
+    }
+
+    def __init__(self) -> None:
+        """Initialize telemetry."""
+        self._latency = LatencySketch()
+        self._windows = {
+            name: RollingCounter(bucket_seconds, bucket_count)
+            for name, (bucket_seconds, bucket_count) in self.WINDOWS.items()
+        }
+        self._errors_total = dict.fromkeys(ERROR_CLASSES, 0)
+
+    def record_success(self, latency: float, now: float | None = None) -> None:
+        """Record a successful request and its latency."""
+        now = time.monotonic() if now is None else now
+        self._latency.add(latency)
+        for window in self._windows.values():
+            window.add(_SUCCESS, now)
+
+    def record_failure(self, error_class: str, now: float | None = None) -> None:
+        """Record a failed request by error class."""
+        now = time.monotonic() if now is None else now
+        self._errors_total[error_class] = self._errors_total.get(error_class, 0) + 1
+        for window in self._windows.values():
+            window.add(error_class, now)
+
+    def success_rate(self, window: str, now: float | None = None) -> float | None:
+        """Return the success percentage in a window, or None without samples."""
+        now = time.monotonic() if now is None else now
+        totals = self._windows[window].totals(now)
+        total = sum(totals.values())
+        if not total:
+            return None
+        return totals.get(_SUCCESS, 0) / total * 100
+
+    def summary(self, now: float | None = None) -> dict[str, Any]:
+        """Return telemetry for connection_quality."""
+        now = time.monotonic() if now is None else now
+        result: dict[str, Any] = {
+            "latency_p50": self._latency.quantile(0.50),
+            "latency_p95": self._latency.quantile(0.95),
+            "latency_p99": self._latency.quantile(0.99),
+        }
+        for window in self.WINDOWS:
+            result[f"success_rate_{window}"] = self.success_rate(window, now)
+
+        recent = self._windows["15m"].totals(now)
+        result["errors_15m"] = {
+            error_class: recent.get(error_class, 0) for error_class in ERROR_CLASSES
+        }
+        result["errors_total"] = dict(self._errors_total)
+        return result
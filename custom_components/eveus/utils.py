@@ -1,7 +1,9 @@
 """Utility functions for Eveus integration."""
 from __future__ import annotations
 
+import json
 import logging
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Callable, TypeVar, Optional, Union, Dict
 from datetime import datetime, timezone
@@ -9,6 +11,11 @@ from zoneinfo import ZoneInfo
 
 from homeassistant.core import State, HomeAssistant
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,6 +90,45 @@ def get_safe_value(
         return default
 
 
+@dataclass(frozen=True)
+class PayloadDecoder:
+    """JSON decoder that parses raw response bytes."""
+
+    name: str
+    loads: Callable[[bytes], Any]
+
+
+def _loads_text(raw: bytes) -> Any:
+    """Decode to str before parsing; json.loads is slower on bytes."""
+    return json.loads(raw.decode("utf-8"))
+
+
+STDLIB_DECODER = PayloadDecoder("json", _loads_text)
+ORJSON_DECODER = PayloadDecoder("orjson", orjson.loads) if orjson is not None else None
+
+
+def get_payload_decoder() -> PayloadDecoder:
+    """Return the fastest available payload decoder."""
+    return ORJSON_DECODER or STDLIB_DECODER
+
+
+_MISSING = object()
+
+
+def diff_payload_keys(
+    previous: Optional[Dict[str, Any]],
+    current: Dict[str, Any],
+) -> Optional[frozenset[str]]:
+    """Return payload keys whose values differ, or None without a baseline."""
+    if previous is None:
+        return None
+    return frozenset(
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key, _MISSING) != current.get(key, _MISSING)
+    )
+
+
 # =============================================================================
 # Device Information
 # =============================================================================
@@ -31,13 +31,29 @@ def _install_voluptuous_stub() -> None:
     def Required(key: str, default: Any = None) -> str:
         return key
 
+    def Optional(key: str, default: Any = None) -> str:
+        return key
+
     def In(values: Any) -> Any:
         return values
 
+    def All(*validators: Any) -> Any:
+        return validators
+
+    def Coerce(type_: Any) -> Any:
+        return type_
+
+    def Range(**kwargs: Any) -> Any:
+        return kwargs
+
     vol.Invalid = Invalid
     vol.Schema = Schema
     vol.Required = Required
+    vol.Optional = Optional
     vol.In = In
+    vol.All = All
+    vol.Coerce = Coerce
+    vol.Range = Range
     vol.ALLOW_EXTRA = object()
     sys.modules["voluptuous"] = vol
 
@@ -192,8 +208,15 @@ def _install_homeassistant_stub() -> None:
         def async_create_entry(self, *, title: str, data: dict[str, Any]) -> dict[str, Any]:
             return {"type": "create_entry", "title": title, "data": data}
 
-        def async_show_form(self, *, step_id: str, data_schema: Any) -> dict[str, Any]:
-            return {"type": "form", "step_id": step_id, "data_schema": data_schema}
+        def async_show_form(
+            self, *, step_id: str, data_schema: Any, errors: dict[str, str] | None = None
+        ) -> dict[str, Any]:
+            return {
+                "type": "form",
+                "step_id": step_id,
+                "data_schema": data_schema,
+                "errors": errors or {},
+            }
 
     config_entries.ConfigEntry = ConfigEntry
     config_entries.ConfigFlow = ConfigFlow
@@ -3,14 +3,22 @@ from __future__ import annotations
 
 import asyncio
 
+import aiohttp
+
 from custom_components.eveus.common_command import CommandManager, send_eveus_command
+from custom_components.eveus.common_network import DeviceIOScheduler
+from custom_components.eveus.telemetry import AdaptiveTimeout
 
 
 class _Response:
-    def __init__(self, *, raise_error: bool = False) -> None:
+    def __init__(self, *, raise_error: bool = False, drops: int = 0) -> None:
         self.raise_error = raise_error
+        self.drops = drops
 
     async def __aenter__(self) -> "_Response":
+        if self.drops:
+            self.drops -= 1
+            raise aiohttp.ServerDisconnectedError()
         return self
 
     async def __aexit__(self, *exc_info: object) -> None:
@@ -31,6 +39,28 @@ class _Session:
         return self.response
 
 
+class _Pool:
+    headers: dict[str, str] = {}
+
+    def __init__(self) -> None:
+        self.errors: list[Exception] = []
+        self.reused = False
+        self.retries = 0
+
+    def retry_on_fresh_connection(self, error: Exception) -> bool:
+        if not self.reused:
+            return False
+        self.reused = False
+        self.retries += 1
+        return True
+
+    def record_success(self) -> None:
+        return None
+
+    def record_error(self, error: Exception) -> None:
+        self.errors.append(error)
+
+
 class _Updater:
     host = "192.168.1.50"
     username = "admin"
@@ -38,6 +68,9 @@ class _Updater:
 
     def __init__(self, session: _Session) -> None:
         self._session = session
+        self.connection_pool = _Pool()
+        self.io_scheduler = DeviceIOScheduler(self.host)
+        self.command_timeout = AdaptiveTimeout(3, 25)
 
     def get_session(self) -> _Session:
         return self._session
@@ -82,6 +115,7 @@ def test_command_manager_records_success_and_failure_counts() -> None:
     assert asyncio.run(manager.send_command("evseEnabled", 1)) is True
     assert manager._consecutive_failures == 0
     assert success_session.calls[0]["data"] == "pageevent=evseEnabled&evseEnabled=1"
+    assert success_session.calls[0]["timeout"].total == 25
 
     failure_session = _Session(_Response(raise_error=True))
     manager = CommandManager(_Updater(failure_session))
@@ -89,3 +123,39 @@ def test_command_manager_records_success_and_failure_counts() -> None:
     assert asyncio.run(manager.send_command("evseEnabled", 0)) is False
     assert manager._consecutive_failures == 1
 
+
+def test_command_on_a_dropped_reused_socket_is_retried_once() -> None:
+    session = _Session(_Response(drops=1))
+    manager = CommandManager(_Updater(session))
+    manager._updater.connection_pool.reused = True
+
+    assert asyncio.run(manager.send_command("evseEnabled", 0)) is True
+    assert len(session.calls) == 2
+    assert manager._updater.connection_pool.retries == 1
+    assert manager._updater.connection_pool.errors == []
+
+    session.response.drops = 1
+    assert asyncio.run(manager.send_command("evseEnabled", 1)) is False
+    assert len(session.calls) == 3
+    assert manager._consecutive_failures == 1
+
+
+def test_command_manager_merges_queued_writes_to_the_same_key() -> None:
+    session = _Session(_Response())
+    manager = CommandManager(_Updater(session))
+
+    async def _run() -> list[bool]:
+        manager._updater.io_scheduler._last_end = asyncio.get_running_loop().time()
+        return await asyncio.gather(
+            *(manager.send_command("currentSet", amps) for amps in range(8, 17, 2)),
+            manager.send_command("evseEnabled", 1),
+        )
+
+    results = asyncio.run(_run())
+
+    assert results == [True] * 6
+    assert [call["data"] for call in session.calls] == [
+        "pageevent=evseEnabled&evseEnabled=1",
+        "pageevent=currentSet&currentSet=16",
+    ]
+    assert manager.stats == {"sent": 2, "merged": 4, "skipped": 0, "pending": 0}
@@ -0,0 +1,214 @@
+"""Unit tests for the Eveus fleet hub scheduler."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+import pytest
+
+from custom_components.eveus import common_fleet
+from custom_components.eveus.common_fleet import (
+    EveusFleetHub,
+    StartupAdmission,
+    phase_offset,
+    startup_priority,
+)
+
+
+class _Hass:
+    """Collect background tasks so tests can await them."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.tasks: list[object] = []
+
+    def async_create_background_task(self, coro: object, name: str) -> None:
+        self.tasks.append(coro)
+
+
+class _Updater:
+    def __init__(self, host: str, *, delay: float = 0) -> None:
+        self.host = host
+        self.update_interval = timedelta(seconds=60)
+        self.fleet_hub: EveusFleetHub | None = None
+        self.refreshes = 0
+        self.last_poll_time: float | None = None
+        self._delay = delay
+
+    def attach_fleet_hub(self, hub: EveusFleetHub | None) -> None:
+        self.fleet_hub = hub
+
+    async def async_refresh(self) -> None:
+        self.refreshes += 1
+        await asyncio.sleep(self._delay)
+
+
+@pytest.fixture(autouse=True)
+def _patch_timer(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    """Replace the Home Assistant interval timer with a cancel flag."""
+    cancelled: list[bool] = []
+    monkeypatch.setattr(
+        common_fleet,
+        "async_track_time_interval",
+        lambda hass, action, interval, name=None: lambda: cancelled.append(True),
+    )
+    return cancelled
+
+
+def test_phase_offset_is_deterministic_and_within_interval() -> None:
+    offsets = {phase_offset(f"192.168.1.{n}", 60) for n in range(1, 50)}
+
+    assert phase_offset("192.168.1.50", 60) == phase_offset("192.168.1.50", 60)
+    assert all(0 <= offset <= 60 for offset in offsets)
+    assert len(offsets) == 49
+
+
+def test_first_slot_is_not_placed_right_after_the_last_poll(monkeypatch) -> None:
+    monkeypatch.setattr(common_fleet.time, "monotonic", lambda: 1000.0)
+    hass = _Hass()
+    hub = EveusFleetHub(hass)
+    updater = _Updater("charger-a")
+    updater.last_poll_time = 1000.0
+
+    hub.async_add(updater)
+
+    next_due = hub._members[updater].next_due
+    assert next_due >= 1060.0
+    assert next_due - 60 < 1060.0
+    assert (next_due - 1000.0) % 60 == pytest.approx(phase_offset("charger-a", 60) % 60)
+
+
+def test_tick_polls_only_due_members_and_reschedules_them() -> None:
+    hass = _Hass()
+    hub = EveusFleetHub(hass)
+    due, later = _Updater("charger-a"), _Updater("charger-b")
+    hub.async_add(due)
+    hub.async_add(later)
+    hub._members[due].next_due = 0
+    hub._members[later].next_due = float("inf")
+
+    hub._async_tick()
+
+    async def _run() -> None:
+        await asyncio.gather(*hass.tasks)
+
+    asyncio.run(_run())
+
+    assert due.refreshes == 1
+    assert later.refreshes == 0
+    assert hub._members[due].polling is False
+    assert hub._members[due].next_due > 0
+    assert hub.metrics["members"] == 2
+    assert hub.metrics["polls_per_second"] > 0
+
+
+def test_concurrent_polls_are_capped() -> None:
+    hass = _Hass()
+    hub = EveusFleetHub(hass, max_concurrent=2)
+    updaters = [_Updater(f"charger-{n}", delay=0.01) for n in range(5)]
+    for updater in updaters:
+        hub.async_add(updater)
+        hub._members[updater].next_due = 0
+    peak: list[int] = []
+
+    async def _run() -> None:
+        hub._async_tick()
+        tasks = [asyncio.ensure_future(task) for task in hass.tasks]
+        while not all(task.done() for task in tasks):
+            peak.append(hub.metrics["in_flight"])
+            await asyncio.sleep(0.001)
+
+    asyncio.run(_run())
+
+    assert max(peak) == 2
+    assert all(updater.refreshes == 1 for updater in updaters)
+    assert hub.metrics["queue_wait_max"] > 0
+
+
+def test_removing_last_member_detaches_and_stops_timer(
+    _patch_timer: list[bool],
+) -> None:
+    hub = EveusFleetHub(_Hass())
+    updater = _Updater("charger-a")
+
+    remove = hub.async_add(updater)
+    assert updater.fleet_hub is hub
+
+    remove()
+
+    assert updater.fleet_hub is None
+    assert hub.member_count == 0
+    assert _patch_timer == [True]
+
+
+def test_startup_admission_caps_setups_and_admits_charging_first() -> None:
+    admission = StartupAdmission(max_concurrent=2)
+    order: list[str] = []
+    running = 0
+    peak = 0
+
+    async def _setup(entry_id: str, data: dict | None) -> None:
+        nonlocal running, peak
+        async with admission.slot(entry_id, startup_priority(data)):
+            order.append(entry_id)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def _run() -> None:
+        await asyncio.gather(
+            _setup("a", None),
+            _setup("b", {"state": 2}),
+            _setup("c", {"state": 2}),
+            _setup("d", {"state": 4}),
+        )
+
+    asyncio.run(_run())
+
+    assert peak == 2
+    assert order == ["a", "b", "d", "c"]
+    assert admission.setup_wait("a") < admission.setup_wait("c")
+    assert admission.metrics["burst_entries"] == 4
+    assert admission.metrics["fleet_ready_time"] >= 0.02
+    assert admission.metrics["active"] == 0
+
+
+def test_snapshot_started_entries_count_once_and_finish_after_first_refresh(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    admission = StartupAdmission(max_concurrent=2)
+    refreshed: list[str] = []
+    ready_at_last_refresh: list[float | None] = []
+
+    async def _start(entry_id: str) -> asyncio.Task:
+        async with admission.slot(entry_id, 1, finished=False):
+            await asyncio.sleep(0.01)
+
+        async def _first_refresh() -> None:
+            await asyncio.sleep(0.01)
+            async with admission.slot(entry_id, 1):
+                await asyncio.sleep(0.01)
+                refreshed.append(entry_id)
+                if len(refreshed) == 5:
+                    ready_at_last_refresh.append(admission.metrics["fleet_ready_time"])
+
+        return asyncio.get_running_loop().create_task(_first_refresh())
+
+    async def _run() -> None:
+        refreshes = await asyncio.gather(*(_start(f"entry-{i}") for i in range(5)))
+        await asyncio.gather(*refreshes)
+
+    with caplog.at_level(logging.INFO, logger="custom_components.eveus.common_fleet"):
+        asyncio.run(_run())
+
+    assert len(refreshed) == 5
+    assert ready_at_last_refresh == [None]
+    assert admission.metrics["burst_entries"] == 5
+    assert admission.metrics["fleet_ready_time"] >= 0.05
+    ready_logs = [
+        record.getMessage() for record in caplog.records if "ready in" in record.getMessage()
+    ]
+    assert len(ready_logs) == 1
+    assert ready_logs[0].startswith("5 Eveus chargers ready in")
@@ -3,15 +3,50 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 from datetime import timedelta
+from typing import Any, Coroutine
 
+import aiohttp
 import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.eveus import common_network
-from custom_components.eveus.common_network import EveusUpdater
-from custom_components.eveus.const import CHARGING_UPDATE_INTERVAL, IDLE_UPDATE_INTERVAL
+from custom_components.eveus import common_network, storage
+from custom_components.eveus.common_command import COMMAND_FAILED
+from custom_components.eveus.common_network import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    DATA_IO_SCHEDULERS,
+    CircuitBreaker,
+    DeviceIOScheduler,
+    EveusConnectionPool,
+    EveusUpdater,
+    PinnedResolver,
+)
+from custom_components.eveus.const import (
+    BREAKER_PROBE_TIMEOUT,
+    CHARGING_UPDATE_INTERVAL,
+    IDLE_UPDATE_INTERVAL,
+    IO_PRIORITY_COMMAND,
+    IO_PRIORITY_POLL,
+    IO_PRIORITY_PROBE,
+    IO_PRIORITY_SAFETY,
+    POOL_KEEPALIVE_TIMEOUT,
+)
+from custom_components.eveus.number import EveusCurrentNumber
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.listeners: dict[str, list[object]] = {}
+
+    def async_listen_once(self, event_type: str, listener: object):
+        listeners = self.listeners.setdefault(event_type, [])
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
 
 
 class _Hass:
@@ -19,6 +54,15 @@ class _Hass:
 
     loop = None
 
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.bus = _Bus()
+
+    def async_create_background_task(
+        self, coro: Coroutine[Any, Any, Any], name: str, eager_start: bool = True
+    ) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
 
 class _Response:
     def __init__(self, *, status: int = 200, payload: object | None = None) -> None:
@@ -34,13 +78,15 @@ class _Response:
     def raise_for_status(self) -> None:
         return None
 
-    async def text(self) -> str:
+    async def read(self) -> bytes:
         if isinstance(self.payload, str):
-            return self.payload
-        return json.dumps(self.payload)
+            return self.payload.encode()
+        return json.dumps(self.payload).encode()
 
 
 class _Session:
+    closed = False
+
     def __init__(self, response: _Response) -> None:
         self.response = response
         self.calls: list[dict[str, object]] = []
@@ -49,12 +95,22 @@ class _Session:
         self.calls.append({"url": url, **kwargs})
         return self.response
 
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _use_session(monkeypatch: pytest.MonkeyPatch, session: _Session) -> None:
+    """Serve every pooled request from a fake session."""
+    monkeypatch.setattr(
+        common_network.EveusConnectionPool, "_create_session", lambda self: session
+    )
+
 
 @pytest.fixture
 def coordinator(monkeypatch: pytest.MonkeyPatch) -> tuple[EveusUpdater, _Session]:
     """Create a coordinator with a fake HTTP session."""
     session = _Session(_Response(payload={"state": 4, "powerMeas": 7200}))
-    monkeypatch.setattr(common_network, "async_get_clientsession", lambda hass: session)
+    _use_session(monkeypatch, session)
     return EveusUpdater("192.168.1.50", "admin", "secret", _Hass()), session
 
 
@@ -75,7 +131,7 @@ def test_update_data_sets_idle_interval_when_device_is_not_active(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     session = _Session(_Response(payload={"state": 2, "powerMeas": 0}))
-    monkeypatch.setattr(common_network, "async_get_clientsession", lambda hass: session)
+    _use_session(monkeypatch, session)
     updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
 
     asyncio.run(updater._async_update_data())
@@ -87,7 +143,7 @@ def test_update_data_raises_auth_failed_on_unauthorized(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     session = _Session(_Response(status=401))
-    monkeypatch.setattr(common_network, "async_get_clientsession", lambda hass: session)
+    _use_session(monkeypatch, session)
     updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
 
     with pytest.raises(ConfigEntryAuthFailed):
@@ -98,7 +154,7 @@ def test_update_data_raises_update_failed_for_bad_json(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     session = _Session(_Response(payload="{not-json"))
-    monkeypatch.setattr(common_network, "async_get_clientsession", lambda hass: session)
+    _use_session(monkeypatch, session)
     updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
 
     with pytest.raises(UpdateFailed):
@@ -107,3 +163,846 @@ def test_update_data_raises_update_failed_for_bad_json(
     assert updater.connection_quality["consecutive_failures"] == 1
     assert updater.connection_quality["last_error"] == "JSONDecodeError"
 
+
+def test_circuit_breaker_opens_backs_off_and_closes() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, base_delay=30, max_delay=600)
+
+    for _ in range(3):
+        assert breaker.allow_request(now=0)
+        breaker.record_failure(now=0)
+
+    assert breaker.state == BREAKER_OPEN
+    assert 15 <= breaker.retry_in(now=0) <= 30
+    assert not breaker.allow_request(now=10)
+
+    assert breaker.allow_request(now=30)
+    assert breaker.probing
+    breaker.record_failure(now=30)
+
+    assert breaker.state == BREAKER_OPEN
+    assert 30 <= breaker.retry_in(now=30) <= 60
+
+    assert breaker.allow_request(now=90)
+    breaker.record_success()
+
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.diagnostics["transitions"] == {
+        BREAKER_OPEN: 2,
+        BREAKER_HALF_OPEN: 2,
+        BREAKER_CLOSED: 1,
+    }
+
+
+class _Writer:
+    """Probe socket whose peer resets the connection while it closes."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.waited = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        self.waited = True
+        raise ConnectionResetError
+
+
+def _serve_tcp_probes(
+    monkeypatch: pytest.MonkeyPatch, updater: EveusUpdater, *results: bool
+) -> list[_Writer]:
+    """Answer TCP reachability probes from results instead of the network."""
+    queue = list(results)
+    writers: list[_Writer] = []
+
+    async def _connect(host: str, port: int) -> tuple[None, _Writer]:
+        assert (host, port) == (updater.host, 80)
+        if not queue.pop(0):
+            raise ConnectionRefusedError
+        writers.append(_Writer())
+        return None, writers[-1]
+
+    monkeypatch.setattr(common_network.asyncio, "open_connection", _connect)
+    return writers
+
+
+def test_open_breaker_skips_polls_and_probes_with_short_timeout(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.breaker._open(now=time.monotonic())
+    writers = _serve_tcp_probes(monkeypatch, updater, True, True)
+
+    with pytest.raises(UpdateFailed):
+        asyncio.run(updater._async_update_data())
+    assert session.calls == []
+    assert updater.is_likely_offline
+    # The probe socket is fully closed before the probe reports success
+    assert writers[0].closed and writers[0].waited
+
+    updater.breaker._retry_at = 0
+    asyncio.run(updater._async_update_data())
+
+    assert session.calls[0]["timeout"].total == BREAKER_PROBE_TIMEOUT
+    assert updater.breaker.state == BREAKER_CLOSED
+    assert not updater.is_likely_offline
+
+
+def test_tcp_probe_polls_as_soon_as_an_offline_charger_accepts(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.breaker._open(now=time.monotonic())
+    _serve_tcp_probes(monkeypatch, updater, False, True)
+
+    with pytest.raises(UpdateFailed):
+        asyncio.run(updater._async_update_data())
+    assert updater.update_interval.total_seconds() <= 10
+
+    data = asyncio.run(updater._async_update_data())
+
+    assert data == {"state": 4, "powerMeas": 7200}
+    assert len(session.calls) == 1
+    assert updater.breaker.state == BREAKER_CLOSED
+    assert updater.probe_stats == {"sent": 2, "reachable": 1, "last_reachable": None}
+
+
+def test_send_command_skips_values_the_device_already_reports(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, session = coordinator
+    updater.data = {"evseEnabled": 1, "currentSet": 16}
+    refreshes: list[bool] = []
+
+    async def _refresh() -> None:
+        refreshes.append(True)
+
+    updater.async_request_refresh = _refresh
+
+    assert asyncio.run(updater.send_command("currentSet", 16.0)) is True
+    assert asyncio.run(updater.send_command("rstEM1", 0)) is True
+
+    assert [call["data"] for call in session.calls] == ["pageevent=rstEM1&rstEM1=0"]
+    assert refreshes == [True]
+    assert updater.command_stats["skipped"] == 1
+    assert updater.command_stats["sent"] == 1
+
+
+def _confirm_with(
+    monkeypatch: pytest.MonkeyPatch, updater: EveusUpdater, *payloads: dict | None
+) -> list[dict | None]:
+    """Serve confirmation polls from payloads; None simulates a failed poll."""
+    monkeypatch.setattr(common_network, "COMMAND_CONFIRM_DELAYS", (0, 0, 0))
+    served: list[dict | None] = []
+    queue = list(payloads)
+
+    async def _refresh() -> None:
+        payload = queue.pop(0) if queue else payloads[-1]
+        served.append(payload)
+        updater.last_update_success = payload is not None
+        if payload is not None:
+            updater.data = payload
+
+    updater.async_refresh = _refresh
+    return served
+
+
+def test_send_command_compares_against_queued_write_before_device_state(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"currentSet": 16}
+    _confirm_with(monkeypatch, updater, {"currentSet": 16})
+
+    async def _run() -> list[bool]:
+        updater.io_scheduler._last_end = asyncio.get_running_loop().time()
+        return await asyncio.gather(
+            updater.send_command("currentSet", 10),
+            updater.send_command("currentSet", 16),
+            updater.send_command("currentSet", 16),
+        )
+
+    assert asyncio.run(_run()) == [True, True, True]
+    assert [call["data"] for call in session.calls] == [
+        "pageevent=currentSet&currentSet=16"
+    ]
+    assert updater.command_stats == {"sent": 1, "merged": 1, "skipped": 1, "pending": 0}
+
+
+def test_send_command_fails_writes_the_charger_rejects_or_never_reports(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"currentSet": 10}
+    _confirm_with(monkeypatch, updater, {"currentSet": 10})
+
+    async def _run(value: int) -> bool:
+        updater.io_scheduler._last_end = asyncio.get_running_loop().time()
+        return await updater.send_command("currentSet", value)
+
+    assert asyncio.run(_run(16)) is False
+
+    _confirm_with(monkeypatch, updater, None)
+    assert asyncio.run(_run(12)) is False
+    assert len(session.calls) == 2
+
+
+def test_concurrent_slider_changes_merge_into_one_write(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"currentSet": 8}
+    _confirm_with(monkeypatch, updater, {"currentSet": 16})
+    number = EveusCurrentNumber(updater, "16A")
+    number.async_write_ha_state = lambda: None
+
+    async def _run() -> None:
+        updater.io_scheduler._last_end = asyncio.get_running_loop().time()
+        await asyncio.gather(
+            *(number.async_set_native_value(amps) for amps in range(7, 17))
+        )
+
+    asyncio.run(_run())
+
+    assert [call["data"] for call in session.calls] == [
+        "pageevent=currentSet&currentSet=16"
+    ]
+    assert updater.command_stats["merged"] == 9
+    assert number.native_value == 16
+
+
+def test_only_the_latest_write_to_a_key_is_confirmed(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"currentSet": 8}
+    served = _confirm_with(monkeypatch, updater, {"currentSet": 16})
+    updater.io_scheduler._min_spacing = 0.01
+
+    async def _run() -> list[str]:
+        return await asyncio.gather(
+            updater.async_write("currentSet", 10),
+            updater.async_write("currentSet", 12),
+            updater.async_write("currentSet", 16),
+        )
+
+    assert asyncio.run(_run()) == ["confirmed"] * 3
+    assert [call["data"] for call in session.calls] == [
+        "pageevent=currentSet&currentSet=10",
+        "pageevent=currentSet&currentSet=16",
+    ]
+    assert served == [{"currentSet": 16}]
+
+
+def test_reverting_a_write_during_its_confirmation_is_sent(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"currentSet": 16}
+    updater.io_scheduler._min_spacing = 0.01
+    monkeypatch.setattr(common_network, "COMMAND_CONFIRM_DELAYS", (0.05, 0.1))
+
+    async def _refresh() -> None:
+        # The charger reports the value it was last sent
+        updater.data = {"currentSet": int(session.calls[-1]["data"].split("=")[-1])}
+        updater.last_update_success = True
+
+    updater.async_refresh = _refresh
+
+    async def _run() -> list[str]:
+        first = asyncio.create_task(updater.async_write("currentSet", 20))
+        while updater._command_manager.latest("currentSet").confirmation is None:
+            await asyncio.sleep(0)
+        # 20 is sent and awaiting confirmation; the last poll still says 16
+        reverted = await updater.async_write("currentSet", 16)
+        return [await first, reverted]
+
+    assert asyncio.run(_run()) == ["confirmed", "confirmed"]
+    assert [call["data"] for call in session.calls] == [
+        "pageevent=currentSet&currentSet=20",
+        "pageevent=currentSet&currentSet=16",
+    ]
+    assert updater.data == {"currentSet": 16}
+    assert updater.command_stats["skipped"] == 0
+
+
+def test_confirmation_polls_do_not_steer_the_poll_interval(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    monkeypatch.setattr(common_network, "COMMAND_CONFIRM_DELAYS", (0,))
+    asked: list[dict] = []
+    monkeypatch.setattr(
+        updater.interval_controller,
+        "next_interval",
+        lambda data, now=None: asked.append(data) or 30,
+    )
+
+    async def _run() -> str:
+        await updater.async_refresh()
+        return await updater.async_write("evseEnabled", 0)
+
+    assert asyncio.run(_run()) == "timed_out"
+    assert len(session.calls) == 3
+    assert len(asked) == 1
+
+
+@pytest.mark.parametrize(
+    ("payloads", "expected", "polls"),
+    [
+        (({"evseEnabled": 1}, {"evseEnabled": 0}), "confirmed", 2),
+        (({"evseEnabled": 1},), "rejected", 3),
+        ((None,), "timed_out", 3),
+    ],
+)
+def test_async_write_confirms_by_reading_back_the_written_key(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+    payloads: tuple[dict | None, ...],
+    expected: str,
+    polls: int,
+) -> None:
+    updater, session = coordinator
+    updater.data = {"evseEnabled": 1}
+    served = _confirm_with(monkeypatch, updater, *payloads)
+
+    assert asyncio.run(updater.async_write("evseEnabled", 0)) == expected
+    assert len(session.calls) == 1
+    assert len(served) == polls
+
+
+def test_io_scheduler_serves_waiters_by_priority_with_spacing() -> None:
+    scheduler = DeviceIOScheduler("192.168.1.50", min_spacing=0.02)
+    order: list[str] = []
+    starts: list[float] = []
+
+    async def _request(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            starts.append(asyncio.get_running_loop().time())
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def _run() -> None:
+        first = asyncio.ensure_future(_request("poll-1", IO_PRIORITY_POLL))
+        await asyncio.sleep(0)
+        await asyncio.gather(
+            first,
+            _request("probe", IO_PRIORITY_PROBE),
+            _request("poll-2", IO_PRIORITY_POLL),
+            _request("command", IO_PRIORITY_COMMAND),
+            _request("safety", IO_PRIORITY_SAFETY),
+        )
+
+    asyncio.run(_run())
+
+    assert order == ["poll-1", "safety", "command", "poll-2", "probe"]
+    assert all(later - earlier >= 0.03 for earlier, later in zip(starts, starts[1:]))
+    metrics = scheduler.metrics
+    assert metrics["queued"] == 0 and metrics["busy"] is False
+    assert metrics["classes"]["probe"]["queue_wait_max"] > metrics["classes"]["safety"][
+        "queue_wait_max"
+    ]
+
+
+def test_io_scheduler_skips_cancelled_waiters() -> None:
+    scheduler = DeviceIOScheduler("192.168.1.50", min_spacing=0)
+    served: list[str] = []
+
+    async def _request(name: str) -> None:
+        async with scheduler.slot(IO_PRIORITY_POLL):
+            served.append(name)
+            await asyncio.sleep(0.01)
+
+    async def _run() -> None:
+        first = asyncio.ensure_future(_request("first"))
+        await asyncio.sleep(0)
+        cancelled = asyncio.ensure_future(_request("cancelled"))
+        last = asyncio.ensure_future(_request("last"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(first, last)
+
+    asyncio.run(_run())
+
+    assert served == ["first", "last"]
+    assert scheduler.metrics["busy"] is False
+
+
+class _MemoryStore:
+    """In-memory replacement for Home Assistant storage."""
+
+    saved: dict[str, object] = {}
+
+    def __init__(self, hass: object, version: int, key: str) -> None:
+        return None
+
+    async def async_load(self) -> dict[str, object]:
+        return type(self).saved
+
+    async def async_save(self, data: dict[str, object]) -> None:
+        type(self).saved = data
+
+    def async_delay_save(self, data_func: object, delay: float) -> None:
+        return None
+
+
+class _Entry:
+    entry_id = "entry"
+
+    def async_on_unload(self, func: object) -> None:
+        return None
+
+    def async_create_background_task(
+        self,
+        hass: _Hass,
+        coro: Coroutine[Any, Any, Any],
+        name: str,
+        eager_start: bool = True,
+    ) -> asyncio.Task:
+        return hass.async_create_background_task(coro, name, eager_start)
+
+
+@pytest.fixture
+def memory_store(monkeypatch: pytest.MonkeyPatch) -> type[_MemoryStore]:
+    _MemoryStore.saved = {}
+    monkeypatch.setattr(storage, "Store", _MemoryStore)
+    return _MemoryStore
+
+
+def test_poll_timeout_adapts_and_persists(
+    monkeypatch: pytest.MonkeyPatch, memory_store: type[_MemoryStore]
+) -> None:
+    session = _Session(_Response(payload={"state": 2}))
+    _use_session(monkeypatch, session)
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass(), _Entry())
+
+    asyncio.run(updater._async_update_data())
+    asyncio.run(updater._async_update_data())
+
+    assert session.calls[0]["timeout"].total == 20
+    assert session.calls[1]["timeout"].total < 20
+    assert updater.connection_quality["timeout_poll"] < 20
+    assert updater.connection_quality["timeout_rate_poll"] == 0
+
+    asyncio.run(updater.async_shutdown())
+    restarted = EveusUpdater("192.168.1.50", "admin", "secret", _Hass(), _Entry())
+    asyncio.run(restarted.async_load_state())
+
+    assert restarted.poll_timeout.timeout == updater.poll_timeout.timeout
+
+
+def test_restart_starts_from_stale_snapshot_until_live_poll(
+    monkeypatch: pytest.MonkeyPatch, memory_store: type[_MemoryStore]
+) -> None:
+    _use_session(monkeypatch, _Session(_Response(payload={"state": 4, "currentSet": 16})))
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass(), _Entry())
+    updater.data = asyncio.run(updater._async_update_data())
+    asyncio.run(updater.async_shutdown())
+
+    restarted = EveusUpdater("192.168.1.50", "admin", "secret", _Hass(), _Entry())
+    asyncio.run(restarted.async_load_state())
+
+    assert restarted.data == {"state": 4, "currentSet": 16}
+    assert restarted.snapshot_age is not None
+
+    _use_session(monkeypatch, _Session(_Response(payload={"state": 2, "currentSet": 16})))
+    asyncio.run(restarted._async_update_data())
+
+    assert restarted.snapshot_age is None
+    assert restarted._changed_keys is None
+
+
+def test_stale_snapshot_does_not_satisfy_writes(
+    coordinator: tuple[EveusUpdater, _Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    updater, session = coordinator
+    updater._restore_snapshot({"time": time.time() - 60, "data": {"currentSet": 16}})
+    _confirm_with(monkeypatch, updater, {"currentSet": 16})
+
+    assert asyncio.run(updater.async_write("currentSet", 16)) == "confirmed"
+    assert updater.command_stats["skipped"] == 0
+    assert len(session.calls) == 1
+
+
+def test_validated_payload_seeds_first_refresh_when_fresh(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, session = coordinator
+    hass = updater.hass
+    common_network.async_remember_validated_payload(hass, "192.168.1.50", {"state": 2})
+    hass.data[common_network.DATA_SEED_PAYLOADS]["10.0.0.9"] = (time.time() - 60, {})
+
+    fetched_at, payload = common_network.async_pop_validated_payload(hass, "192.168.1.50")
+    updater.seed_data(payload, fetched_at - 10)
+
+    assert common_network.async_pop_validated_payload(hass, "10.0.0.9") is None
+    assert updater.data == {"state": 2}
+    assert updater.last_update_success
+    assert 49 <= updater.update_interval.total_seconds() <= 50
+    assert session.calls == []
+
+
+def test_expired_snapshot_is_ignored(memory_store: type[_MemoryStore]) -> None:
+    memory_store.saved = {"snapshot": {"time": time.time() - 30 * 86400, "data": {"state": 4}}}
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass(), _Entry())
+
+    asyncio.run(updater.async_load_state())
+
+    assert updater.data is None
+    assert updater.snapshot_age is None
+
+
+class _HangingResponse(_Response):
+    async def __aenter__(self) -> "_Response":
+        await asyncio.sleep(3600)
+        return self
+
+
+def test_reading_is_parsed_once_per_payload(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, _ = coordinator
+    updater.data = asyncio.run(updater._async_update_data())
+
+    reading = updater.reading
+    assert reading.powerMeas == 7200
+    assert updater.reading is reading
+
+    updater.data = {"powerMeas": "3265.55"}
+    assert updater.reading.powerMeas == 3265.6
+
+
+def test_shutdown_cancels_in_flight_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _Session(_HangingResponse())
+    _use_session(monkeypatch, session)
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
+
+    async def _run() -> tuple[asyncio.Task, asyncio.Task]:
+        poll = asyncio.ensure_future(updater._async_update_data())
+        write = asyncio.ensure_future(updater.async_write("currentSet", 10))
+        await asyncio.sleep(0.6)
+        assert updater.lifecycle_stats["io_tasks"] == 2
+        await updater.async_shutdown()
+        await asyncio.wait((poll, write))
+        return poll, write
+
+    poll, write = asyncio.run(asyncio.wait_for(_run(), 5))
+    # Only the updater's own tasks are cancelled, never the callers'.
+    assert not poll.cancelled() and not write.cancelled()
+    assert isinstance(poll.exception(), UpdateFailed)
+    assert write.result() == COMMAND_FAILED
+    assert updater.lifecycle_stats["io_tasks"] == 0
+    assert updater.lifecycle_stats["last_unload"]["cancelled"] == 2
+    assert updater.lifecycle_stats["last_unload"]["duration_ms"] < 1000
+    assert session.closed
+
+
+def test_io_scheduler_is_shared_per_host_and_released_with_the_last_user(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _use_session(monkeypatch, _Session(_Response()))
+    hass = _Hass()
+    first = EveusUpdater("192.168.1.50", "admin", "secret", hass)
+    second = EveusUpdater("192.168.1.50", "admin", "secret", hass)
+    assert first.io_scheduler is second.io_scheduler
+
+    asyncio.run(first.async_shutdown())
+    asyncio.run(first.async_shutdown())
+    assert hass.data[DATA_IO_SCHEDULERS]["192.168.1.50"] is second.io_scheduler
+
+    asyncio.run(second.async_shutdown())
+    assert "192.168.1.50" not in hass.data[DATA_IO_SCHEDULERS]
+
+
+def test_fleet_hub_takes_over_refresh_scheduling(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, _ = coordinator
+    hub = object()
+
+    updater.attach_fleet_hub(hub)
+    updater._schedule_refresh()
+
+    assert updater.fleet_hub is hub
+    assert updater._unsub_refresh is None
+
+
+def test_connection_pool_reports_reuse_ratio_and_connect_time() -> None:
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+
+    async def _simulate() -> None:
+        await pool._on_connection_create_start()
+        await pool._on_connection_create_end()
+        await pool._on_connection_reuseconn()
+        await pool._on_connection_reuseconn()
+        await pool._on_connection_reuseconn()
+
+    asyncio.run(_simulate())
+
+    assert pool.metrics["connection_mode"] == "keep-alive"
+    assert pool.metrics["connection_reuse_ratio"] == 0.75
+    assert pool.metrics["connect_time_avg"] >= 0
+    assert pool.headers == {}
+
+
+def test_connection_pool_switches_to_close_mode_after_idle_drops() -> None:
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+    drop = aiohttp.ServerDisconnectedError()
+
+    asyncio.run(pool._on_connection_reuseconn())
+    assert pool.retry_on_fresh_connection(drop)
+    assert pool.mode == "keep-alive"
+
+    asyncio.run(pool._on_connection_reuseconn())
+    assert pool.retry_on_fresh_connection(drop)
+    assert pool.mode == "close"
+    assert pool.headers == {"Connection": "close"}
+
+
+def test_connection_pool_does_not_retry_errors_on_fresh_connections() -> None:
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+
+    for _ in range(5):
+        assert not pool.retry_on_fresh_connection(aiohttp.ServerDisconnectedError())
+
+    assert pool.mode == "keep-alive"
+
+
+def test_connection_pool_falls_back_to_shared_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    shared = _Session(_Response())
+    monkeypatch.setattr(common_network, "async_get_clientsession", lambda hass: shared)
+
+    def _broken(self: EveusConnectionPool) -> None:
+        raise RuntimeError("no connector")
+
+    monkeypatch.setattr(EveusConnectionPool, "_create_session", _broken)
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+
+    assert pool.get_session() is shared
+    assert pool.mode == "shared"
+
+
+def test_connection_pool_bounds_connections_per_host() -> None:
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+
+    async def _create() -> aiohttp.TCPConnector:
+        session = pool.get_session()
+        connector = session.connector
+        await pool.async_close()
+        await connector.close()
+        return connector
+
+    connector = asyncio.run(_create())
+
+    assert connector.closed
+    assert isinstance(connector._resolver, PinnedResolver)
+    assert connector.limit_per_host == 2
+    assert connector.force_close is False
+    assert connector._keepalive_timeout == POOL_KEEPALIVE_TIMEOUT
+
+
+def test_connection_pool_swaps_sessions_only_between_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions = [_Session(_Response()), _Session(_Response())]
+    monkeypatch.setattr(
+        EveusConnectionPool, "_create_session", lambda self: sessions.pop(0)
+    )
+    pool = EveusConnectionPool(_Hass(), "192.168.1.50")
+
+    async def _run() -> tuple[_Session, _Session]:
+        old = pool.get_session()
+        await pool._on_connection_reuseconn()
+        assert pool.retry_on_fresh_connection(aiohttp.ServerDisconnectedError())
+        # A request holding the charger keeps its session open
+        assert not old.closed
+        new = pool.get_session()
+        await asyncio.sleep(0)
+        return old, new
+
+    old, new = asyncio.run(_run())
+
+    assert new is not old
+    assert old.closed and not new.closed
+
+
+def test_connection_pool_closes_on_home_assistant_stop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _Session(_Response())
+    _use_session(monkeypatch, session)
+    hass = _Hass()
+    pool = EveusConnectionPool(hass, "192.168.1.50")
+
+    pool.get_session()
+    pool.get_session()
+    (listener,) = hass.bus.listeners[EVENT_HOMEASSISTANT_CLOSE]
+    asyncio.run(listener(None))
+
+    assert session.closed
+    assert pool._unsub_close is None
+
+
+class _DroppedResponse(_Response):
+    """Response whose reused socket the charger already closed."""
+
+    async def __aenter__(self) -> "_Response":
+        raise aiohttp.ServerDisconnectedError()
+
+
+class _DroppingSession(_Session):
+    """Serve dropped responses first, then the real one."""
+
+    def __init__(self, response: _Response, drops: int) -> None:
+        super().__init__(response)
+        self.drops = drops
+
+    def post(self, url: str, **kwargs: object) -> _Response:
+        self.calls.append({"url": url, **kwargs})
+        if self.drops:
+            self.drops -= 1
+            return _DroppedResponse()
+        return self.response
+
+
+def test_poll_on_a_dropped_reused_socket_retries_without_failing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _DroppingSession(_Response(payload={"state": 2}), drops=1)
+    _use_session(monkeypatch, session)
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
+
+    async def _run() -> dict:
+        updater.connection_pool._last_request_reused = True
+        return await updater._async_update_data()
+
+    assert asyncio.run(_run()) == {"state": 2}
+    assert len(session.calls) == 2
+    assert updater.connection_quality["success_rate_lifetime"] == 100
+    assert updater.connection_quality["last_error"] is None
+    assert updater.breaker.state == BREAKER_CLOSED
+
+
+class _Resolver:
+    """Hand out a new address per lookup, or fail when told to."""
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.fail = False
+
+    async def resolve(self, host: str, port: int = 0, family: int = 0) -> list[dict]:
+        self.lookups += 1
+        if self.fail:
+            raise OSError("lookup failed")
+        return [{"hostname": host, "host": f"10.0.0.{self.lookups}", "port": port,
+                 "family": 2, "proto": 0, "flags": 0}]
+
+    async def close(self) -> None:
+        return None
+
+
+def test_pinned_resolver_reuses_address_until_invalidated() -> None:
+    resolver = PinnedResolver(ttl=3600)
+    resolver._inner = inner = _Resolver()
+
+    async def _lookup() -> str:
+        return (await resolver.resolve("eveus.local", 80))[0]["host"]
+
+    assert asyncio.run(_lookup()) == "10.0.0.1"
+    assert asyncio.run(_lookup()) == "10.0.0.1"
+    assert inner.lookups == 1
+
+    resolver.invalidate()
+    inner.fail = True
+    assert asyncio.run(_lookup()) == "10.0.0.1"
+
+    inner.fail = False
+    assert asyncio.run(_lookup()) == "10.0.0.3"
+    assert resolver.metrics["re_resolutions"] == 1
+    assert resolver.metrics["failures"] == 1
+
+
+def test_pinned_address_survives_restart_for_the_same_hostname() -> None:
+    resolver = PinnedResolver()
+    resolver._inner = _Resolver()
+    asyncio.run(resolver.resolve("eveus.local", 80))
+
+    restored = PinnedResolver()
+    restored.restore(resolver.as_dict(), "eveus.local")
+    other = PinnedResolver()
+    other.restore(resolver.as_dict(), "garage.local")
+
+    assert restored.pinned_address == "10.0.0.1"
+    assert other.pinned_address is None
+
+
+def test_connect_errors_invalidate_the_pinned_address() -> None:
+    pool = EveusConnectionPool(_Hass(), "eveus.local")
+    pool.resolver._inner = _Resolver()
+    asyncio.run(pool.async_resolve())
+
+    pool.record_error(
+        aiohttp.ClientConnectorError(
+            type("_Key", (), {"ssl": None, "host": "eveus.local", "port": 80})(),
+            OSError(113, "No route to host"),
+        )
+    )
+
+    assert asyncio.run(pool.async_resolve()) == "10.0.0.2"
+
+
+def test_key_dispatch_notifies_only_listeners_of_changed_keys(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, session = coordinator
+    updater.update_interval = None
+    calls: list[str] = []
+    updater.async_add_listener(lambda: calls.append("power"), frozenset({"powerMeas"}))
+    updater.async_add_listener(lambda: calls.append("voltage"), frozenset({"voltMeas1"}))
+    updater.async_add_listener(lambda: calls.append("always"))
+
+    updater.data = asyncio.run(updater._async_update_data())
+    updater.async_update_listeners()
+    assert sorted(calls) == ["always", "power", "voltage"]
+
+    calls.clear()
+    session.response.payload = {"state": 4, "powerMeas": 7100}
+    updater.data = asyncio.run(updater._async_update_data())
+    updater.async_update_listeners()
+
+    assert sorted(calls) == ["always", "power"]
+    assert updater.dispatch_stats["skipped"] == 1
+
+
+def test_removing_keyed_listener_drops_it_from_index(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, _ = coordinator
+    updater.update_interval = None
+    remove = updater.async_add_listener(lambda: None, frozenset({"powerMeas"}))
+
+    assert updater.dispatch_stats["indexed_keys"] == 1
+    remove()
+    assert updater.dispatch_stats["indexed_keys"] == 0
+
+
+def test_update_data_records_decoder_and_decode_time(
+    coordinator: tuple[EveusUpdater, _Session],
+) -> None:
+    updater, _ = coordinator
+
+    asyncio.run(updater._async_update_data())
+
+    assert updater.connection_quality["decoder"] == "orjson"
+    assert updater.connection_quality["decode_time_avg"] > 0
@@ -18,6 +18,10 @@ from custom_components.eveus.config_flow import (
     validate_host,
     validate_input,
 )
+from custom_components.eveus.common_network import (
+    DATA_IO_SCHEDULERS,
+    async_pop_validated_payload,
+)
 from custom_components.eveus.const import CONF_MODEL, MODEL_16A
 
 
@@ -54,6 +58,7 @@ class _Session:
 class _Hass:
     def __init__(self, session: _Session) -> None:
         self.session = session
+        self.data: dict[str, object] = {}
 
 
 @pytest.fixture(autouse=True)
@@ -146,6 +151,9 @@ def test_validate_input_posts_to_normalized_host() -> None:
     assert result["data"][CONF_HOST] == "192.168.1.50"
     assert result["device_info"]["current_set"] == 12
     assert session.calls[0]["url"] == "http://192.168.1.50/main"
+    assert async_pop_validated_payload(hass, "192.168.1.50")[1]["currentSet"] == "12"
+    assert async_pop_validated_payload(hass, "192.168.1.50") is None
+    assert not hass.data[DATA_IO_SCHEDULERS]
 
 
 def test_validate_input_rejects_unauthorized_response() -> None:
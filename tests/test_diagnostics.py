@@ -21,14 +21,28 @@ def test_diagnostics_redacts_credentials_and_reports_coordinator_state() -> None
         update_interval=timedelta(seconds=30),
         connection_quality={"success_rate": 100},
         is_likely_offline=False,
+        snapshot_age=None,
+        dispatch_stats={"notified": 3, "skipped": 30, "indexed_keys": 20},
+        interval_controller=SimpleNamespace(state={"interval": 30.0}),
+        breaker=SimpleNamespace(diagnostics={"state": "closed"}),
+        probe_stats={"sent": 0, "reachable": 0, "last_reachable": None},
+        command_stats={"sent": 2, "merged": 8, "skipped": 5, "pending": 0},
+        connection_pool=SimpleNamespace(
+            resolver=SimpleNamespace(metrics={"pinned_address": None, "resolutions": 0})
+        ),
+        io_scheduler=SimpleNamespace(metrics={"queued": 0, "busy": False}),
+        lifecycle_stats={"io_tasks": 0, "last_unload": None},
+        fleet_hub=None,
+        command_journal=None,
     )
     entry = SimpleNamespace(
+        entry_id="entry",
         title="Eveus Charger",
         data={"host": "192.168.1.50", "username": "admin", "password": "secret"},
         runtime_data=SimpleNamespace(updater=updater, device_number=1),
     )
 
-    diagnostics = asyncio.run(async_get_config_entry_diagnostics(None, entry))
+    diagnostics = asyncio.run(async_get_config_entry_diagnostics(SimpleNamespace(data={}), entry))
 
     assert diagnostics["entry"]["data"] == {
         "host": "192.168.1.50",
@@ -37,4 +51,11 @@ def test_diagnostics_redacts_credentials_and_reports_coordinator_state() -> None
     }
     assert diagnostics["coordinator"]["last_update_success"] is True
     assert diagnostics["coordinator"]["update_interval"] == 30
+    assert diagnostics["coordinator"]["dispatch"]["skipped"] == 30
+    assert diagnostics["coordinator"]["polling"] == {"interval": 30.0}
+    assert diagnostics["coordinator"]["breaker"] == {"state": "closed"}
+    assert diagnostics["coordinator"]["commands"]["merged"] == 8
+    assert diagnostics["coordinator"]["io"]["queued"] == 0
     assert diagnostics["device"]["firmware"] == "3.0.3"
+    assert diagnostics["fleet"] is None
+    assert diagnostics["startup"] is None
@@ -1,7 +1,16 @@
 """Unit tests for entity construction."""
 from __future__ import annotations
 
+from functools import partial
+
+from homeassistant.components.sensor import SensorDeviceClass
+
+from custom_components.eveus.common import PayloadEntityAdder
 from custom_components.eveus.number import EveusCurrentNumber
+from custom_components.eveus.sensor_definitions import (
+    SENSOR_REGISTRY,
+    OptimizedEveusSensor,
+)
 from custom_components.eveus.switch import (
     EveusOneChargeSwitch,
     EveusResetCounterASwitch,
@@ -38,3 +47,83 @@ def test_number_entity_keeps_backward_compatible_unique_id_and_limits() -> None:
     assert entity.unique_id == "eveus_charging_current"
     assert entity.native_min_value == 7
     assert entity.native_max_value == 16
+
+
+def test_control_entities_subscribe_to_their_payload_keys() -> None:
+    updater = _Updater()
+
+    assert EveusStopChargingSwitch(updater).coordinator_context == {"evseEnabled"}
+    assert EveusResetCounterASwitch(updater).coordinator_context == {"IEM1"}
+    assert EveusCurrentNumber(updater, "16A").coordinator_context == {"currentSet"}
+
+
+def test_registry_sensors_carry_spec_attributes() -> None:
+    sensors = {
+        sensor.unique_id: sensor
+        for sensor in (
+            factory() for _, factory in SENSOR_REGISTRY.candidates(_Updater(), 2)
+        )
+    }
+    voltage = sensors["eveus2_voltage"]
+
+    assert len(sensors) == len(SENSOR_REGISTRY.specs)
+    assert voltage.device_class == SensorDeviceClass.VOLTAGE
+    assert voltage.coordinator_context == {"voltMeas1"}
+    assert type(voltage) is OptimizedEveusSensor
+    assert sensors["eveus2_connection_quality"].coordinator_context is None
+
+
+class _ListeningUpdater(_Updater):
+    def __init__(self, data: dict[str, str]) -> None:
+        self.data = data
+        self.listeners: dict[object, frozenset[str]] = {}
+
+    def async_add_listener(self, update_callback, context=None):
+        self.listeners[update_callback] = context
+        return partial(self.listeners.pop, update_callback)
+
+
+def test_entities_are_added_when_their_payload_fields_appear() -> None:
+    updater = _ListeningUpdater({"evseEnabled": "1", "IEM1": "5.5"})
+    added: list[object] = []
+    adder = PayloadEntityAdder(
+        updater,
+        added.extend,
+        [
+            (frozenset({"evseEnabled"}), partial(EveusStopChargingSwitch, updater)),
+            (frozenset({"oneCharge"}), partial(EveusOneChargeSwitch, updater)),
+            (frozenset({"IEM1"}), partial(EveusResetCounterASwitch, updater)),
+        ],
+    )
+
+    stop = adder.async_start()
+
+    assert [entity.unique_id for entity in added] == [
+        "eveus_stop_charging",
+        "eveus_reset_counter_a",
+    ]
+    assert list(updater.listeners.values()) == [frozenset({"oneCharge"})]
+
+    updater.data = {**updater.data, "oneCharge": "0"}
+    next(iter(updater.listeners))()
+
+    assert added[-1].unique_id == "eveus_one_charge"
+    assert adder.pending == 0
+    assert updater.listeners == {}
+    stop()
+
+
+def test_registry_candidates_skip_fields_the_charger_does_not_report() -> None:
+    updater = _ListeningUpdater({"voltMeas1": "230"})
+    added: list[object] = []
+    adder = PayloadEntityAdder(
+        updater, added.extend, SENSOR_REGISTRY.candidates(updater)
+    )
+
+    adder.async_start()
+    unique_ids = {entity.unique_id for entity in added}
+
+    assert {"eveus_voltage", "eveus_connection_quality"} <= unique_ids
+    assert "eveus_battery_voltage" not in unique_ids
+    assert adder.added + adder.pending == len(SENSOR_REGISTRY.specs)
+    assert "vBat" in next(iter(updater.listeners.values()))
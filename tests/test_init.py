@@ -0,0 +1,109 @@
+"""Unit tests for Eveus config entry option handling."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+
+from custom_components.eveus import (
+    EveusRuntimeData,
+    _connection_settings,
+    async_remove_entry,
+    journal,
+    storage,
+    update_listener,
+)
+from custom_components.eveus.common_network import EveusUpdater
+from custom_components.eveus.const import (
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_MODEL,
+    MODEL_16A,
+)
+
+
+class _Store:
+    removed: list[str] = []
+
+    def __init__(self, hass: object, version: int, key: str) -> None:
+        self.key = key
+
+    async def async_remove(self) -> None:
+        self.removed.append(self.key)
+
+
+class _ConfigEntries:
+    def __init__(self) -> None:
+        self.reloads: list[str] = []
+
+    async def async_reload(self, entry_id: str) -> None:
+        self.reloads.append(entry_id)
+
+
+class _Hass:
+    loop = None
+
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.config_entries = _ConfigEntries()
+
+
+def _entry(hass: _Hass) -> SimpleNamespace:
+    entry = SimpleNamespace(
+        entry_id="entry",
+        title="Eveus Charger",
+        data={
+            CONF_HOST: "192.168.1.50",
+            CONF_USERNAME: "admin",
+            CONF_PASSWORD: "secret",
+            CONF_MODEL: MODEL_16A,
+            "device_number": 1,
+        },
+        options={},
+    )
+    entry.runtime_data = EveusRuntimeData(
+        updater=EveusUpdater("192.168.1.50", "admin", "secret", hass),
+        device_number=1,
+        title=entry.title,
+        connection=_connection_settings(entry),
+    )
+    return entry
+
+
+def test_option_changes_apply_in_place_without_reload() -> None:
+    hass = _Hass()
+    entry = _entry(hass)
+    updater = entry.runtime_data.updater
+    updater.update_interval = timedelta(seconds=60)
+
+    entry.options = {CONF_MIN_POLL_INTERVAL: 5, CONF_MAX_POLL_INTERVAL: 30}
+    asyncio.run(update_listener(hass, entry))
+
+    assert hass.config_entries.reloads == []
+    assert updater.interval_controller.state["ceiling"] == 30
+    assert updater.update_interval == timedelta(seconds=30)
+
+
+def test_connection_changes_reload_the_entry() -> None:
+    hass = _Hass()
+    entry = _entry(hass)
+
+    entry.data = {**entry.data, CONF_PASSWORD: "changed"}
+    asyncio.run(update_listener(hass, entry))
+
+    assert hass.config_entries.reloads == ["entry"]
+
+
+def test_removing_an_entry_deletes_its_stored_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _Store.removed = []
+    monkeypatch.setattr(storage, "Store", _Store)
+    monkeypatch.setattr(journal, "Store", _Store)
+
+    asyncio.run(async_remove_entry(_Hass(), SimpleNamespace(entry_id="entry")))
+
+    assert _Store.removed == ["eveus.entry.state", "eveus.entry.command_journal"]
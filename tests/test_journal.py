@@ -0,0 +1,147 @@
+"""Unit tests for the Eveus command journal."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.eveus import journal as journal_module
+from custom_components.eveus.common_command import COMMAND_JOURNALED
+from custom_components.eveus.common_network import EveusUpdater
+from custom_components.eveus.journal import CommandJournal
+
+
+class _Store:
+    """In-memory replacement for Home Assistant storage."""
+
+    saved: dict[str, Any] | None = None
+
+    def __init__(self, hass: object, version: int, key: str) -> None:
+        self.key = key
+
+    async def async_load(self) -> dict[str, Any] | None:
+        return type(self).saved
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        type(self).saved = data
+
+    def async_delay_save(self, data_func: Any, delay: float) -> None:
+        type(self).saved = data_func()
+
+    async def async_remove(self) -> None:
+        type(self).saved = None
+
+
+class _Hass:
+    loop = None
+
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+
+    def async_create_background_task(
+        self, coro: Any, name: str, eager_start: bool = True
+    ) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+@pytest.fixture(autouse=True)
+def _memory_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    _Store.saved = None
+    monkeypatch.setattr(journal_module, "Store", _Store)
+
+
+def test_only_journaled_commands_are_kept_one_per_key() -> None:
+    journal = CommandJournal(_Hass(), "entry")
+
+    assert journal.record("rstEM1", 0) is False
+    assert journal.record("currentSet", 10)
+    assert journal.record("currentSet", 16)
+    assert journal.record("evseEnabled", 0)
+
+    assert [(entry.command, entry.value) for entry in journal.due()] == [
+        ("evseEnabled", 0),
+        ("currentSet", 16),
+    ]
+    assert _Store.saved is not None and len(_Store.saved["commands"]) == 2
+
+
+def test_expired_entries_are_dropped_and_counted() -> None:
+    journal = CommandJournal(_Hass(), "entry")
+    journal.record("oneCharge", 1)
+
+    assert journal.due(now=time.time() + 7200) == []
+    assert journal.diagnostics["expired"] == 1
+    assert journal.diagnostics["oldest_age"] is None
+
+
+def test_supersede_only_drops_a_different_value() -> None:
+    journal = CommandJournal(_Hass(), "entry")
+    journal.record("evseEnabled", 0)
+
+    journal.supersede("evseEnabled", 0)
+    assert journal.pending == 1
+
+    journal.supersede("evseEnabled", 1)
+    assert journal.pending == 0
+
+
+def test_journal_survives_reload() -> None:
+    CommandJournal(_Hass(), "entry").record("evseEnabled", 0)
+
+    reloaded = CommandJournal(_Hass(), "entry")
+    asyncio.run(reloaded.async_load())
+
+    assert reloaded.diagnostics["pending"] == 1
+    assert reloaded.diagnostics["commands"][0]["command"] == "evseEnabled"
+
+
+def test_diagnostics_skip_expired_entries_without_pruning_or_saving() -> None:
+    journal = CommandJournal(_Hass(), "entry")
+    journal.record("oneCharge", 1)
+    journal.record("evseEnabled", 0)
+    journal._entries["oneCharge"].expires = time.time() - 1
+    _Store.saved = None
+
+    diagnostics = journal.diagnostics
+
+    assert diagnostics["pending"] == 1
+    assert [command["command"] for command in diagnostics["commands"]] == ["evseEnabled"]
+    assert diagnostics["expired"] == 0
+    assert journal.pending == 2
+    assert _Store.saved is None
+
+
+def test_clearing_drops_stored_commands() -> None:
+    journal = CommandJournal(_Hass(), "entry")
+    journal.record("evseEnabled", 0)
+
+    asyncio.run(journal.async_clear())
+    reloaded = CommandJournal(_Hass(), "entry")
+    asyncio.run(reloaded.async_load())
+
+    assert journal.pending == 0
+    assert reloaded.pending == 0
+
+
+def test_open_breaker_journals_and_reconnect_replays() -> None:
+    updater = EveusUpdater("192.168.1.50", "admin", "secret", _Hass())
+    updater.command_journal = CommandJournal(_Hass(), "entry")
+    updater.breaker._open(now=time.monotonic())
+    writes: list[tuple[str, Any]] = []
+
+    assert asyncio.run(updater.async_write("evseEnabled", 0)) == COMMAND_JOURNALED
+    assert updater.command_journal.pending == 1
+
+    async def _write(command: str, value: Any) -> str:
+        writes.append((command, value))
+        updater.command_journal.discard(command)
+        return "confirmed"
+
+    updater.async_write = _write
+    asyncio.run(updater._async_replay_journal())
+
+    assert writes == [("evseEnabled", 0)]
+    assert updater.command_journal.diagnostics["replayed"] == 1
+    assert updater.command_journal.pending == 0
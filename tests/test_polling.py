@@ -0,0 +1,63 @@
+"""Unit tests for Eveus poll interval controllers."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.eveus.const import CHARGING_UPDATE_INTERVAL, IDLE_UPDATE_INTERVAL
+from custom_components.eveus.polling import AdaptivePollController, PollIntervalController
+
+NOON = datetime(2026, 10, 16, 12, 0)
+MIDNIGHT = datetime(2026, 10, 16, 0, 30)
+
+
+def _poll(controller: AdaptivePollController, state: int, power: float, now=NOON) -> float:
+    return controller.next_interval({"state": state, "powerMeas": power}, now)
+
+
+def test_first_poll_uses_legacy_charging_and_idle_intervals() -> None:
+    assert _poll(AdaptivePollController(), 4, 7200) == CHARGING_UPDATE_INTERVAL
+    assert _poll(AdaptivePollController(), 2, 0) == IDLE_UPDATE_INTERVAL
+
+
+def test_state_transition_polls_at_floor_then_recovers() -> None:
+    controller = AdaptivePollController(floor=5, ceiling=300)
+    _poll(controller, 3, 0)
+
+    fast = [_poll(controller, 4, 7200), _poll(controller, 4, 7200), _poll(controller, 4, 7200)]
+
+    assert fast == [5, 5, 5]
+    assert _poll(controller, 4, 7200) > 5
+
+
+def test_stable_power_backs_off_geometrically_to_active_cap() -> None:
+    controller = AdaptivePollController(floor=10, ceiling=300)
+    intervals = [_poll(controller, 4, 7200) for _ in range(8)]
+
+    assert intervals[:4] == [30, 45, 67.5, 90]
+    assert intervals[-1] == 90
+
+
+def test_power_swings_reset_to_charging_interval() -> None:
+    controller = AdaptivePollController(floor=10, ceiling=300)
+    for _ in range(5):
+        _poll(controller, 4, 7200)
+
+    assert _poll(controller, 4, 3600) == CHARGING_UPDATE_INTERVAL
+
+
+def test_standby_overnight_slows_to_ceiling_and_respects_bounds() -> None:
+    controller = AdaptivePollController(floor=10, ceiling=240)
+    _poll(controller, 2, 0, MIDNIGHT)
+
+    assert _poll(controller, 2, 0, MIDNIGHT) == 240
+    assert _poll(controller, 2, 0, NOON) <= 240
+
+
+def test_controller_without_next_interval_cannot_be_created() -> None:
+    class _Incomplete(PollIntervalController):
+        pass
+
+    with pytest.raises(TypeError):
+        _Incomplete()
@@ -3,13 +3,20 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
 from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.eveus import sensor_definitions as sensors
+from custom_components.eveus.reading import PAYLOAD_FIELDS, ChargerReading
 
 
 def _updater(data: dict[str, object], *, available: bool = True) -> SimpleNamespace:
-    return SimpleNamespace(data=data, available=available, connection_quality={})
+    return SimpleNamespace(
+        data=data,
+        reading=ChargerReading(data),
+        available=available,
+        connection_quality={},
+    )
 
 
 def test_measurement_getters_convert_device_payload_values() -> None:
@@ -86,3 +93,213 @@ def test_status_like_entities_are_diagnostic() -> None:
     assert specs["Current Set"].category == EntityCategory.DIAGNOSTIC
     assert specs["Rate 2 Status"].category == EntityCategory.DIAGNOSTIC
     assert specs["Rate 3 Status"].category == EntityCategory.DIAGNOSTIC
+
+
+def test_payload_sensors_declare_the_keys_they_read() -> None:
+    specs = {spec.name: spec for spec in sensors.get_sensor_specifications()}
+
+    assert specs["Voltage"].data_keys == ("voltMeas1",)
+    assert specs["Substate"].data_keys == ("state", "subState")
+    assert specs["Connection Quality"].data_keys == ()
+    assert all(
+        spec.data_keys for name, spec in specs.items() if name != "Connection Quality"
+    )
+
+
+def test_registry_offers_one_candidate_per_spec_keyed_by_its_fields() -> None:
+    candidates = sensors.SENSOR_REGISTRY.candidates(_updater({}), 2)
+    specs = sensors.get_sensor_specifications()
+
+    assert [fields for fields, _ in candidates] == [
+        frozenset(spec.data_keys) for spec in specs
+    ]
+    assert candidates[0][1]().unique_id == "eveus2_voltage"
+
+
+def test_registry_is_read_only_and_shares_field_sets_across_chargers() -> None:
+    registry = sensors.SENSOR_REGISTRY
+    first = sensors.OptimizedEveusSensor(_updater({}), registry.specs[0], 1)
+    second = sensors.OptimizedEveusSensor(_updater({}), registry.specs[0], 2)
+
+    assert first.DATA_KEYS is second.DATA_KEYS is registry.fields("voltage")
+    with pytest.raises(AttributeError):
+        registry.specs = ()
+    with pytest.raises(TypeError):
+        registry._fields["voltage"] = frozenset()
+
+
+def test_registry_maps_unreported_fields_to_the_sensors_reading_them() -> None:
+    unreported = sensors.SENSOR_REGISTRY.unreported({"voltMeas1": "230", "state": "2"})
+
+    assert "voltMeas1" not in unreported
+    assert unreported["subState"] == ("substate",)
+    assert "connection_quality" not in {
+        key for keys in unreported.values() for key in keys
+    }
+
+
+def test_reading_covers_every_payload_key_read_by_sensors() -> None:
+    keys = {key for spec in sensors.get_sensor_specifications() for key in spec.data_keys}
+
+    assert keys <= set(PAYLOAD_FIELDS)
+
+
+def test_reading_treats_missing_and_invalid_fields_as_none() -> None:
+    reading = ChargerReading({"state": "4", "voltMeas1": "unknown", "curMeas1": "n/a"})
+
+    assert reading.state == 4
+    assert reading.voltMeas1 is None
+    assert reading.curMeas1 is None
+    assert reading.powerMeas is None
+
+
+def test_connection_attributes_include_tail_latency_and_windows() -> None:
+    updater = SimpleNamespace(
+        data={},
+        available=True,
+        connection_quality={
+            "success_rate": 90,
+            "latency_avg": 0.2,
+            "latency_p95": 0.84,
+            "latency_p99": None,
+            "success_rate_15m": 90,
+            "errors_15m": {"timeout": 2},
+        },
+    )
+
+    attrs = sensors.get_connection_attrs(updater, None)
+
+    assert attrs["latency_p95"] == "0.84s"
+    assert "latency_p99" not in attrs
+    assert attrs["success_rate_15m"] == "90%"
+    assert attrs["errors_15m"] == {"timeout": 2}
+
+
+def test_deadband_ignores_jitter_but_not_zero_crossings() -> None:
+    deadband = sensors.Deadband(absolute=20, relative=0.02)
+
+    assert not deadband.is_significant(3300.0, 3350.0)
+    assert deadband.is_significant(3300.0, 3400.0)
+    assert deadband.is_significant(5.0, 0.0)
+    assert deadband.is_significant(None, 0.0)
+    assert not deadband.is_significant(0.0, 0.0)
+
+
+def _spec(key: str) -> sensors.SensorSpec:
+    return next(spec for spec in sensors.get_sensor_specifications() if spec.key == key)
+
+
+def test_deadband_sensor_suppresses_insignificant_writes() -> None:
+    suppressed: list[str] = []
+    updater = _updater({"voltMeas1": "230"})
+    updater.snapshot_age = None
+    updater.record_suppressed_write = suppressed.append
+    updater.async_add_listener = lambda *args: (lambda: None)
+    voltage = sensors.OptimizedEveusSensor(updater, _spec("voltage"))
+    writes: list[object] = []
+    voltage.async_write_ha_state = lambda: writes.append(voltage.native_value)
+
+    for volts in ("230", "231", "229", "236"):
+        updater.reading = ChargerReading({"voltMeas1": volts})
+        voltage._handle_coordinator_update()
+    updater.available = False
+    voltage._handle_coordinator_update()
+
+    assert writes == [230, 236, None]
+    assert voltage.suppressed_writes == 2
+    assert suppressed == ["voltage", "voltage"]
+
+
+def test_deadband_writes_a_settled_value_after_max_silence(monkeypatch) -> None:
+    now = [1000.0]
+    scheduled: list[tuple[float, object]] = []
+    cancelled: list[object] = []
+    monkeypatch.setattr(sensors.time, "monotonic", lambda: now[0])
+
+    def _call_later(hass, delay, action):
+        scheduled.append((delay, action))
+        return lambda: cancelled.append(action)
+
+    monkeypatch.setattr(sensors, "async_call_later", _call_later)
+    updater = _updater({"voltMeas1": "230"})
+    updater.snapshot_age = None
+    updater.record_suppressed_write = lambda key: None
+    updater.async_add_listener = lambda *args: (lambda: None)
+    voltage = sensors.OptimizedEveusSensor(updater, _spec("voltage"))
+    voltage.hass = object()
+    writes: list[object] = []
+    voltage.async_write_ha_state = lambda: writes.append(voltage.native_value)
+
+    voltage._handle_coordinator_update()
+    now[0] += 10
+    updater.reading = ChargerReading({"voltMeas1": "231"})
+    voltage._handle_coordinator_update()
+
+    # The value stays at 231, so no further update reaches the sensor.
+    assert writes == [230]
+    assert len(scheduled) == 1
+    delay, action = scheduled[0]
+    assert delay == voltage._spec.deadband.max_silence - 10
+
+    now[0] += delay
+    action(None)
+
+    assert writes == [230, 231]
+    updater.reading = ChargerReading({"voltMeas1": "240"})
+    voltage._handle_coordinator_update()
+    assert writes == [230, 231, 240]
+    assert cancelled == []
+
+    # A significant change cancels the pending silence write.
+    updater.reading = ChargerReading({"voltMeas1": "241"})
+    voltage._handle_coordinator_update()
+    updater.reading = ChargerReading({"voltMeas1": "250"})
+    voltage._handle_coordinator_update()
+    assert writes == [230, 231, 240, 250]
+    assert cancelled == [scheduled[1][1]]
+
+
+def _tiered_sensor(key: str, data: dict[str, object]):
+    updater = _updater(data)
+    updater.snapshot_age = None
+    updater.deferred = []
+    updater.record_deferred_update = updater.deferred.append
+    updater.record_suppressed_write = lambda key: None
+    updater.async_add_listener = lambda *args: (lambda: None)
+    sensor = sensors.OptimizedEveusSensor(updater, _spec(key))
+    writes: list[object] = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.native_value)
+    return updater, sensor, writes
+
+
+def test_periodic_tier_refreshes_at_most_once_per_interval(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(sensors.time, "monotonic", lambda: now[0])
+    updater, battery, writes = _tiered_sensor("battery_voltage", {"vBat": "3.00"})
+
+    battery._handle_coordinator_update()
+    updater.reading = ChargerReading({"vBat": "2.50"})
+    battery._handle_coordinator_update()
+    now[0] += sensors.REFRESH_PERIODIC_INTERVAL
+    battery._handle_coordinator_update()
+
+    assert writes == [3.0, 2.5]
+    assert updater.deferred == ["battery_voltage"]
+
+
+def test_slow_sensors_use_the_periodic_tier() -> None:
+    periodic = {
+        spec.key
+        for spec in sensors.get_sensor_specifications()
+        if spec.refresh is sensors.RefreshTier.PERIODIC
+    }
+
+    assert periodic == {
+        "battery_voltage",
+        "ground",
+        "primary_rate_cost",
+        "rate_2_cost",
+        "rate_3_cost",
+        "rate_2_status",
+        "rate_3_status",
+    }
@@ -0,0 +1,117 @@
+"""Unit tests for Eveus connection telemetry."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from custom_components.eveus.telemetry import (
+    AdaptiveTimeout,
+    ConnectionTelemetry,
+    LatencySketch,
+    RollingCounter,
+    classify_error,
+)
+
+
+def test_latency_sketch_quantiles_stay_within_relative_error() -> None:
+    sketch = LatencySketch()
+    for sample in range(1, 1001):
+        sketch.add(sample / 1000)
+
+    assert sketch.quantile(0.50) == pytest.approx(0.5, rel=0.05)
+    assert sketch.quantile(0.95) == pytest.approx(0.95, rel=0.05)
+    assert sketch.quantile(0.99) == pytest.approx(0.99, rel=0.05)
+    assert LatencySketch().quantile(0.5) is None
+
+
+def test_latency_sketch_memory_is_bounded_by_decay() -> None:
+    sketch = LatencySketch()
+    for _ in range(10_000):
+        sketch.add(0.15)
+
+    assert sketch.count < LatencySketch._DECAY_AT
+    assert sketch.quantile(0.99) == pytest.approx(0.15, rel=0.05)
+
+
+def test_rolling_counter_forgets_expired_buckets() -> None:
+    counter = RollingCounter(bucket_seconds=10, bucket_count=6)
+    counter.add("success", now=0)
+    counter.add("timeout", now=15)
+
+    assert counter.totals(now=30) == {"success": 1, "timeout": 1}
+    assert counter.totals(now=65) == {"timeout": 1}
+    assert counter.totals(now=200) == {}
+
+
+def test_windowed_success_rates_and_error_classes() -> None:
+    telemetry = ConnectionTelemetry()
+    telemetry.record_success(0.2, now=0)
+    telemetry.record_failure("timeout", now=100)
+    telemetry.record_failure("connect", now=110)
+    telemetry.record_success(0.3, now=120)
+
+    summary = telemetry.summary(now=120)
+
+    assert summary["success_rate_1m"] == pytest.approx(100 / 3)
+    assert summary["success_rate_15m"] == 50
+    assert summary["errors_15m"]["timeout"] == 1
+    assert summary["errors_15m"]["connect"] == 1
+    assert telemetry.summary(now=120 + 3600)["success_rate_15m"] is None
+    assert telemetry.summary(now=120 + 3600)["errors_total"]["timeout"] == 1
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (asyncio.TimeoutError(), "timeout"),
+        (aiohttp.ServerDisconnectedError(), "connect"),
+        (aiohttp.ClientResponseError(None, (), status=503), "http_5xx"),
+        (json.JSONDecodeError("bad", "{", 0), "decode"),
+        (ValueError("Expected dict"), "decode"),
+        (RuntimeError("boom"), "other"),
+    ],
+)
+def test_classify_error(error: Exception, expected: str) -> None:
+    assert classify_error(error) == expected
+
+
+def test_adaptive_timeout_tracks_latency_within_bounds() -> None:
+    estimator = AdaptiveTimeout(floor=3, ceiling=20)
+    assert estimator.timeout == 20
+
+    for _ in range(20):
+        estimator.record_success(0.15)
+    assert estimator.timeout == 3
+
+    for _ in range(20):
+        estimator.record_success(4.0 if _ % 2 else 0.2)
+    assert 3 < estimator.timeout <= 20
+
+
+def test_adaptive_timeout_backs_off_on_timeouts_and_reports_rate() -> None:
+    estimator = AdaptiveTimeout(floor=0.1, ceiling=20)
+    for _ in range(10):
+        estimator.record_success(0.5)
+    base = estimator.timeout
+
+    estimator.record_timeout()
+    assert estimator.timeout == pytest.approx(min(base * 2, 20))
+    estimator.record_success(0.5)
+    assert estimator.timeout < base * 2
+    assert estimator.timeout_rate == pytest.approx(100 / 12)
+
+
+def test_adaptive_timeout_round_trips_persisted_state() -> None:
+    estimator = AdaptiveTimeout(floor=3, ceiling=20)
+    assert estimator.as_dict() is None
+    estimator.record_success(2.0)
+
+    restored = AdaptiveTimeout(floor=3, ceiling=20)
+    restored.restore(estimator.as_dict())
+    assert restored.timeout == estimator.timeout
+
+    restored.restore({"srtt": "bad"})
+    assert restored.timeout == 20
@@ -1,6 +1,10 @@
 """Unit tests for Eveus utility helpers."""
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
+import pytest
 from homeassistant.core import State
 
 from custom_components.eveus import utils
@@ -40,6 +44,25 @@ def test_get_safe_value_reads_state_dict_and_raw_values() -> None:
     assert utils.get_safe_value({"bad": "x"}, "bad", int, default=-1) == -1
 
 
+def test_diff_payload_keys_reports_changed_added_and_removed_keys() -> None:
+    previous = {"powerMeas": 7200, "state": 4, "vBat": 3.1}
+    current = {"powerMeas": 7100, "state": 4, "IEM2": 1.5}
+
+    assert utils.diff_payload_keys(previous, current) == {"powerMeas", "vBat", "IEM2"}
+    assert utils.diff_payload_keys(None, current) is None
+
+
+@pytest.mark.parametrize("decoder", [utils.STDLIB_DECODER, utils.ORJSON_DECODER])
+def test_payload_decoders_parse_fixture_bytes_identically(
+    decoder: utils.PayloadDecoder,
+) -> None:
+    body = (Path(__file__).parent / "fixtures" / "main_charging.json").read_bytes()
+
+    assert decoder.loads(body) == json.loads(body.decode())
+    with pytest.raises(json.JSONDecodeError):
+        decoder.loads(b"{not-json")
+
+
 def test_get_device_info_is_backward_compatible_for_first_device() -> None:
     info = utils.get_device_info(
         "192.168.1.50",